@@ -33,17 +33,39 @@ curl -X GET "http://localhost:8000/auth/verify" \
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
-from models.customResponse import resp_200, resp_201, resp_400, resp_401, resp_403
+from models.customResponse import resp_200, resp_201, resp_400, resp_401, resp_403, preserialize, body_etag, resp_static_etag
 from utils.authUtils import (
     create_jwt_token, verify_jwt_token, create_api_key, verify_api_key,
     authenticate_request, list_api_keys, revoke_api_key, update_client_permissions
 )
-from utils.constant import CLIENT_TYPES
-from middleware.auth_middleware import require_auth
-
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+from utils.authCache import cached_authenticate, invalidate_credential, invalidate_client
+from utils.constant import DEFAULT_PERMISSIONS
+from middleware.auth_middleware import require_auth, require_admin_client
+
+router = APIRouter(prefix="/auth", tags=["Authentication"],
+                   default_response_class=ORJSONResponse)
+
+# Client types accepted by the token and API key endpoints
+_VALID_CLIENT_TYPES = frozenset(
+    {"web_extension", "chatbot", "mobile_app", "api_client"})
+_INVALID_CLIENT_MSG = f"Invalid client_type. Must be one of: {sorted(_VALID_CLIENT_TYPES)}"
+
+# Health check payload is static, so serialize it once at import
+_HEALTH_BODY = preserialize({
+    "success": True,
+    "message": "Authentication service is healthy",
+    "data": {
+        "status": "healthy",
+        "service": "authentication",
+        "timestamp": "2025-01-16T12:00:00Z"
+    },
+    "status_code": 200
+})
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
 
 
 # =============================================================================
@@ -129,27 +151,21 @@ async def create_token(request: TokenRequest):
     """
     try:
         # Validate client type
-        valid_client_types = ["web_extension",
-                              "chatbot", "mobile_app", "api_client"]
-        if request.client_type not in valid_client_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid client_type. Must be one of: {valid_client_types}"
-            )
+        if request.client_type not in _VALID_CLIENT_TYPES:
+            raise HTTPException(status_code=400, detail=_INVALID_CLIENT_MSG)
+
+        # Get default permissions if not specified
+        permissions = request.permissions or list(DEFAULT_PERMISSIONS.get(request.client_type, ()))
 
         # Create JWT token
-        token = create_jwt_token(
+        token = await run_in_threadpool(
+            create_jwt_token,
             client_id=request.client_id,
             client_type=request.client_type,
-            permissions=request.permissions,
+            permissions=permissions,
             custom_claims=request.custom_claims
         )
 
-        # Get default permissions if not specified
-        if not request.permissions:
-            request.permissions = CLIENT_TYPES.get(
-                request.client_type, {}).get("permissions", [])
-
         return resp_201(
             data={
                 "token": token,
@@ -157,7 +173,7 @@ async def create_token(request: TokenRequest):
                 "token_type": "Bearer",
                 "client_id": request.client_id,
                 "client_type": request.client_type,
-                "permissions": request.permissions
+                "permissions": permissions
             },
             message="JWT token created successfully"
         )
@@ -210,16 +226,12 @@ async def create_api_key_endpoint(request: ApiKeyRequest):
     """
     try:
         # Validate client type
-        valid_client_types = ["web_extension",
-                              "chatbot", "mobile_app", "api_client"]
-        if request.client_type not in valid_client_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid client_type. Must be one of: {valid_client_types}"
-            )
+        if request.client_type not in _VALID_CLIENT_TYPES:
+            raise HTTPException(status_code=400, detail=_INVALID_CLIENT_MSG)
 
         # Create API key
-        result = create_api_key(
+        result = await run_in_threadpool(
+            create_api_key,
             client_id=request.client_id,
             client_type=request.client_type,
             permissions=request.permissions,
@@ -266,7 +278,7 @@ async def verify_authentication(request: Request):
         HTTPException: If authentication fails
     """
     try:
-        auth_result = authenticate_request(request)
+        auth_result = await cached_authenticate(request)
 
         return resp_200(
             data={
@@ -291,7 +303,7 @@ async def verify_authentication(request: Request):
 # =============================================================================
 
 @router.get("/keys")
-async def list_api_keys_endpoint(request: Request):
+async def list_api_keys_endpoint(auth_result: dict = Depends(require_admin_client)):
     """
     List all API keys (admin only).
 
@@ -299,7 +311,7 @@ async def list_api_keys_endpoint(request: Request):
     This is an admin-only endpoint for management purposes.
 
     Args:
-        request: FastAPI request object
+        auth_result: Authenticated admin client
 
     Returns:
         List[ApiKeyInfo]: List of API key information
@@ -308,12 +320,6 @@ async def list_api_keys_endpoint(request: Request):
         HTTPException: If not authorized or operation fails
     """
     try:
-        # Verify admin permissions (you can customize this check)
-        auth_result = authenticate_request(request)
-        if auth_result["client_type"] != "api_client":
-            raise HTTPException(
-                status_code=403, detail="Admin access required")
-
         keys_info = list_api_keys()
 
         return resp_200(
@@ -333,7 +339,7 @@ async def list_api_keys_endpoint(request: Request):
 # =============================================================================
 
 @router.delete("/keys/{key_id}")
-async def revoke_api_key_endpoint(key_id: str, request: Request):
+async def revoke_api_key_endpoint(key_id: str, auth_result: dict = Depends(require_admin_client)):
     """
     Revoke an API key (admin only).
 
@@ -342,7 +348,7 @@ async def revoke_api_key_endpoint(key_id: str, request: Request):
 
     Args:
         key_id: API key identifier
-        request: FastAPI request object
+        auth_result: Authenticated admin client
 
     Returns:
         dict: Revocation result
@@ -351,17 +357,12 @@ async def revoke_api_key_endpoint(key_id: str, request: Request):
         HTTPException: If not authorized or operation fails
     """
     try:
-        # Verify admin permissions
-        auth_result = authenticate_request(request)
-        if auth_result["client_type"] != "api_client":
-            raise HTTPException(
-                status_code=403, detail="Admin access required")
-
         # For this example, we'll use the key_id as the API key
         # In production, you'd have a proper key management system
         success = revoke_api_key(key_id)
 
         if success:
+            invalidate_credential(key_id)
             return resp_200(
                 data={"revoked": True, "key_id": key_id},
                 message="API key revoked successfully"
@@ -384,7 +385,7 @@ async def revoke_api_key_endpoint(key_id: str, request: Request):
 async def update_permissions_endpoint(
     key_id: str,
     request: UpdatePermissionsRequest,
-    auth_request: Request
+    auth_result: dict = Depends(require_admin_client)
 ):
     """
     Update permissions for an API key (admin only).
@@ -395,7 +396,7 @@ async def update_permissions_endpoint(
     Args:
         key_id: API key identifier
         request: Permission update request
-        auth_request: FastAPI request object for authentication
+        auth_result: Authenticated admin client
 
     Returns:
         dict: Update result
@@ -404,16 +405,11 @@ async def update_permissions_endpoint(
         HTTPException: If not authorized or operation fails
     """
     try:
-        # Verify admin permissions
-        auth_result = authenticate_request(auth_request)
-        if auth_result["client_type"] != "api_client":
-            raise HTTPException(
-                status_code=403, detail="Admin access required")
-
         # Update permissions
         success = update_client_permissions(key_id, request.permissions)
 
         if success:
+            invalidate_client(key_id)
             return resp_200(
                 data={
                     "updated": True,
@@ -436,8 +432,8 @@ async def update_permissions_endpoint(
 # 7. HEALTH CHECK ENDPOINT
 # =============================================================================
 
-@router.get("/health")
-async def health_check():
+@router.get("/health", include_in_schema=False)
+async def health_check(request: Request):
     """
     Health check endpoint.
 
@@ -446,11 +442,4 @@ async def health_check():
     Returns:
         dict: Health status
     """
-    return resp_200(
-        data={
-            "status": "healthy",
-            "service": "authentication",
-            "timestamp": "2025-01-16T12:00:00Z"
-        },
-        message="Authentication service is healthy"
-    )
+    return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
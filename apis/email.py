@@ -8,27 +8,40 @@ ENDPOINTS:
 ------
 1. GET /email/ - Email API health check
 2. POST /email/v1/analyze - Analyze email for scam detection (v1)
-3. POST /email/v1/translate - Translate email analysis to different language (v1)
-4. POST /email/v2/analyze - Analyze email for scam detection (v2 - SEA-LION v4)
+3. POST /email/v1/analyze/batch - Analyze several emails in one request (v1)
+4. POST /email/check-url, /email/check-email, /email/check-phone - Checker endpoints
+5. POST /email/v2/analyze - Analyze email for scam detection (v2 - SEA-LION v4)
 """
 
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File
+from fastapi import APIRouter, Request, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
-from setting import Setting
-import json
-import base64
+from setting import get_settings
+import asyncio
+import logging
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Annotated, Awaitable, Callable, Tuple
+import msgspec
 
-from models.customResponse import resp_200
-from utils.emailUtils import detect_language, analyze_email, translate_analysis, extract_signals, analyze_email_comprehensive, analyze_email_comprehensive_v2, analyze_email_comprehensive_sagemaker
-from utils.dynamodbUtils import save_detection_result, find_result_by_hash
-import hashlib
-from utils.checkerUtils import check_url_phishing, check_email_validity, check_phone_number_validity, extract_urls_from_text, extract_emails_from_text, extract_phone_numbers_from_text, check_all_content, format_checker_results_for_llm
+from models.customResponse import resp_200, preserialize, body_etag, resp_static_etag
+from utils.bodyUtils import msgspec_body, msgspec_openapi_body
+from utils.singleflightUtils import run_singleflight
+from utils.constant import MAX_REQUEST_BODY_BYTES
+from utils.emailUtils import extract_signals, analyze_email_comprehensive, analyze_email_comprehensive_sagemaker, merge_additional_phone_checks
+from utils.dynamodbUtils import save_detection_result, find_result_by_hash, find_results_by_hashes
+import xxhash
+from utils.hashUtils import normalize_hash_text
+from utils.checkerUtils import check_url_phishing, check_all_content_async, acheck_email_validity, acheck_phone_number_validity, format_checker_results_for_llm
 
-config = Setting()
+config = get_settings()
 
-router = APIRouter(prefix="/email", tags=["Email Analysis"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/email", tags=["Email Analysis"],
+                   default_response_class=ORJSONResponse)
+
+# Maximum number of emails accepted by the batch analyze endpoint
+MAX_EMAIL_BATCH_SIZE = 20
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -36,19 +49,107 @@ router = APIRouter(prefix="/email", tags=["Email Analysis"])
 
 def create_email_content_hash(subject: str, content: str, from_email: str) -> str:
     """Create unique hash for email content to enable deduplication."""
-    # Normalize text for consistent hashing
-    def normalize_text(text):
-        if not text:
-            return ""
-        return text.strip().lower()
+    # Dedup cache key only, not a security boundary: xxh3 is far cheaper than
+    # SHA-256 on long bodies and its 64-bit hexdigest keeps the 16-char key length.
+    # Feeding the fields incrementally gives the same digest as hashing
+    # "email:{subject}|{content}|{from_email}" without building that string.
+    hasher = xxhash.xxh3_64(b"email:")
+    hasher.update(normalize_hash_text(subject))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(content))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(from_email))
+    return hasher.hexdigest()
+
+
+def email_analysis_response_data(analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a stored or fresh comprehensive analysis onto the email analysis response fields."""
+    return {
+        "risk_level": analysis_result.get("risk_level"),
+        "reasons": analysis_result.get("analysis"),  # Map 'analysis' to 'reasons'
+        "recommended_action": analysis_result.get("recommended_action"),
+        "detected_language": analysis_result.get("detected_language")
+    }
+
+
+async def save_email_detection_result(content_hash: str, analysis_result: Dict[str, Any], target_language: str) -> None:
+    """Save email detection result to DynamoDB and log the outcome (runs as a background task)."""
+    logger.debug("Saving email analysis to DynamoDB, content hash: %s", content_hash)
+    detection_id = await save_detection_result(
+        content_type="email",
+        content_hash=content_hash,
+        analysis_result=analysis_result,
+        target_language=target_language
+    )
+
+    # Verify save was successful
+    if not detection_id or detection_id.startswith('temp_'):
+        logger.error("Failed to save email analysis to DynamoDB, got ID: %s, content hash: %s",
+                     detection_id, content_hash)
+    else:
+        logger.debug("Saved email analysis to DynamoDB with ID: %s", detection_id)
+
+
+async def run_email_analysis(subject: str, content: str, from_email: str, reply_to_email: Optional[str],
+                             target_language: str,
+                             analyze: Callable[..., Awaitable[Dict[str, Any]]] = analyze_email_comprehensive) -> Dict[str, Any]:
+    """Run signal extraction, checkers and LLM analysis for an email with no cached result."""
+    # [Step 1.2 + 1.5] Extract auxiliary signals in a worker thread while URLs, emails,
+    # and phone numbers in the content are checked
+    reply_to = reply_to_email or ""
+    signals, checker_results = await asyncio.gather(
+        asyncio.to_thread(extract_signals, title=subject, content=content,
+                          from_email=from_email, reply_to_email=reply_to),
+        check_all_content_async(f"{subject} {content}", from_email, reply_to)
+    )
     
-    subject_norm = normalize_text(subject)
-    content_norm = normalize_text(content)
-    from_email_norm = normalize_text(from_email)
+    # [Step 1.6] Check additional phone numbers found by email signal extraction
+    await merge_additional_phone_checks(checker_results, signals.get('artifacts', {}).get('phone_numbers', []))
     
-    hash_input = f"email:{subject_norm}|{content_norm}|{from_email_norm}"
-    hash_object = hashlib.sha256(hash_input.encode('utf-8'))
-    return hash_object.hexdigest()[:16]
+    # [Step 1.7] Format checker analysis for LLM
+    checker_analysis = format_checker_results_for_llm(checker_results)
+    
+    # Add checker results to signals for LLM analysis
+    if checker_analysis:
+        signals['checker_analysis'] = checker_analysis
+
+    # [Step 2] Perform comprehensive analysis with single LLM call
+    # This combines: language detection + analysis + target language output
+    return await analyze(
+        subject=subject,
+        content=content, 
+        from_email=from_email,
+        reply_to_email=reply_to,
+        target_language=target_language,
+        signals=signals
+    )
+
+
+def existing_email_result(existing_analysis: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return the stored analysis result if the document is a usable email detection."""
+    if existing_analysis and existing_analysis.get('content_type') == 'email':
+        return existing_analysis.get('analysis_result') or None
+    return None
+
+
+async def find_or_run_analysis(content_hash: str, key: str,
+                               analysis_factory: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+    """
+    Return a stored analysis for content_hash, or run a new one.
+
+    The analysis only starts after the DynamoDB lookup misses, so a slow lookup
+    adds its latency to a cache miss but never pays for an LLM call whose
+    result is thrown away when the lookup then hits.
+
+    Returns:
+        tuple: (analysis result, whether this request ran a new analysis and must save it;
+        False for stored results and for requests that joined another request's run)
+    """
+    existing_result = existing_email_result(await find_result_by_hash(content_hash))
+    if existing_result:
+        return existing_result, False
+    return await run_singleflight(key, analysis_factory)
+
 
 # =============================================================================
 # 1. HEALTH CHECK ENDPOINT
@@ -59,19 +160,14 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status")
 
 
-@router.get("/", response_model=HealthResponse)
-async def healthcheck():
-    return {"status": "OK"}
+# Health check payload is static, so serialize it once at import
+_HEALTH_BODY = preserialize({"status": "OK"})
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
 
-@router.options("/")
-async def options_healthcheck():
-    """Handle OPTIONS requests for CORS preflight"""
-    return {"status": "OK"}
 
-@router.options("/v1/analyze")
-async def options_analyze():
-    """Handle OPTIONS requests for CORS preflight"""
-    return {"status": "OK"}
+@router.get("/", response_model=HealthResponse, include_in_schema=False)
+async def healthcheck(request: Request):
+    return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
 
 # =============================================================================
 # 2. EMAIL ANALYSIS ENDPOINT
@@ -87,14 +183,15 @@ class EmailAnalysis(BaseModel):
     detected_language: str = Field(..., description="ISO-639-1 code of detected email language")
 
 
-class EmailAnalysisRequest(BaseModel):
-    subject: str = Field(..., description="Email subject line")
-    content: str = Field(..., description="Email content/body")
-    from_email: str = Field(..., description="Sender email address")
-    target_language: str = Field(
-        ..., description="Target language for analysis (en, zh, ms, th, vi)")
-    reply_to_email: Optional[str] = Field(
-        None, description="Reply-to email address")
+# Decoded with msgspec rather than Pydantic to keep validation off the hot path
+class EmailAnalysisRequest(msgspec.Struct):
+    subject: Annotated[str, msgspec.Meta(description="Email subject line")]
+    content: Annotated[str, msgspec.Meta(description="Email content/body")]
+    from_email: Annotated[str, msgspec.Meta(description="Sender email address")]
+    target_language: Annotated[str, msgspec.Meta(
+        description="Target language for analysis (en, zh, ms, th, vi)")]
+    reply_to_email: Annotated[Optional[str], msgspec.Meta(
+        description="Reply-to email address")] = None
 
 
 class EmailAnalysisResponse(BaseModel):
@@ -129,210 +226,135 @@ Analyze email content for potential scam indicators using AI.
 @router.post("/v1/analyze",
              summary=analyze_v1_summary,
              description=analyze_v1_description,
-             response_model=EmailAnalysisResponse,
-             response_description="Email analysis results with risk assessment")
-async def detect_v1(request: EmailAnalysisRequest):
-    # [Step 0] Read values from the request body
-    try:
-        subject = request.subject
-        content = request.content
-        from_email = request.from_email
-        target_language = request.target_language
-        reply_to_email = request.reply_to_email
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Extract auxiliary signals to support the analysis
-    signals = extract_signals(title=subject, content=content,
-                              from_email=from_email, reply_to_email=reply_to_email or "")
-    
-    # [Step 1.5] Check URLs, emails, and phone numbers in the content
-    full_content = f"{subject} {content}"
-    checker_results = check_all_content(full_content, from_email, reply_to_email or "")
-    
-    # [Step 1.6] Check additional phone numbers found by email signal extraction
-    email_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if email_phones:
-        # Validate any phone numbers found by email extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in email_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
-    
-    # [Step 1.7] Format checker analysis for LLM
-    checker_analysis = format_checker_results_for_llm(checker_results)
-    
-    # Add checker results to signals for LLM analysis
-    if checker_analysis:
-        signals['checker_analysis'] = checker_analysis
+             responses={200: {"model": EmailAnalysisResponse}},
+             response_description="Email analysis results with risk assessment",
+             openapi_extra=msgspec_openapi_body(EmailAnalysisRequest))
+async def detect_v1(background_tasks: BackgroundTasks,
+                    request: EmailAnalysisRequest = msgspec_body(EmailAnalysisRequest)):
+    # [Step 0] Read values from the request body (already validated on decode)
+    subject = request.subject
+    content = request.content
+    from_email = request.from_email
+    target_language = request.target_language
+    reply_to_email = request.reply_to_email
+
+    # [Step 1] Create unique content hash
+    content_hash = create_email_content_hash(subject, content, from_email)
 
-    # [Step 2] Perform comprehensive analysis with single LLM call
-    # This combines: language detection + analysis + target language output
-    comprehensive_analysis = await analyze_email_comprehensive(
-        subject=subject,
-        content=content, 
-        from_email=from_email,
-        reply_to_email=reply_to_email or "",
-        target_language=target_language,
-        signals=signals
+    # [Step 1.1 - 2] Reuse an existing analysis, or run signal extraction, checkers and the
+    # comprehensive LLM analysis (joining an identical analysis already in flight)
+    comprehensive_analysis, needs_save = await find_or_run_analysis(
+        content_hash,
+        f"v1:{content_hash}:{target_language}",
+        lambda: run_email_analysis(
+            subject=subject,
+            content=content,
+            from_email=from_email,
+            reply_to_email=reply_to_email,
+            target_language=target_language
+        )
     )
-    
-    # Extract detected language and prepare analysis structure for database
-    base_language = comprehensive_analysis["detected_language"]
-    analysis = {
-        target_language: {
-            "risk_level": comprehensive_analysis["risk_level"],
-            "analysis": comprehensive_analysis["analysis"], 
-            "recommended_action": comprehensive_analysis["recommended_action"]
-        }
-    }
-
-    # [Step 4] Create unique content hash for reusability
-    content_hash = create_email_content_hash(subject, content, from_email)
 
-    # [Step 4.5] Check if we already have analysis for this content
-    existing_analysis = await find_result_by_hash(content_hash)
-    if existing_analysis and existing_analysis.get('content_type') == 'email':
-        # Return existing analysis if available and matches target language
-        existing_result = existing_analysis.get('analysis_result', {})
-        if existing_result:
-            return resp_200(
-                data={
-                    "risk_level": existing_result.get("risk_level"),
-                    "reasons": existing_result.get("analysis"),  # Map 'analysis' to 'reasons'
-                    "recommended_action": existing_result.get("recommended_action"),
-                    "detected_language": existing_result.get("detected_language")
-                }
-            )
+    if not needs_save:
+        return resp_200(data=email_analysis_response_data(comprehensive_analysis))
 
-    # [Step 5] Save detection result to DynamoDB (only LLM analysis, no email content)
-    detection_id = await save_detection_result(
-        content_type="email",
+    # [Step 5] Save detection result to DynamoDB after responding (only LLM analysis, no email content)
+    background_tasks.add_task(
+        save_email_detection_result,
         content_hash=content_hash,
         analysis_result=comprehensive_analysis,
         target_language=target_language
     )
 
     # [Step 5] Respond analysis in "target language" to user  
-    return resp_200(
-        data={
-            "risk_level": comprehensive_analysis["risk_level"],
-            "reasons": comprehensive_analysis["analysis"],  # Map 'analysis' to 'reasons'
-            "recommended_action": comprehensive_analysis["recommended_action"],
-            "detected_language": comprehensive_analysis["detected_language"]
-        }
-    )
-
-# =============================================================================
-# 3. EMAIL TRANSLATION ENDPOINT
-# =============================================================================
+    return resp_200(data=email_analysis_response_data(comprehensive_analysis))
 
+# V1 Batch analyze endpoint
+analyze_batch_v1_summary = "Analyze Multiple Emails for Scam Detection (v1)"
 
-class EmailTranslationRequest(BaseModel):
-    email_id: str = Field(..., description="Email analysis ID")
-    target_language: str = Field(
-        ..., description="Target language for translation (en, zh, ms, th, vi)")
-
-
-class EmailTranslationResponse(BaseModel):
-    success: bool = Field(...,
-                          description="Whether the request was successful")
-    message: str = Field(..., description="Response message")
-    data: EmailAnalysis = Field(
-        ..., description="Analysis results including risk level, reasons, and recommended action")
-    timestamp: str = Field(..., description="Response timestamp")
-    status_code: int = Field(..., description="HTTP status code")
-
-
-# V1 Translate endpoint
-translate_v1_summary = "Translate Email Analysis (v1)"
-
-translate_v1_description = """
-Translate email analysis results to different languages.
+analyze_batch_v1_description = f"""
+Analyze up to {MAX_EMAIL_BATCH_SIZE} emails in a single request, e.g. when scanning an inbox.
 
 **Features:**
-- Multi-language translation support
-- Preserves original analysis accuracy
-- Maintains risk assessment integrity
-
-**Supported Languages:**
-- English (en)
-- Chinese (zh)
-- Malay (ms)
-- Thai (th)
-- Vietnamese (vi)
-"""
+- One concurrent round of cache lookups for the whole batch
+- Identical emails with the same target language are analyzed only once
+- Cache misses are analyzed concurrently
 
+**Returns:**
+- One analysis result per email, in request order
+"""
 
-# Translation endpoint temporarily disabled during DynamoDB migration
-# @router.post("/v1/translate",
-#              summary=translate_v1_summary, 
-#              description=translate_v1_description,
-#              response_model=EmailTranslationResponse,
-#              response_description="Translated email analysis results")
-# async def translate_v1(request: EmailTranslationRequest):
-#     # [Step 0] Read values from the request body
-#     try:
-#         email_id = request.email_id
-#         target_language = request.target_language
-# 
-#     except Exception as e:
-#         raise HTTPException(status_code=400, detail="Invalid request body")
-# 
-#     # [Step 1] Get base_language_analysis from database
-#     document = await retrieve_analysis_from_db(email_id, "email")
-#     if not document:
-#         raise HTTPException(
-#             status_code=404, detail="Email analysis not found in database")
-# 
-#     base_language = document.get('base_language')
-#     base_language_analysis = document.get('analysis').get(base_language)
-# 
-#     # [Step 2] Perform translation
-#     target_language_analysis = await translate_analysis(base_language_analysis, base_language, target_language)
-# 
-#     # [Step 3] Store target_language_analysis into database
-#     await update_analysis_in_db(email_id, target_language, target_language_analysis, "email")
-# 
-#     # [Step 4] Respond analysis in "target language" to user
-#     return resp_200(
-#         data={
-#             "risk_level": target_language_analysis["risk_level"],
-#             "reasons": target_language_analysis["analysis"],  # Map 'analysis' to 'reasons'
-#             "recommended_action": target_language_analysis["recommended_action"]
-#         }
-#     )
 
+@router.post("/v1/analyze/batch",
+             summary=analyze_batch_v1_summary,
+             description=analyze_batch_v1_description,
+             response_description="Email analysis results in request order",
+             openapi_extra=msgspec_openapi_body(List[EmailAnalysisRequest]))
+async def detect_batch_v1(background_tasks: BackgroundTasks,
+                          requests: List[EmailAnalysisRequest] = msgspec_body(
+                              List[EmailAnalysisRequest], max_bytes=MAX_REQUEST_BODY_BYTES * MAX_EMAIL_BATCH_SIZE)):
+    # [Step 0] Validate batch size
+    if not requests or len(requests) > MAX_EMAIL_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400, detail=f"Batch must contain between 1 and {MAX_EMAIL_BATCH_SIZE} emails")
+
+    # [Step 1] Create content hashes and look up previous analyses for all of them at once
+    content_hashes = [create_email_content_hash(r.subject, r.content, r.from_email) for r in requests]
+    existing_by_hash = await find_results_by_hashes(content_hashes)
+
+    # [Step 1.1] Reuse existing analyses; keep one request per distinct cache miss. The
+    # analysis is written in the target language, so misses are keyed on both
+    analysis_keys = [(content_hash, r.target_language) for content_hash, r in zip(content_hashes, requests)]
+    analysis_by_key = {}
+    misses = {}
+    for analysis_key, email in zip(analysis_keys, requests):
+        existing_result = existing_email_result(existing_by_hash.get(analysis_key[0]))
+        if existing_result:
+            analysis_by_key[analysis_key] = existing_result
+        else:
+            misses.setdefault(analysis_key, email)
+
+    # [Step 2] Extract signals and run checker + LLM analysis for the misses concurrently
+    new_analyses = await asyncio.gather(*(
+        run_singleflight(
+            f"v1:{content_hash}:{target_language}",
+            lambda email=email: run_email_analysis(
+                subject=email.subject,
+                content=email.content,
+                from_email=email.from_email,
+                reply_to_email=email.reply_to_email,
+                target_language=email.target_language
+            )
+        )
+        for (content_hash, target_language), email in misses.items()
+    ))
+
+    # [Step 3] Save new detection results to DynamoDB after responding; analyses joined
+    # from another request are saved by that request
+    for analysis_key, (comprehensive_analysis, is_owner) in zip(misses, new_analyses):
+        analysis_by_key[analysis_key] = comprehensive_analysis
+        if not is_owner:
+            continue
+        content_hash, target_language = analysis_key
+        background_tasks.add_task(
+            save_email_detection_result,
+            content_hash=content_hash,
+            analysis_result=comprehensive_analysis,
+            target_language=target_language
+        )
+
+    # [Step 4] Respond with one analysis per email in request order
+    return resp_200(
+        data=[email_analysis_response_data(analysis_by_key[analysis_key]) for analysis_key in analysis_keys]
+    )
 
 # =============================================================================
-# 4. CHECKER ENDPOINTS
+# 3. CHECKER ENDPOINTS
 # =============================================================================
 
-class URLCheckRequest(BaseModel):
-    url: str = Field(..., description="URL to check for phishing")
+# Checker request bodies are decoded with msgspec like EmailAnalysisRequest
+class URLCheckRequest(msgspec.Struct):
+    url: Annotated[str, msgspec.Meta(description="URL to check for phishing")]
 
 class URLCheckResponse(BaseModel):
     success: bool = Field(..., description="Whether the request was successful")
@@ -344,16 +366,17 @@ class URLCheckResponse(BaseModel):
 @router.post("/check-url",
              summary="Check URL for Phishing",
              description="Check if a URL is a phishing site using PhishTank database",
-             response_model=URLCheckResponse)
-async def check_url(request: URLCheckRequest):
+             response_model=URLCheckResponse,
+             openapi_extra=msgspec_openapi_body(URLCheckRequest))
+async def check_url(request: URLCheckRequest = msgspec_body(URLCheckRequest)):
     try:
-        result = check_url_phishing(request.url)
+        result = await asyncio.to_thread(check_url_phishing, request.url)
         return resp_200(data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-class EmailCheckRequest(BaseModel):
-    email: str = Field(..., description="Email address to validate")
+class EmailCheckRequest(msgspec.Struct):
+    email: Annotated[str, msgspec.Meta(description="Email address to validate")]
 
 class EmailCheckResponse(BaseModel):
     success: bool = Field(..., description="Whether the request was successful")
@@ -365,16 +388,17 @@ class EmailCheckResponse(BaseModel):
 @router.post("/check-email",
              summary="Validate Email Address",
              description="Validate email address using external validation service",
-             response_model=EmailCheckResponse)
-async def check_email(request: EmailCheckRequest):
+             response_model=EmailCheckResponse,
+             openapi_extra=msgspec_openapi_body(EmailCheckRequest))
+async def check_email(request: EmailCheckRequest = msgspec_body(EmailCheckRequest)):
     try:
-        result = check_email_validity(request.email)
+        result = await acheck_email_validity(request.email)
         return resp_200(data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-class PhoneCheckRequest(BaseModel):
-    phone: str = Field(..., description="Phone number to validate")
+class PhoneCheckRequest(msgspec.Struct):
+    phone: Annotated[str, msgspec.Meta(description="Phone number to validate")]
 
 class PhoneCheckResponse(BaseModel):
     success: bool = Field(..., description="Whether the request was successful")
@@ -386,17 +410,18 @@ class PhoneCheckResponse(BaseModel):
 @router.post("/check-phone",
              summary="Validate Phone Number",
              description="Validate phone number using external validation service",
-             response_model=PhoneCheckResponse)
-async def check_phone(request: PhoneCheckRequest):
+             response_model=PhoneCheckResponse,
+             openapi_extra=msgspec_openapi_body(PhoneCheckRequest))
+async def check_phone(request: PhoneCheckRequest = msgspec_body(PhoneCheckRequest)):
     try:
-        result = check_phone_number_validity(request.phone)
+        result = await acheck_phone_number_validity(request.phone)
         return resp_200(data=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # =============================================================================
-# 5. EMAIL V2 ANALYSIS ENDPOINT (SEA-LION V4)
+# 4. EMAIL V2 ANALYSIS ENDPOINT (SEA-LION V4)
 # =============================================================================
 
 # V2 Analyze endpoint with SageMaker SEA-LION v4
@@ -425,138 +450,54 @@ Analyze email content for potential scam indicators using AI with SageMaker-host
 @router.post("/v2/analyze",
              summary=analyze_v2_summary,
              description=analyze_v2_description,
-             response_model=EmailAnalysisResponse,
-             response_description="Email analysis results with risk assessment using SageMaker SEA-LION v4")
-async def analyze_email_v2(request: EmailAnalysisRequest):
+             responses={200: {"model": EmailAnalysisResponse}},
+             response_description="Email analysis results with risk assessment using SageMaker SEA-LION v4",
+             openapi_extra=msgspec_openapi_body(EmailAnalysisRequest))
+async def analyze_email_v2(background_tasks: BackgroundTasks,
+                           request: EmailAnalysisRequest = msgspec_body(EmailAnalysisRequest)):
     """
     V2 Email analysis endpoint using SageMaker-hosted SEA-LION v4 model.
     
     This endpoint uses the SageMaker-hosted SEA-LION v4 model for improved 
     performance, reliability, and cost-effectiveness compared to the Sea Lion API.
     """
-    # [Step 0] Read values from the request body
-    try:
-        subject = request.subject
-        content = request.content
-        from_email = request.from_email
-        target_language = request.target_language
-        reply_to_email = request.reply_to_email
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Extract auxiliary signals to support the analysis
-    signals = extract_signals(title=subject, content=content,
-                              from_email=from_email, reply_to_email=reply_to_email or "")
-    
-    # [Step 1.5] Check URLs, emails, and phone numbers in the content
-    full_content = f"{subject} {content}"
-    checker_results = check_all_content(full_content, from_email, reply_to_email or "")
-    
-    # [Step 1.6] Check additional phone numbers found by email signal extraction
-    email_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if email_phones:
-        # Validate any phone numbers found by email extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in email_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
-    
-    # [Step 1.7] Format checker analysis for LLM
-    checker_analysis = format_checker_results_for_llm(checker_results)
-    
-    # Add checker results to signals for LLM analysis
-    if checker_analysis:
-        signals['checker_analysis'] = checker_analysis
+    # [Step 0] Read values from the request body (already validated on decode)
+    subject = request.subject
+    content = request.content
+    from_email = request.from_email
+    target_language = request.target_language
+    reply_to_email = request.reply_to_email
+
+    # [Step 1] Create unique content hash
+    content_hash = create_email_content_hash(subject, content, from_email)
 
-    # [Step 2] Perform comprehensive analysis with single SageMaker SeaLion v4 LLM call
-    # This combines: language detection + analysis + target language output
-    comprehensive_analysis = await analyze_email_comprehensive_sagemaker(
-        subject=subject,
-        content=content, 
-        from_email=from_email,
-        reply_to_email=reply_to_email or "",
-        target_language=target_language,
-        signals=signals
+    # [Step 1.1 - 2] Reuse an existing analysis, or run signal extraction, checkers and a single
+    # SageMaker SeaLion v4 LLM call (joining an identical analysis already in flight)
+    comprehensive_analysis, needs_save = await find_or_run_analysis(
+        content_hash,
+        f"v2:{content_hash}:{target_language}",
+        lambda: run_email_analysis(
+            subject=subject,
+            content=content,
+            from_email=from_email,
+            reply_to_email=reply_to_email,
+            target_language=target_language,
+            analyze=analyze_email_comprehensive_sagemaker
+        )
     )
-    
-    # Extract detected language and prepare analysis structure for database
-    base_language = comprehensive_analysis["detected_language"]
-    analysis = {
-        target_language: {
-            "risk_level": comprehensive_analysis["risk_level"],
-            "analysis": comprehensive_analysis["analysis"], 
-            "recommended_action": comprehensive_analysis["recommended_action"]
-        }
-    }
 
-    # [Step 4] Create unique content hash for reusability
-    content_hash = create_email_content_hash(subject, content, from_email)
-
-    # [Step 4.5] Check if we already have analysis for this content
-    existing_analysis = await find_result_by_hash(content_hash)
-    if existing_analysis and existing_analysis.get('content_type') == 'email':
-        # Return existing analysis if available and matches target language
-        existing_result = existing_analysis.get('analysis_result', {})
-        if existing_result:
-            print(f"Returning cached result for content hash: {content_hash}")
-            return resp_200(
-                data={
-                    "risk_level": existing_result.get("risk_level"),
-                    "reasons": existing_result.get("analysis"),  # Map 'analysis' to 'reasons'
-                    "recommended_action": existing_result.get("recommended_action"),
-                    "detected_language": existing_result.get("detected_language")
-                }
-            )
+    if not needs_save:
+        logger.debug("Returning cached result for content hash: %s", content_hash)
+        return resp_200(data=email_analysis_response_data(comprehensive_analysis))
 
-    # [Step 5] Save detection result to DynamoDB (only LLM analysis, no email content)
-    print(f"Attempting to save email analysis to DynamoDB for content hash: {content_hash}")
-    detection_id = await save_detection_result(
-        content_type="email",
+    # [Step 5] Save detection result to DynamoDB after responding (only LLM analysis, no email content)
+    background_tasks.add_task(
+        save_email_detection_result,
         content_hash=content_hash,
         analysis_result=comprehensive_analysis,
         target_language=target_language
     )
-    
-    # [Step 5.1] Verify save was successful before returning response
-    if not detection_id or detection_id.startswith('temp_'):
-        print(f"❌ CRITICAL: Failed to save email analysis to DynamoDB! Got ID: {detection_id}")
-        print(f"Content hash: {content_hash}")
-        print(f"Analysis result: {comprehensive_analysis}")
-        # For now, continue with response (graceful degradation)
-        # In production, you might want to raise an exception here
-    else:
-        print(f"✅ SUCCESS: Saved email analysis to DynamoDB with ID: {detection_id}")
 
     # [Step 6] Respond analysis in "target language" to user  
-    return resp_200(
-        data={
-            "risk_level": comprehensive_analysis["risk_level"],
-            "reasons": comprehensive_analysis["analysis"],  # Map 'analysis' to 'reasons'
-            "recommended_action": comprehensive_analysis["recommended_action"],
-            "detected_language": comprehensive_analysis["detected_language"]
-        }
-    )
+    return resp_200(data=email_analysis_response_data(comprehensive_analysis))
 
@@ -11,18 +11,17 @@ ENDPOINTS:
 3. GET /debug/auth - Debug authentication (development only)
 """
 
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File
-from models.customResponse import resp_200, health_success_response
-from models.clients import get_sea_lion_client
-from utils.authUtils import authenticate_request
-from setting import Setting
-import json
-import base64
+from fastapi import APIRouter, Request, HTTPException
+from fastapi.responses import Response
+from models.customResponse import resp_200, health_success_response, preserialize, resp_static, body_etag, etag_matches, utc_timestamp
+from utils.authCache import cached_authenticate
+from core.event_handlers import is_production
+from setting import get_settings
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Tuple
+import time
 
-config = Setting()
+config = get_settings()
 
 router = APIRouter()
 
@@ -41,41 +40,53 @@ class RootResponse(BaseModel):
     status_code: int = Field(..., description="HTTP status code")
 
 
+# API information is static, so build it once at import
+_ROOT_DATA = {
+    "message": "MAI Scam Detection API",
+    "version": "1.0.0",
+    "description": "API for detecting scams in emails, social media, and websites",
+    "endpoints": {
+        "authentication": "/api/v1/auth",
+        "email_analysis": "/api/v1/email",
+        "social_media_analysis": "/api/v1/socialmedia",
+        "website_analysis": "/api/v1/website",
+        "v2_email_analysis": "/email/v2/analyze",
+        "v2_website_analysis": "/website/v2/analyze"
+    },
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc"
+    },
+    "authentication": {
+        "methods": ["JWT Token", "API Key"],
+        "headers": {
+            "jwt": "Authorization: Bearer <token>",
+            "api_key": "X-API-Key: <api_key>"
+        }
+    }
+}
+
+
+# The root payload only changes with a deploy, so its ETag is fixed per process. It is
+# weak because the response body also carries a per-second timestamp
+_ROOT_ETAG = f"W/{body_etag(preserialize(_ROOT_DATA))}"
+# Clients and CDNs may reuse it for an hour, revalidating with If-None-Match afterwards
+_ROOT_CACHE_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
 @router.get("/", response_model=RootResponse)
-async def root():
+async def root(request: Request):
     """
     Root endpoint providing API information.
 
     Returns:
         dict: API information and available endpoints
     """
-    return resp_200(
-        data={
-            "message": "MAI Scam Detection API",
-            "version": "1.0.0",
-            "description": "API for detecting scams in emails, social media, and websites",
-            "endpoints": {
-                "authentication": "/api/v1/auth",
-                "email_analysis": "/api/v1/email",
-                "social_media_analysis": "/api/v1/socialmedia",
-                "website_analysis": "/api/v1/website",
-                "v2_email_analysis": "/email/v2/analyze",
-                "v2_website_analysis": "/website/v2/analyze"
-            },
-            "documentation": {
-                "swagger": "/docs",
-                "redoc": "/redoc"
-            },
-            "authentication": {
-                "methods": ["JWT Token", "API Key"],
-                "headers": {
-                    "jwt": "Authorization: Bearer <token>",
-                    "api_key": "X-API-Key: <api_key>"
-                }
-            }
-        },
-        message="MAI Scam Detection API is running"
-    )
+    if etag_matches(request.headers.get("if-none-match"), _ROOT_ETAG):
+        return Response(status_code=304, headers=_ROOT_CACHE_HEADERS)
+    response = resp_200(data=_ROOT_DATA, message="MAI Scam Detection API is running")
+    response.headers.update(_ROOT_CACHE_HEADERS)
+    return response
 
 # =============================================================================
 # 2. HEALTH CHECK ENDPOINT
@@ -90,6 +101,11 @@ class HealthResponse(BaseModel):
     timestamp: str = Field(..., description="Response timestamp")
 
 
+# Serialized health body and the second it was built for; the payload only
+# changes with its timestamps, so it is rebuilt at most once per second
+_health_cache: Tuple[int, bytes] = (0, b"")
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health():
     """
@@ -98,15 +114,19 @@ async def health():
     Returns:
         dict: Health status information
     """
-    return health_success_response(
-        service="MAI Scam Detection API",
-        version="1.0.0",
-        components={
-            "api": "running",
-            "database": "connected", 
-            "ai_models": "available"
-        }
-    )
+    global _health_cache
+    now = int(time.time())
+    if _health_cache[0] != now:
+        _health_cache = (now, preserialize(health_success_response(
+            service="MAI Scam Detection API",
+            version="1.0.0",
+            components={
+                "api": "running",
+                "database": "connected", 
+                "ai_models": "available"
+            }
+        )))
+    return resp_static(_health_cache[1])
 
 # =============================================================================
 # 3. DEBUG AUTHENTICATION ENDPOINT
@@ -134,9 +154,13 @@ async def debug_auth(request: Request):
     Returns:
         dict: Debug authentication information
     """
+    # Copy the headers once for whichever branch responds; production gets none,
+    # which also keeps credentials out of the response body
+    request_headers = {} if is_production(request.app) else dict(request.headers)
+
     try:
-        # Try to authenticate the request
-        auth_result = authenticate_request(request)
+        # Try to authenticate the request (cached, verified off the event loop)
+        auth_result = await cached_authenticate(request)
 
         return resp_200(
             data={
@@ -145,8 +169,8 @@ async def debug_auth(request: Request):
                 "client_type": auth_result.get("client_type"),
                 "permissions": auth_result.get("permissions", []),
                 "auth_method": auth_result.get("auth_method"),
-                "request_headers": dict(request.headers),
-                "timestamp": datetime.utcnow().isoformat()
+                "request_headers": request_headers,
+                "timestamp": utc_timestamp()
             },
             message="Authentication successful"
         )
@@ -157,8 +181,8 @@ async def debug_auth(request: Request):
                 "authentication": "failed",
                 "error": e.detail,
                 "status_code": e.status_code,
-                "request_headers": dict(request.headers),
-                "timestamp": datetime.utcnow().isoformat()
+                "request_headers": request_headers,
+                "timestamp": utc_timestamp()
             },
             message="Authentication failed"
         )
@@ -168,8 +192,8 @@ async def debug_auth(request: Request):
                 "authentication": "error",
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "request_headers": dict(request.headers),
-                "timestamp": datetime.utcnow().isoformat()
+                "request_headers": request_headers,
+                "timestamp": utc_timestamp()
             },
             message="Authentication error"
         )
@@ -12,17 +12,16 @@ ENDPOINTS:
 """
 
 from fastapi import APIRouter, Request, HTTPException
-from setting import Setting
-import json
+from setting import get_settings
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any
 from datetime import datetime
 
-from models.customResponse import resp_200
+from models.customResponse import resp_200, preserialize, body_etag, resp_static_etag
 from utils.reportUtils import send_email_report
 # Authentication utilities (not used in this implementation but available if needed)
 
-config = Setting()
+config = get_settings()
 
 router = APIRouter(prefix="/report", tags=["Scam Reporting"])
 
@@ -33,9 +32,14 @@ router = APIRouter(prefix="/report", tags=["Scam Reporting"])
 class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status")
 
-@router.get("/", response_model=HealthResponse)
-async def healthcheck():
-    return {"status": "OK"}
+# Health check payload is static, so serialize it once at import
+_HEALTH_BODY = preserialize({"status": "OK"})
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
+
+
+@router.get("/", response_model=HealthResponse, include_in_schema=False)
+async def healthcheck(request: Request):
+    return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
 
 # =============================================================================
 # 2. SCAM REPORT MODELS
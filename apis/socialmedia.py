@@ -12,23 +12,32 @@ ENDPOINTS:
 4. POST /socialmedia/v2/analyze - Analyze social media post with multimodal support (v2)
 """
 
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException
 
-from setting import Setting
-import json
+from setting import get_settings
+import asyncio
 import base64
+import logging
+import uuid
+import msgspec
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Any, Tuple, Annotated
 
-from models.customResponse import resp_200
-from utils.socialmediaUtils import detect_language, analyze_social_media_content, translate_analysis, extract_social_media_signals, analyze_social_media_multimodal_v2, encode_image_to_base64
+from models.customResponse import resp_200, preserialize, body_etag, resp_static_etag
+from utils.socialmediaUtils import detect_language, analyze_social_media_content, translate_analysis, extract_social_media_signals, analyze_social_media_multimodal_v2, analyze_social_media_content_v2
 from utils.dynamodbUtils import save_detection_result, find_result_by_hash, get_detection_result
 from utils.s3Utils import upload_image_to_s3
-import hashlib
-import base64
-from utils.checkerUtils import check_url_phishing, check_email_validity, check_phone_number_validity, extract_urls_from_text, extract_emails_from_text, extract_phone_numbers_from_text, check_all_content, format_checker_results_for_llm
+from utils.bodyUtils import msgspec_body, msgspec_openapi_body
+from utils.constant import MAX_IMAGE_REQUEST_BODY_BYTES
+import xxhash
+from utils.hashUtils import normalize_hash_text, normalize_hash_url
+from utils.emailUtils import merge_additional_phone_checks
+from utils.singleflightUtils import run_singleflight
+from utils.checkerUtils import check_all_content_async, format_checker_results_for_llm
+
+config = get_settings()
 
-config = Setting()
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/socialmedia", tags=["Social Media Analysis"])
 
@@ -38,28 +47,125 @@ router = APIRouter(prefix="/socialmedia", tags=["Social Media Analysis"])
 
 def create_socialmedia_content_hash(platform: str, content: str, author_username: str = "", post_url: str = "", has_image: bool = False) -> str:
     """Create unique hash for social media content to enable deduplication."""
-    # Normalize text for consistent hashing
-    def normalize_text(text):
-        if not text:
-            return ""
-        return text.strip().lower()
+    # Dedup cache key only, not a security boundary (16 hex chars, like the email hash).
+    # Feeding the fields incrementally gives the same digest as hashing
+    # "socialmedia:{platform}|{content}|{author}|{url}|{has_image}" without building that string.
+    hasher = xxhash.xxh3_64(b"socialmedia:")
+    hasher.update(normalize_hash_text(platform))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(content))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(author_username))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_url(post_url))
+    hasher.update(b"|True" if has_image else b"|False")
+    return hasher.hexdigest()
+
+
+async def persist_socialmedia_analysis(post_id: str, content_hash: str, analysis_result: Dict[str, Any],
+                                       extracted_data: Dict[str, Any], image_base64: Optional[str],
+                                       target_language: str) -> None:
+    """Upload the post image to S3 and save the detection result to DynamoDB (runs as a background task)."""
+    # Process image and upload to S3 if present
+    image_data = []
+    if image_base64:
+        logger.debug("Processing image for social media post, content hash: %s", content_hash)
+        try:
+            # Decode base64 image in a worker thread; multi-megabyte images would otherwise stall the event loop
+            image_bytes = await asyncio.to_thread(base64.b64decode, image_base64)
+            
+            # Upload to S3
+            s3_url = await upload_image_to_s3(image_bytes, content_hash, 0)
+            
+            if s3_url:
+                image_data.append({
+                    "original_data": "base64_encoded_image",  # Don't store actual base64 for privacy
+                    "s3_url": s3_url,
+                    "s3_key": f"social_media/{content_hash}_image_0.jpg",
+                    "file_size": len(image_bytes),
+                    "uploaded_at": "2025-09-06T16:36:00.000Z"  # This will be updated by S3 utils
+                })
+                logger.debug("Uploaded social media image to S3: %s", s3_url)
+            else:
+                logger.warning("Failed to upload social media image to S3, content hash: %s", content_hash)
+        except Exception:
+            logger.exception("Error processing social media image, content hash: %s", content_hash)
+    extracted_data["images"] = image_data  # S3 image data instead of base64
+
+    # Save detection result to DynamoDB (extracted data + S3 URLs + LLM analysis)
+    logger.debug("Saving social media analysis to DynamoDB, content hash: %s", content_hash)
+    detection_id = await save_detection_result(
+        content_type="socialmedia",
+        content_hash=content_hash,
+        analysis_result=analysis_result,
+        extracted_data=extracted_data,
+        target_language=target_language,
+        detection_id=post_id
+    )
+    
+    # Verify save was successful
+    if not detection_id or detection_id.startswith('temp_'):
+        logger.error("Failed to save social media analysis to DynamoDB, got ID: %s, content hash: %s, platform: %s",
+                     detection_id, content_hash, extracted_data.get('platform'))
+    else:
+        logger.debug("Saved social media analysis to DynamoDB with ID: %s", detection_id)
+
+
+async def run_socialmedia_analysis(platform: str, content: str, author_username: str, post_url: Optional[str],
+                                   author_followers_count: Optional[int], engagement_metrics: Optional[Dict[str, Any]],
+                                   image_base64: Optional[str], target_language: str) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Run signal extraction, checkers and SeaLion v4 analysis for a social media post with no cached result.
+
+    Also assigns the post ID the result will be saved under, so requests joining this run share it.
+    """
+    post_id = str(uuid.uuid4())
+
+    # [Step 1 + 1.5] Extract auxiliary signals in a worker thread while URLs, emails,
+    # and phone numbers in the content are checked
+    full_content = f"{content} {post_url or ''}"
+    signals, checker_results = await asyncio.gather(
+        asyncio.to_thread(
+            extract_social_media_signals,
+            platform=platform,
+            content=content,
+            author_username=author_username,
+            post_url=post_url,
+            author_followers_count=author_followers_count,
+            engagement_metrics=engagement_metrics
+        ),
+        check_all_content_async(full_content)
+    )
     
-    def normalize_url(url):
-        if not url:
-            return ""
-        # Remove query parameters and fragments for consistency
-        from urllib.parse import urlparse
-        parsed = urlparse(url.lower())
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip('/')
+    # [Step 1.6] Check additional phone numbers found by social media signal extraction
+    await merge_additional_phone_checks(checker_results, signals.get('artifacts', {}).get('phone_numbers', []))
     
-    platform_norm = normalize_text(platform)
-    content_norm = normalize_text(content)
-    author_norm = normalize_text(author_username)
-    url_norm = normalize_url(post_url)
+    # [Step 1.7] Format checker analysis for LLM
+    checker_analysis = format_checker_results_for_llm(checker_results)
     
-    hash_input = f"socialmedia:{platform_norm}|{content_norm}|{author_norm}|{url_norm}|{has_image}"
-    hash_object = hashlib.sha256(hash_input.encode('utf-8'))
-    return hash_object.hexdigest()[:16]
+    # Add checker results to signals for LLM analysis
+    if checker_analysis:
+        signals['checker_analysis'] = checker_analysis
+
+    # [Step 2] Perform multimodal or text-only analysis based on image availability
+    if image_base64:
+        # Multimodal analysis with Sea-Lion v4
+        comprehensive_analysis = await analyze_social_media_multimodal_v2(
+            platform=platform,
+            content=content,
+            base64_image=image_base64,
+            target_language=target_language,
+            signals=signals
+        )
+    else:
+        # Text-only analysis with Sea-Lion v4
+        comprehensive_analysis = await analyze_social_media_content_v2(
+            platform=platform,
+            content=content,
+            target_language=target_language,
+            signals=signals
+        )
+
+    return post_id, comprehensive_analysis, signals, checker_results
 
 # =============================================================================
 # 1. HEALTH CHECK ENDPOINT
@@ -70,9 +176,14 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status")
 
 
-@router.get("/", response_model=HealthResponse)
-async def healthcheck():
-    return {"status": "OK"}
+# Health check payload is static, so serialize it once at import
+_HEALTH_BODY = preserialize({"status": "OK"})
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
+
+
+@router.get("/", response_model=HealthResponse, include_in_schema=False)
+async def healthcheck(request: Request):
+    return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
 
 # =============================================================================
 # 2. SOCIAL MEDIA ANALYSIS ENDPOINT
@@ -87,33 +198,35 @@ class SocialMediaAnalysis(BaseModel):
                                     description="Recommended action to take")
 
 
-class SocialMediaAnalysisRequest(BaseModel):
-    platform: str = Field(
-        ..., description="Social media platform (facebook, instagram, twitter, tiktok, linkedin)")
-    content: str = Field(..., description="Post content/text")
-    author_username: str = Field(..., description="Author's username")
-    target_language: str = Field(
-        ..., description="Target language for analysis (en, zh, ms, th, vi)")
-    post_url: Optional[str] = Field(None, description="URL of the post")
-    author_followers_count: Optional[int] = Field(
-        None, description="Number of followers")
-    engagement_metrics: Optional[Dict[str, Any]] = Field(
-        None, description="Engagement metrics (likes, shares, comments)")
-
-
-class SocialMediaAnalysisV2Request(BaseModel):
-    platform: str = Field(
-        ..., description="Social media platform (facebook, instagram, twitter, tiktok, linkedin)")
-    content: str = Field(..., description="Post content/text")
-    author_username: str = Field(..., description="Author's username")
-    target_language: str = Field(
-        ..., description="Target language for analysis (en, zh, ms, th, vi)")
-    image: Optional[str] = Field(None, description="Base64 encoded image string for multimodal analysis")
-    post_url: Optional[str] = Field(None, description="URL of the post")
-    author_followers_count: Optional[int] = Field(
-        None, description="Number of followers")
-    engagement_metrics: Optional[Dict[str, Any]] = Field(
-        None, description="Engagement metrics (likes, shares, comments)")
+# Decoded with msgspec rather than Pydantic to keep validation off the hot path
+class SocialMediaAnalysisRequest(msgspec.Struct):
+    platform: Annotated[str, msgspec.Meta(
+        description="Social media platform (facebook, instagram, twitter, tiktok, linkedin)")]
+    content: Annotated[str, msgspec.Meta(description="Post content/text")]
+    author_username: Annotated[str, msgspec.Meta(description="Author's username")]
+    target_language: Annotated[str, msgspec.Meta(
+        description="Target language for analysis (en, zh, ms, th, vi)")]
+    post_url: Annotated[Optional[str], msgspec.Meta(description="URL of the post")] = None
+    author_followers_count: Annotated[Optional[int], msgspec.Meta(
+        description="Number of followers")] = None
+    engagement_metrics: Annotated[Optional[Dict[str, Any]], msgspec.Meta(
+        description="Engagement metrics (likes, shares, comments)")] = None
+
+
+class SocialMediaAnalysisV2Request(msgspec.Struct):
+    platform: Annotated[str, msgspec.Meta(
+        description="Social media platform (facebook, instagram, twitter, tiktok, linkedin)")]
+    content: Annotated[str, msgspec.Meta(description="Post content/text")]
+    author_username: Annotated[str, msgspec.Meta(description="Author's username")]
+    target_language: Annotated[str, msgspec.Meta(
+        description="Target language for analysis (en, zh, ms, th, vi)")]
+    image: Annotated[Optional[str], msgspec.Meta(
+        description="Base64 encoded image string for multimodal analysis")] = None
+    post_url: Annotated[Optional[str], msgspec.Meta(description="URL of the post")] = None
+    author_followers_count: Annotated[Optional[int], msgspec.Meta(
+        description="Number of followers")] = None
+    engagement_metrics: Annotated[Optional[Dict[str, Any]], msgspec.Meta(
+        description="Engagement metrics (likes, shares, comments)")] = None
 
 
 class SocialMediaAnalysisResponse(BaseModel):
@@ -158,68 +271,38 @@ Analyze social media content for potential scam indicators using AI.
              summary=analyze_v1_summary,
              description=analyze_v1_description,
              response_model=SocialMediaAnalysisResponse,
-             response_description="Social media analysis results with risk assessment")
-async def analyze_social_media_post_v1(request: SocialMediaAnalysisRequest):
-    # [Step 0] Read values from the request body
-    try:
-        platform = request.platform
-        content = request.content
-        author_username = request.author_username
-        target_language = request.target_language
-        post_url = request.post_url
-        author_followers_count = request.author_followers_count
-        engagement_metrics = request.engagement_metrics
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Detect the base language of the social media content
-    base_language = await detect_language(content)
-
-    # [Step 1.5] Check URLs, emails, and phone numbers in the content
+             response_description="Social media analysis results with risk assessment",
+             openapi_extra=msgspec_openapi_body(SocialMediaAnalysisRequest))
+async def analyze_social_media_post_v1(request: SocialMediaAnalysisRequest = msgspec_body(SocialMediaAnalysisRequest)):
+    # [Step 0] Read values from the request body (already validated on decode)
+    platform = request.platform
+    content = request.content
+    author_username = request.author_username
+    target_language = request.target_language
+    post_url = request.post_url
+    author_followers_count = request.author_followers_count
+    engagement_metrics = request.engagement_metrics
+
+    # [Step 1 + 1.5 + 1.6] Detect the base language of the social media content while
+    # URLs, emails, and phone numbers are checked and auxiliary signals are extracted,
+    # so the language-detection LLM call overlaps the rest of the preprocessing
     full_content = f"{content} {post_url or ''}"
-    checker_results = check_all_content(full_content)
-    
-    # [Step 1.6] Extract auxiliary signals to support the analysis
-    signals = extract_social_media_signals(
-        platform=platform,
-        content=content,
-        author_username=author_username,
-        post_url=post_url,
-        author_followers_count=author_followers_count,
-        engagement_metrics=engagement_metrics
+    base_language, checker_results, signals = await asyncio.gather(
+        detect_language(content),
+        check_all_content_async(full_content),
+        asyncio.to_thread(
+            extract_social_media_signals,
+            platform=platform,
+            content=content,
+            author_username=author_username,
+            post_url=post_url,
+            author_followers_count=author_followers_count,
+            engagement_metrics=engagement_metrics
+        )
     )
     
     # [Step 1.7] Check additional phone numbers found by social media signal extraction
-    social_media_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if social_media_phones:
-        # Validate any phone numbers found by social media extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in social_media_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
+    await merge_additional_phone_checks(checker_results, signals.get('artifacts', {}).get('phone_numbers', []))
     
     # [Step 1.8] Format checker analysis for LLM
     checker_analysis = format_checker_results_for_llm(checker_results)
@@ -334,13 +417,9 @@ Translate social media analysis results to different languages.
              response_model=SocialMediaTranslationResponse,
              response_description="Translated social media analysis results")
 async def translate_social_media_analysis_v1(request: SocialMediaTranslationRequest):
-    # [Step 0] Read values from the request body
-    try:
-        post_id = request.post_id
-        target_language = request.target_language
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
+    # [Step 0] Read values from the request body (already validated on decode)
+    post_id = request.post_id
+    target_language = request.target_language
 
     # [Step 1] Get base_language_analysis from database
     document = await get_detection_result(post_id)
@@ -426,6 +505,7 @@ Analyze social media content for potential scam indicators using AI with multimo
       "text_analysis": "Specific findings from text analysis (NEW in v2)"
     },
     "reused": false,
+    "persisted": false,
     "version": "v2",
     "multimodal": true
   },
@@ -445,6 +525,8 @@ Analyze social media content for potential scam indicators using AI with multimo
 - **`data.[language].image_analysis`**: 🆕 Visual scam detection results
 - **`data.[language].text_analysis`**: 🆕 Text content analysis results
 - **`data.reused`**: Whether results were retrieved from cache
+- **`data.persisted`**: Whether `post_id` is already stored; `false` means the save runs after
+  the response and the ID is provisional until it completes (it is never stored if that save fails)
 - **`data.version`**: API version identifier ("v2")
 - **`data.multimodal`**: 🆕 Whether image analysis was performed
 - **`timestamp`**: ISO format response timestamp
@@ -465,6 +547,7 @@ Analyze social media content for potential scam indicators using AI with multimo
       "text_analysis": "Uses classic scam tactics: promise of money, urgency language, and promotional gambling content without clear terms."
     },
     "reused": false,
+    "persisted": false,
     "version": "v2",
     "multimodal": true
   },
@@ -486,8 +569,11 @@ Analyze social media content for potential scam indicators using AI with multimo
              summary=analyze_v2_summary,
              description=analyze_v2_description,
              response_model=SocialMediaAnalysisV2Response,
-             response_description="Social media multimodal analysis results with risk assessment using SageMaker SeaLion v4")
-async def analyze_social_media_post_v2(request: SocialMediaAnalysisV2Request):
+             response_description="Social media multimodal analysis results with risk assessment using SageMaker SeaLion v4",
+             openapi_extra=msgspec_openapi_body(SocialMediaAnalysisV2Request))
+async def analyze_social_media_post_v2(background_tasks: BackgroundTasks,
+                                       request: SocialMediaAnalysisV2Request = msgspec_body(
+                                           SocialMediaAnalysisV2Request, max_bytes=MAX_IMAGE_REQUEST_BODY_BYTES)):
     """
     V2 Social media analysis endpoint with multimodal support using SageMaker-hosted SeaLion v4 model.
     
@@ -495,108 +581,20 @@ async def analyze_social_media_post_v2(request: SocialMediaAnalysisV2Request):
     If an image is provided, it performs multimodal analysis via SageMaker. Otherwise, it falls back to 
     enhanced text-only analysis using SageMaker-hosted SeaLion v4.
     """
-    # [Step 0] Read values from the request body
-    try:
-        platform = request.platform
-        content = request.content
-        author_username = request.author_username
-        target_language = request.target_language
-        image_base64 = request.image
-        post_url = request.post_url
-        author_followers_count = request.author_followers_count
-        engagement_metrics = request.engagement_metrics
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Check URLs, emails, and phone numbers in the content
-    full_content = f"{content} {post_url or ''}"
-    checker_results = check_all_content(full_content)
-    
-    # [Step 1.5] Extract auxiliary signals to support the analysis
-    signals = extract_social_media_signals(
-        platform=platform,
-        content=content,
-        author_username=author_username,
-        post_url=post_url,
-        author_followers_count=author_followers_count,
-        engagement_metrics=engagement_metrics
-    )
-    
-    # [Step 1.6] Check additional phone numbers found by social media signal extraction
-    social_media_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if social_media_phones:
-        # Validate any phone numbers found by social media extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in social_media_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
-    
-    # [Step 1.7] Format checker analysis for LLM
-    checker_analysis = format_checker_results_for_llm(checker_results)
-    
-    # Add checker results to signals for LLM analysis
-    if checker_analysis:
-        signals['checker_analysis'] = checker_analysis
-
-    # [Step 2] Perform multimodal or text-only analysis based on image availability
-    if image_base64:
-        # Multimodal analysis with Sea-Lion v4
-        comprehensive_analysis = await analyze_social_media_multimodal_v2(
-            platform=platform,
-            content=content,
-            base64_image=image_base64,
-            target_language=target_language,
-            signals=signals
-        )
-    else:
-        # Text-only analysis with Sea-Lion v4
-        from utils.socialmediaUtils import analyze_social_media_content_v2
-        comprehensive_analysis = await analyze_social_media_content_v2(
-            platform=platform,
-            content=content,
-            target_language=target_language,
-            signals=signals
-        )
-
-    # Extract detected language and prepare analysis structure for database
-    detected_language = comprehensive_analysis.get("detected_language", target_language)
-    analysis = {
-        target_language: {
-            "risk_level": comprehensive_analysis.get("risk_level"),
-            "analysis": comprehensive_analysis.get("analysis"),
-            "recommended_action": comprehensive_analysis.get("recommended_action"),
-            "image_analysis": comprehensive_analysis.get("image_analysis"),
-            "text_analysis": comprehensive_analysis.get("text_analysis")
-        }
-    }
-
-    # [Step 3] Create unique content hash for reusability (include image in hash if present)
+    # [Step 0] Read values from the request body (already validated on decode)
+    platform = request.platform
+    content = request.content
+    author_username = request.author_username
+    target_language = request.target_language
+    image_base64 = request.image
+    post_url = request.post_url
+    author_followers_count = request.author_followers_count
+    engagement_metrics = request.engagement_metrics
+
+    # [Step 0.5] Create unique content hash for reusability (include image in hash if present)
     content_hash = create_socialmedia_content_hash(platform, content, author_username, post_url, bool(image_base64))
 
-    # [Step 4] Check if we already have analysis for this content
+    # [Step 0.6] Return an existing analysis before any extraction, checking or LLM work
     existing_analysis = await find_result_by_hash(content_hash)
     if existing_analysis and existing_analysis.get('content_type') == 'socialmedia':
         # Return existing analysis if available and matches target language
@@ -614,72 +612,44 @@ async def analyze_social_media_post_v2(request: SocialMediaAnalysisV2Request):
                         "text_analysis": existing_result.get("text_analysis")
                     },
                     "reused": True,
+                    "persisted": True,
                     "version": "v2",
                     "multimodal": bool(image_base64)
                 }
             )
 
-    # [Step 5] Process image and upload to S3 if present
-    image_data = []
-    if image_base64:
-        print(f"Processing image for social media post with content hash: {content_hash}")
-        try:
-            # Decode base64 image
-            image_bytes = base64.b64decode(image_base64)
-            
-            # Upload to S3
-            s3_url = await upload_image_to_s3(image_bytes, content_hash, 0)
-            
-            if s3_url:
-                image_data.append({
-                    "original_data": "base64_encoded_image",  # Don't store actual base64 for privacy
-                    "s3_url": s3_url,
-                    "s3_key": f"social_media/{content_hash}_image_0.jpg",
-                    "file_size": len(image_bytes),
-                    "uploaded_at": "2025-09-06T16:36:00.000Z"  # This will be updated by S3 utils
-                })
-                print(f"✅ Successfully uploaded image to S3: {s3_url}")
-            else:
-                print(f"❌ Failed to upload image to S3")
-        except Exception as e:
-            print(f"❌ Error processing image: {e}")
-
-    # [Step 6] Prepare extracted data for DynamoDB storage
-    extracted_data = {
-        "platform": platform,
-        "content": content,
-        "author_username": author_username,
-        "post_url": post_url or "",
-        "author_followers_count": author_followers_count or 0,
-        "engagement_metrics": engagement_metrics or {},
-        "images": image_data,  # S3 image data instead of base64
-        "signals": signals or {},
-        "checker_results": checker_results or {},
-        "version": "v2",
-        "multimodal": bool(image_base64)
-    }
-
-    # [Step 7] Save detection result to DynamoDB (extracted data + S3 URLs + LLM analysis)
-    print(f"Attempting to save social media analysis to DynamoDB for content hash: {content_hash}")
-    detection_id = await save_detection_result(
-        content_type="socialmedia",
-        content_hash=content_hash,
-        analysis_result=comprehensive_analysis,
-        extracted_data=extracted_data,
-        target_language=target_language
+    # [Step 1 - 2] Run signal extraction, checkers and the SeaLion v4 analysis, joining an
+    # identical analysis already in flight instead of starting a second one
+    (post_id, comprehensive_analysis, signals, checker_results), is_owner = await run_singleflight(
+        f"socialmedia:v2:{content_hash}:{target_language}",
+        lambda: run_socialmedia_analysis(platform, content, author_username, post_url, author_followers_count,
+                                         engagement_metrics, image_base64, target_language)
     )
-    
-    # [Step 7.1] Verify save was successful before returning response
-    if not detection_id or detection_id.startswith('temp_'):
-        print(f"❌ CRITICAL: Failed to save social media analysis to DynamoDB! Got ID: {detection_id}")
-        print(f"Content hash: {content_hash}")
-        print(f"Platform: {platform}")
-        # For now, continue with response (graceful degradation)
-        # In production, you might want to raise an exception here
-        post_id = f"temp_{content_hash[:8]}"
-    else:
-        print(f"✅ SUCCESS: Saved social media analysis to DynamoDB with ID: {detection_id}")
-        post_id = detection_id
+
+    # [Step 5 - 7] Upload the image to S3 and save the detection result to DynamoDB after the
+    # response is sent, under the run's post ID; requests that joined the run reuse that ID
+    # and leave the save to the request that started it
+    if is_owner:
+        background_tasks.add_task(
+            persist_socialmedia_analysis,
+            post_id=post_id,
+            content_hash=content_hash,
+            analysis_result=comprehensive_analysis,
+            extracted_data={
+                "platform": platform,
+                "content": content,
+                "author_username": author_username,
+                "post_url": post_url or "",
+                "author_followers_count": author_followers_count or 0,
+                "engagement_metrics": engagement_metrics or {},
+                "signals": signals or {},
+                "checker_results": checker_results or {},
+                "version": "v2",
+                "multimodal": bool(image_base64)
+            },
+            image_base64=image_base64,
+            target_language=target_language
+        )
 
     # [Step 8] Respond analysis in "target language" to user
     return resp_200(
@@ -693,6 +663,8 @@ async def analyze_social_media_post_v2(request: SocialMediaAnalysisV2Request):
                 "text_analysis": comprehensive_analysis.get("text_analysis")
             },
             "reused": False,
+            # The save runs after the response, so post_id is provisional until it lands
+            "persisted": False,
             "version": "v2",
             "multimodal": bool(image_base64)
         }
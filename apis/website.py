@@ -12,21 +12,28 @@ ENDPOINTS:
 4. POST /website/v2/analyze - Analyze website for scam detection (v2 - SEA-LION v4)
 """
 
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException
 
-from setting import Setting
-import json
-import base64
+from setting import get_settings
+import asyncio
+import logging
+import msgspec
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Any, Tuple, Annotated
 
-from models.customResponse import resp_200
-from utils.websiteUtils import detect_language, analyze_website_content, translate_analysis, extract_website_signals, analyze_website_comprehensive, analyze_website_comprehensive_v2, analyze_website_comprehensive_sagemaker
+from models.customResponse import resp_200, preserialize, body_etag, resp_static_etag
+from utils.bodyUtils import msgspec_body, msgspec_openapi_body
+from utils.websiteUtils import translate_analysis, extract_website_signals, analyze_website_comprehensive, analyze_website_comprehensive_sagemaker
 from utils.dynamodbUtils import save_detection_result, find_result_by_hash, get_detection_result
-import hashlib
-from utils.checkerUtils import check_url_phishing, check_email_validity, check_phone_number_validity, extract_urls_from_text, extract_emails_from_text, extract_phone_numbers_from_text, check_all_content, format_checker_results_for_llm
+import xxhash
+from utils.hashUtils import normalize_hash_text, normalize_hash_url
+from utils.emailUtils import merge_additional_phone_checks
+from utils.singleflightUtils import run_singleflight
+from utils.checkerUtils import check_all_content_async, format_checker_results_for_llm
 
-config = Setting()
+config = get_settings()
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/website", tags=["Website Analysis"])
 
@@ -36,27 +43,86 @@ router = APIRouter(prefix="/website", tags=["Website Analysis"])
 
 def create_website_content_hash(url: str, title: str = "", content: str = "") -> str:
     """Create unique hash for website content to enable deduplication."""
-    # Normalize text for consistent hashing
-    def normalize_text(text):
-        if not text:
-            return ""
-        return text.strip().lower()
+    # Dedup cache key only, not a security boundary (16 hex chars, like the email hash).
+    # Feeding the fields incrementally gives the same digest as hashing
+    # "website:{url}|{title}|{content}" without building that string.
+    hasher = xxhash.xxh3_64(b"website:")
+    hasher.update(normalize_hash_url(url))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(title))
+    hasher.update(b"|")
+    hasher.update(normalize_hash_text(content))
+    return hasher.hexdigest()
+
+
+async def save_website_detection_result(content_hash: str, analysis_result: Dict[str, Any],
+                                        extracted_data: Dict[str, Any], target_language: str) -> None:
+    """Save website detection result to DynamoDB and log the outcome (runs as a background task)."""
+    logger.debug("Saving website analysis to DynamoDB, content hash: %s", content_hash)
+    detection_id = await save_detection_result(
+        content_type="website",
+        content_hash=content_hash,
+        analysis_result=analysis_result,
+        extracted_data=extracted_data,
+        target_language=target_language
+    )
+
+    # Verify save was successful
+    if not detection_id or detection_id.startswith('temp_'):
+        logger.error("Failed to save website analysis to DynamoDB, got ID: %s, content hash: %s, URL: %s",
+                     detection_id, content_hash, extracted_data.get('url'))
+    else:
+        logger.debug("Saved website analysis to DynamoDB with ID: %s", detection_id)
+
+
+async def run_website_analysis(url: str, title: Optional[str], content: Optional[str], target_language: str,
+                               metadata: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run signal extraction, checkers and SageMaker LLM analysis for a website with no cached result."""
+    # [Step 1 + 1.5] Extract auxiliary signals in a worker thread while URLs, emails,
+    # and phone numbers in the website content are checked
+    full_content = f"{url} {title or ''} {content or ''}"
+    signals, checker_results = await asyncio.gather(
+        asyncio.to_thread(
+            extract_website_signals,
+            url=url,
+            title=title or "",
+            content=content or "",
+            screenshot_data="",  # V2 doesn't use screenshot data
+            metadata=metadata
+        ),
+        check_all_content_async(full_content)
+    )
     
-    def normalize_url(url):
-        if not url:
-            return ""
-        # Remove query parameters and fragments for consistency
-        from urllib.parse import urlparse
-        parsed = urlparse(url.lower())
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip('/')
+    # [Step 1.6] Check additional phone numbers found by website signal extraction
+    await merge_additional_phone_checks(checker_results, signals.get('artifacts', {}).get('phone_numbers', []))
     
-    url_norm = normalize_url(url)
-    title_norm = normalize_text(title)
-    content_norm = normalize_text(content)
+    # [Step 1.7] Format checker analysis for LLM
+    checker_analysis = format_checker_results_for_llm(checker_results)
     
-    hash_input = f"website:{url_norm}|{title_norm}|{content_norm}"
-    hash_object = hashlib.sha256(hash_input.encode('utf-8'))
-    return hash_object.hexdigest()[:16]
+    # Add checker results to signals for LLM analysis
+    if checker_analysis:
+        signals['checker_analysis'] = checker_analysis
+
+    # [Step 2] Perform comprehensive analysis with single SageMaker SeaLion v4 LLM call
+    # This combines: language detection + analysis + target language output
+    comprehensive_analysis = await analyze_website_comprehensive_sagemaker(
+        url=url,
+        title=title or "",
+        content=content or "",
+        target_language=target_language,
+        signals=signals
+    )
+    
+    # [Step 5] Prepare extracted data for DynamoDB storage
+    extracted_data = {
+        "url": url,
+        "title": title or "",
+        "content": content or "",
+        "metadata": metadata or {},
+        "signals": signals or {},
+        "checker_results": checker_results or {}
+    }
+    return comprehensive_analysis, extracted_data
 
 # =============================================================================
 # 1. HEALTH CHECK ENDPOINT
@@ -67,9 +133,14 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status")
 
 
-@router.get("/", response_model=HealthResponse)
-async def healthcheck():
-    return {"status": "OK"}
+# Health check payload is static, so serialize it once at import
+_HEALTH_BODY = preserialize({"status": "OK"})
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
+
+
+@router.get("/", response_model=HealthResponse, include_in_schema=False)
+async def healthcheck(request: Request):
+    return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
 
 # =============================================================================
 # 2. WEBSITE ANALYSIS ENDPOINT
@@ -98,14 +169,15 @@ class WebsiteAnalysisRequest(BaseModel):
         None, description="SSL info, domain age, etc.")
 
 
-class WebsiteAnalysisV2Request(BaseModel):
-    url: str = Field(..., description="Website URL to analyze")
-    title: Optional[str] = Field(None, description="Website title")
-    content: Optional[str] = Field(None, description="Website content/text")
-    target_language: str = Field(
-        ..., description="Target language for analysis (en, zh, ms, th, vi)")
-    metadata: Optional[Dict[str, Any]] = Field(
-        None, description="SSL info, domain age, etc.")
+# Decoded with msgspec rather than Pydantic to keep validation off the hot path
+class WebsiteAnalysisV2Request(msgspec.Struct):
+    url: Annotated[str, msgspec.Meta(description="Website URL to analyze")]
+    target_language: Annotated[str, msgspec.Meta(
+        description="Target language for analysis (en, zh, ms, th, vi)")]
+    title: Annotated[Optional[str], msgspec.Meta(description="Website title")] = None
+    content: Annotated[Optional[str], msgspec.Meta(description="Website content/text")] = None
+    metadata: Annotated[Optional[Dict[str, Any]], msgspec.Meta(
+        description="SSL info, domain age, etc.")] = None
 
 
 class WebsiteAnalysisResponse(BaseModel):
@@ -151,61 +223,31 @@ Analyze website content for potential scam indicators using AI.
              response_model=WebsiteAnalysisResponse,
              response_description="Website analysis results with risk assessment")
 async def analyze_website_v1(request: WebsiteAnalysisRequest):
-    # [Step 0] Read values from the request body
-    try:
-        url = request.url
-        title = request.title
-        content = request.content
-        target_language = request.target_language
-        screenshot_data = request.screenshot_data
-        metadata = request.metadata
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Extract auxiliary signals to support the analysis
-    signals = extract_website_signals(
-        url=url,
-        title=title,
-        content=content,
-        screenshot_data=screenshot_data,
-        metadata=metadata
-    )
-
-    # [Step 1.5] Check URLs, emails, and phone numbers in the website content
+    # [Step 0] Read values from the request body (already validated on decode)
+    url = request.url
+    title = request.title
+    content = request.content
+    target_language = request.target_language
+    screenshot_data = request.screenshot_data
+    metadata = request.metadata
+
+    # [Step 1 + 1.5] Extract auxiliary signals in a worker thread while URLs, emails,
+    # and phone numbers in the website content are checked
     full_content = f"{url} {title or ''} {content or ''}"
-    checker_results = check_all_content(full_content)
+    signals, checker_results = await asyncio.gather(
+        asyncio.to_thread(
+            extract_website_signals,
+            url=url,
+            title=title,
+            content=content,
+            screenshot_data=screenshot_data,
+            metadata=metadata
+        ),
+        check_all_content_async(full_content)
+    )
     
     # [Step 1.6] Check additional phone numbers found by website signal extraction
-    website_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if website_phones:
-        # Validate any phone numbers found by website extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in website_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
+    await merge_additional_phone_checks(checker_results, signals.get('artifacts', {}).get('phone_numbers', []))
     
     # [Step 1.7] Format checker analysis for LLM
     checker_analysis = format_checker_results_for_llm(checker_results)
@@ -326,13 +368,9 @@ Translate website analysis results to different languages.
              response_model=WebsiteTranslationResponse,
              response_description="Translated website analysis results")
 async def translate_website_analysis_v1(request: WebsiteTranslationRequest):
-    # [Step 0] Read values from the request body
-    try:
-        website_id = request.website_id
-        target_language = request.target_language
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
+    # [Step 0] Read values from the request body (already validated on decode)
+    website_id = request.website_id
+    target_language = request.target_language
 
     # [Step 1] Get base_language_analysis from database  
     document = await get_detection_result(website_id)
@@ -392,107 +430,34 @@ Analyze website content for potential scam indicators using AI with SageMaker-ho
              summary=analyze_v2_summary,
              description=analyze_v2_description,
              response_model=WebsiteAnalysisResponse,
-             response_description="Website analysis results with risk assessment using SageMaker SEA-LION v4")
-async def analyze_website_v2(request: WebsiteAnalysisV2Request):
+             response_description="Website analysis results with risk assessment using SageMaker SEA-LION v4",
+             openapi_extra=msgspec_openapi_body(WebsiteAnalysisV2Request))
+async def analyze_website_v2(background_tasks: BackgroundTasks,
+                             request: WebsiteAnalysisV2Request = msgspec_body(WebsiteAnalysisV2Request)):
     """
     V2 Website analysis endpoint using SageMaker-hosted SEA-LION v4 model.
     
     This endpoint uses the SageMaker-hosted SEA-LION v4 model for improved 
     performance, reliability, and cost-effectiveness compared to the Sea Lion API.
     """
-    # [Step 0] Read values from the request body
-    try:
-        url = request.url
-        title = request.title
-        content = request.content
-        target_language = request.target_language
-        screenshot_data = None  # V2 doesn't use screenshot data
-        metadata = request.metadata
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail="Invalid request body")
-
-    # [Step 1] Extract auxiliary signals to support the analysis
-    signals = extract_website_signals(
-        url=url,
-        title=title or "",
-        content=content or "",
-        screenshot_data="",  # V2 doesn't use screenshot data
-        metadata=metadata
-    )
-
-    # [Step 1.5] Check URLs, emails, and phone numbers in the website content
-    full_content = f"{url} {title or ''} {content or ''}"
-    checker_results = check_all_content(full_content)
-    
-    # [Step 1.6] Check additional phone numbers found by website signal extraction
-    website_phones = signals.get('artifacts', {}).get('phone_numbers', [])
-    if website_phones:
-        # Validate any phone numbers found by website extraction that weren't caught by checker utils
-        from utils.checkerUtils import check_phone_number_validity
-        additional_phone_results = []
-        for phone in website_phones:
-            # Clean phone number (remove formatting)
-            clean_phone = phone.strip().replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
-            if clean_phone not in [p['phone'] for p in checker_results.get('validation', {}).get('phone_numbers', {}).get('results', [])]:
-                result = check_phone_number_validity(clean_phone)
-                additional_phone_results.append(result)
-        
-        # Merge additional phone results with checker results
-        if additional_phone_results:
-            if 'validation' not in checker_results:
-                checker_results['validation'] = {}
-            if 'phone_numbers' not in checker_results['validation']:
-                checker_results['validation']['phone_numbers'] = {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []}
-            
-            # Update phone validation results
-            phone_validation = checker_results['validation']['phone_numbers']
-            phone_validation['results'].extend(additional_phone_results)
-            phone_validation['total_phones'] = len(phone_validation['results'])
-            
-            # Recount valid/invalid phones
-            valid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is True)
-            invalid_count = sum(1 for r in phone_validation['results'] if r.get('is_valid') is False)
-            phone_validation['valid_phones'] = valid_count
-            phone_validation['invalid_phones'] = invalid_count
-    
-    # [Step 1.7] Format checker analysis for LLM
-    checker_analysis = format_checker_results_for_llm(checker_results)
-    
-    # Add checker results to signals for LLM analysis
-    if checker_analysis:
-        signals['checker_analysis'] = checker_analysis
-
-    # [Step 2] Perform comprehensive analysis with single SageMaker SeaLion v4 LLM call
-    # This combines: language detection + analysis + target language output
-    comprehensive_analysis = await analyze_website_comprehensive_sagemaker(
-        url=url,
-        title=title or "",
-        content=content or "",
-        target_language=target_language,
-        signals=signals
-    )
-    
-    # Extract detected language and prepare analysis structure for database
-    base_language = comprehensive_analysis["detected_language"]
-    analysis = {
-        target_language: {
-            "risk_level": comprehensive_analysis["risk_level"],
-            "analysis": comprehensive_analysis["analysis"], 
-            "recommended_action": comprehensive_analysis["recommended_action"]
-        }
-    }
-
-    # [Step 4] Create unique content hash for reusability
+    # [Step 0] Read values from the request body (already validated on decode)
+    url = request.url
+    title = request.title
+    content = request.content
+    target_language = request.target_language
+    screenshot_data = None  # V2 doesn't use screenshot data
+    metadata = request.metadata
+
+    # [Step 0.5] Create unique content hash for reusability
     content_hash = create_website_content_hash(url, title, content)
 
-    # [Step 4.5] Check if we already have analysis for this content
+    # [Step 0.6] Return an existing analysis before any extraction, checking or LLM work
     existing_analysis = await find_result_by_hash(content_hash)
     if existing_analysis and existing_analysis.get('content_type') == 'website':
         # Return existing analysis if available and matches target language
         existing_result = existing_analysis.get('analysis_result', {})
         if existing_result:
-            print(f"Returning cached website result for content hash: {content_hash}")
+            logger.debug("Returning cached website result for content hash: %s", content_hash)
             return resp_200(
                 data={
                     "risk_level": existing_result.get("risk_level"),
@@ -503,35 +468,23 @@ async def analyze_website_v2(request: WebsiteAnalysisV2Request):
                 }
             )
 
-    # [Step 5] Prepare extracted data for DynamoDB storage
-    extracted_data = {
-        "url": url,
-        "title": title or "",
-        "content": content or "",
-        "metadata": metadata or {},
-        "signals": signals or {},
-        "checker_results": checker_results or {}
-    }
-
-    # [Step 6] Save detection result to DynamoDB (extracted data + LLM analysis)
-    print(f"Attempting to save website analysis to DynamoDB for content hash: {content_hash}")
-    detection_id = await save_detection_result(
-        content_type="website",
-        content_hash=content_hash,
-        analysis_result=comprehensive_analysis,
-        extracted_data=extracted_data,
-        target_language=target_language
+    # [Step 1 - 5] Run signal extraction, checkers and a single SageMaker SeaLion v4 LLM call, joining
+    # an identical analysis already in flight instead of starting a second one
+    (comprehensive_analysis, extracted_data), is_owner = await run_singleflight(
+        f"website:v2:{content_hash}:{target_language}",
+        lambda: run_website_analysis(url, title, content, target_language, metadata)
     )
-    
-    # [Step 6.1] Verify save was successful before returning response
-    if not detection_id or detection_id.startswith('temp_'):
-        print(f"❌ CRITICAL: Failed to save website analysis to DynamoDB! Got ID: {detection_id}")
-        print(f"Content hash: {content_hash}")
-        print(f"URL: {url}")
-        # For now, continue with response (graceful degradation)
-        # In production, you might want to raise an exception here
-    else:
-        print(f"✅ SUCCESS: Saved website analysis to DynamoDB with ID: {detection_id}")
+
+    # [Step 6] Save detection result to DynamoDB after the response is sent (only by the
+    # request that ran the analysis; joined requests would save a duplicate)
+    if is_owner:
+        background_tasks.add_task(
+            save_website_detection_result,
+            content_hash,
+            comprehensive_analysis,
+            extracted_data,
+            target_language
+        )
 
     # [Step 7] Respond analysis in "target language" to user  
     return resp_200(
@@ -18,11 +18,12 @@ USAGE EXAMPLES:
 python app.py
 
 # Or with uvicorn directly
-uvicorn app:app --host 0.0.0.0 --port 8000
+uvicorn app:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 """
 
 from fastapi import FastAPI
-from setting import Setting
+from fastapi.responses import ORJSONResponse
+from setting import get_settings
 from router import router as api_router
 from core.event_handlers import start_app_handler, stop_app_handler
 from core.exception_handlers import setup_exception_handlers
@@ -31,14 +32,19 @@ from middleware.auth_middleware import (
     LoggingMiddleware, ErrorHandlingMiddleware, configure_cors
 )
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from mangum import Mangum
 import uvicorn
 import logging
 import os
+import platform
 
-config = Setting()
+config = get_settings()
 logger = logging.getLogger(__name__)
 
+# Responses smaller than this are sent uncompressed; gzip would not pay for itself
+GZIP_MINIMUM_SIZE = 1024
+
 
 def setup_middleware(app: FastAPI) -> None:
     """
@@ -50,14 +56,9 @@ def setup_middleware(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    # Add trusted host middleware for production (first)
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=["localhost", "127.0.0.1", "your-domain.com", "*"]
-    )
-
-    # Configure CORS (early)
-    configure_cors(app)
+    # Compress larger responses such as /openapi.json and batch results (innermost,
+    # so the other middleware see the final headers)
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
     # Add logging middleware (early)
     app.add_middleware(LoggingMiddleware)
@@ -71,9 +72,18 @@ def setup_middleware(app: FastAPI) -> None:
     # Add rate limiting middleware
     app.add_middleware(RateLimitMiddleware)
 
-    # Add security headers middleware (last)
+    # Configure CORS (outside authentication, so preflights are answered before auth)
+    configure_cors(app)
+
+    # Add security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
 
+    # Add trusted host middleware for production (last added, so it runs first)
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=["localhost", "127.0.0.1", "your-domain.com", "*"]
+    )
+
 
 def get_application() -> FastAPI:
     """
@@ -92,6 +102,7 @@ def get_application() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         debug=config.get("DEBUG", "False").lower() == "true"
     )
 
@@ -123,6 +134,23 @@ app = get_application()
 handler = Mangum(app)
 
 
+def raise_open_file_limit():
+    """
+    Raise this process's soft open-file limit to the hard limit.
+
+    Every keep-alive client connection and pooled upstream connection (LLM,
+    DynamoDB, validation APIs) holds a file descriptor, and the common 1024
+    default caps concurrency well below what the workers can serve.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows has no RLIMIT_NOFILE
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
 def main():
     """
     Main application entry point.
@@ -132,14 +160,27 @@ def main():
     """
     server_host = config.get("SERVER_HOST", "0.0.0.0")
     server_port = int(config.get("SERVER_PORT", "8000"))
+    # API keys, rate-limit counters and the auth cache live in process memory, so a
+    # single worker is the safe default; set SERVER_WORKERS to opt into more
+    server_workers = int(config.get("SERVER_WORKERS", "1"))
+
+    raise_open_file_limit()
 
-    print(f"Starting MAI Scam Detection API on {server_host}:{server_port}")
+    print(f"Starting MAI Scam Detection API on {server_host}:{server_port} with {server_workers} workers")
     print("Press Ctrl+C to stop the server")
 
+    # Multiple workers need the app as an import string; uvloop is unavailable on Windows
     uvicorn.run(
-        app,
+        "app:app",
         host=server_host,
         port=server_port,
+        workers=server_workers,
+        loop="uvloop" if platform.system() != "Windows" else "auto",
+        http="httptools",
+        backlog=2048,
+        # Outlive the 60s idle timeout of a fronting load balancer, so it never
+        # reuses a connection the server has just closed
+        timeout_keep_alive=75,
         log_level="info"
     )
 
@@ -25,14 +25,20 @@ app.add_event_handler("shutdown", stop_app_handler(app))
 """
 
 import logging
+import anyio.to_thread
 from fastapi import FastAPI
 from typing import Callable
-from setting import Setting
+from setting import get_settings
 from utils.constant import JWT_SECRET_KEY
+from models.clients import AIClients
+from utils.checkerUtils import close_validation_client, ensure_phishtank_database
 
-config = Setting()
+config = get_settings()
 logger = logging.getLogger("Application Initialization")
 
+# Worker threads available to run_in_threadpool (anyio default is 40)
+THREADPOOL_MAX_WORKERS = 200
+
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -117,6 +123,21 @@ def _setup_app_state(app: FastAPI) -> None:
     }
 
 
+# =============================================================================
+# THREADPOOL CONFIGURATION
+# =============================================================================
+
+def _setup_threadpool() -> None:
+    """
+    Raise the default threadpool limit.
+
+    Synchronous crypto and I/O offloaded with run_in_threadpool share
+    anyio's default limiter, which would otherwise cap concurrency at 40.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_MAX_WORKERS
+
+
 # =============================================================================
 # STARTUP HANDLER
 # =============================================================================
@@ -145,6 +166,16 @@ def start_app_handler(app: FastAPI) -> Callable:
             _setup_app_state(app)
             logger.info("Application state initialized")
 
+            # Setup threadpool used by run_in_threadpool
+            _setup_threadpool()
+            logger.info(f"Threadpool limit set to {THREADPOOL_MAX_WORKERS}")
+
+            # Load the PhishTank database before the first URL check needs it
+            if ensure_phishtank_database():
+                logger.info("PhishTank database loaded")
+            else:
+                logger.warning("PhishTank database unavailable; URL checks will retry loading it")
+
             # Log startup information
             logger.info("Authentication middleware enabled")
             logger.info("Rate limiting enabled")
@@ -184,13 +215,14 @@ def stop_app_handler(app: FastAPI) -> Callable:
     Returns:
         Callable: Shutdown event handler function
     """
-    def shutdown() -> None:
+    async def shutdown() -> None:
         """Application shutdown event handler."""
         try:
             logger.info("MAI Scam Detection API shutting down...")
 
-            # Perform cleanup operations here
-            # For example: close database connections, cleanup temporary files, etc.
+            # Close pooled LLM and checker connections
+            await AIClients.close_clients()
+            await close_validation_client()
 
             logger.info("Cleanup operations completed")
             logger.info("MAI Scam Detection API shutdown completed")
@@ -26,10 +26,10 @@ setup_exception_handlers(app)
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
-from datetime import datetime
+from models.customResponse import utc_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +38,7 @@ logger = logging.getLogger(__name__)
 # EXCEPTION HANDLER FUNCTIONS
 # =============================================================================
 
-def not_found_handler(request: Request, exc):
+async def not_found_handler(request: Request, exc):
     """
     Handle 404 errors.
 
@@ -47,21 +47,21 @@ def not_found_handler(request: Request, exc):
         exc: Exception that was raised
 
     Returns:
-        JSONResponse: Standardized 404 error response
+        ORJSONResponse: Standardized 404 error response
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "success": False,
             "error_code": "NOT_FOUND",
             "message": "The requested resource was not found",
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
 
-def internal_error_handler(request: Request, exc):
+async def internal_error_handler(request: Request, exc):
     """
     Handle 500 errors.
 
@@ -70,22 +70,22 @@ def internal_error_handler(request: Request, exc):
         exc: Exception that was raised
 
     Returns:
-        JSONResponse: Standardized 500 error response
+        ORJSONResponse: Standardized 500 error response
     """
     logger.error(f"Internal server error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
             "error_code": "INTERNAL_SERVER_ERROR",
             "message": "An internal server error occurred",
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
 
-def validation_error_handler(request: Request, exc: RequestValidationError):
+async def validation_error_handler(request: Request, exc: RequestValidationError):
     """
     Handle validation errors (422).
 
@@ -94,7 +94,7 @@ def validation_error_handler(request: Request, exc: RequestValidationError):
         exc: RequestValidationError that was raised
 
     Returns:
-        JSONResponse: Standardized validation error response
+        ORJSONResponse: Standardized validation error response
     """
     errors = []
     for error in exc.errors():
@@ -104,7 +104,7 @@ def validation_error_handler(request: Request, exc: RequestValidationError):
             "type": error["type"]
         })
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "success": False,
@@ -112,12 +112,12 @@ def validation_error_handler(request: Request, exc: RequestValidationError):
             "message": "Request validation failed",
             "errors": errors,
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
 
-def http_exception_handler(request: Request, exc: StarletteHTTPException):
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """
     Handle HTTP exceptions.
 
@@ -126,21 +126,21 @@ def http_exception_handler(request: Request, exc: StarletteHTTPException):
         exc: StarletteHTTPException that was raised
 
     Returns:
-        JSONResponse: Standardized HTTP error response
+        ORJSONResponse: Standardized HTTP error response
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error_code": f"HTTP_{exc.status_code}",
             "message": exc.detail,
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
 
-def authentication_error_handler(request: Request, exc: HTTPException):
+async def authentication_error_handler(request: Request, exc: HTTPException):
     """
     Handle authentication errors (401, 403).
 
@@ -149,18 +149,18 @@ def authentication_error_handler(request: Request, exc: HTTPException):
         exc: HTTPException that was raised
 
     Returns:
-        JSONResponse: Standardized authentication error response
+        ORJSONResponse: Standardized authentication error response
     """
     error_code = "UNAUTHORIZED" if exc.status_code == 401 else "FORBIDDEN"
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error_code": error_code,
             "message": exc.detail,
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_timestamp()
         }
     )
 
@@ -219,7 +219,7 @@ def create_error_response(
         "error_code": error_code,
         "message": message,
         "path": path,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": utc_timestamp()
     }
 
     if details:
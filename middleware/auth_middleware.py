@@ -12,7 +12,8 @@ EXPORTED FUNCTIONS:
 1. auth_middleware
 2. require_auth
 3. require_permission
-4. rate_limit_middleware
+4. require_admin_client
+5. rate_limit_middleware
 
 USAGE EXAMPLES:
 --------------
@@ -36,12 +37,17 @@ from datetime import datetime
 import logging
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import Request, HTTPException, Depends
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Callable, Optional
 import time
-from utils.authUtils import authenticate_request, verify_jwt_token, verify_api_key
+from utils.authCache import cached_authenticate
+from models.customResponse import preserialize, resp_static
 from utils.constant import PUBLIC_ENDPOINTS, AUTH_REQUIRED_ENDPOINTS, PERMISSION_PROTECTED_ENDPOINTS, ADMIN_ENDPOINTS
 
+# Fixed error bodies, serialized once at import
+_RATE_LIMITED_BODY = preserialize({"detail": "Rate limit exceeded"})
+_INTERNAL_ERROR_BODY = preserialize({"detail": "Internal server error"})
+
 
 # =============================================================================
 # 1. AUTHENTICATION MIDDLEWARE
@@ -69,14 +75,14 @@ class AuthMiddleware:
 
             try:
                 # Authenticate the request
-                auth_result = authenticate_request(request)
+                auth_result = await cached_authenticate(request)
 
                 # Add authentication info to request state
                 scope["auth"] = auth_result
 
             except HTTPException as e:
                 # Return authentication error
-                response = JSONResponse(
+                response = ORJSONResponse(
                     status_code=e.status_code,
                     content={"detail": e.detail}
                 )
@@ -84,8 +90,8 @@ class AuthMiddleware:
                 return
             except Exception as e:
                 # Get verbosity level from config
-                from setting import Setting
-                config = Setting()
+                from setting import get_settings
+                config = get_settings()
                 debug_verbose = int(config.get("DEBUG_VERBOSE", "2"))
 
                 # Log detailed error information based on verbosity
@@ -104,10 +110,7 @@ class AuthMiddleware:
                         f"Unhandled error in {request.method} {request.url.path}: {str(e)}")
 
                 # Return generic error response
-                response = JSONResponse(
-                    status_code=500,
-                    content={"detail": "Internal server error"}
-                )
+                response = resp_static(_INTERNAL_ERROR_BODY, status_code=500)
                 await response(scope, receive, send)
                 return
 
@@ -155,7 +158,7 @@ async def require_auth(request: Request) -> dict:
     Raises:
         HTTPException: If authentication fails
     """
-    return authenticate_request(request)
+    return await cached_authenticate(request)
 
 
 # =============================================================================
@@ -173,7 +176,7 @@ def require_permission(required_permission: str):
         function: Dependency function that checks permissions
     """
     async def check_permission(request: Request):
-        auth_result = authenticate_request(request)
+        auth_result = await cached_authenticate(request)
         permissions = auth_result.get("permissions", [])
 
         # Check if user has admin permissions (wildcard)
@@ -208,7 +211,7 @@ def require_endpoint_permission():
         # Check if endpoint requires specific permissions
         if path in PERMISSION_PROTECTED_ENDPOINTS:
             required_permissions = PERMISSION_PROTECTED_ENDPOINTS[path]
-            auth_result = authenticate_request(request)
+            auth_result = await cached_authenticate(request)
             user_permissions = auth_result.get("permissions", [])
 
             # Check if user has admin permissions (wildcard)
@@ -225,7 +228,7 @@ def require_endpoint_permission():
             return auth_result
 
         # For endpoints not in PERMISSION_PROTECTED_ENDPOINTS, just require authentication
-        return authenticate_request(request)
+        return await cached_authenticate(request)
 
     return check_endpoint_permission
 
@@ -239,7 +242,7 @@ def require_admin():
     FastAPI dependency that requires admin permissions.
     """
     async def check_admin_permission(request: Request):
-        auth_result = authenticate_request(request)
+        auth_result = await cached_authenticate(request)
         permissions = auth_result.get("permissions", [])
 
         if "*" not in permissions:
@@ -253,6 +256,25 @@ def require_admin():
     return check_admin_permission
 
 
+async def require_admin_client(request: Request) -> dict:
+    """
+    FastAPI dependency that requires an api_client for key management.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        dict: Authentication result
+
+    Raises:
+        HTTPException: If authentication fails or client is not an api_client
+    """
+    auth_result = await cached_authenticate(request)
+    if auth_result["client_type"] != "api_client":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return auth_result
+
+
 # =============================================================================
 # 6. RATE LIMITING MIDDLEWARE
 # =============================================================================
@@ -282,10 +304,7 @@ class RateLimitMiddleware:
                 if client_id and client_type:
                     # Check rate limit
                     if not self._check_rate_limit(client_id, client_type):
-                        response = JSONResponse(
-                            status_code=429,
-                            content={"detail": "Rate limit exceeded"}
-                        )
+                        response = resp_static(_RATE_LIMITED_BODY, status_code=429)
                         await response(scope, receive, send)
                         return
 
@@ -434,8 +453,8 @@ class LoggingMiddleware:
                     status_code = message.get("status", 200)
 
                     # Get verbosity level from config
-                    from setting import Setting
-                    config = Setting()
+                    from setting import get_settings
+                    config = get_settings()
                     debug_verbose = int(config.get("DEBUG_VERBOSE", "2"))
 
                     # Log based on verbosity level
@@ -481,8 +500,5 @@ class ErrorHandlingMiddleware:
                 f"Error in {scope.get('method', 'unknown')} {scope.get('path', 'unknown')}: {str(e)}")
 
             # Return error response
-            response = JSONResponse(
-                status_code=500,
-                content={"detail": "Internal server error"}
-            )
+            response = resp_static(_INTERNAL_ERROR_BODY, status_code=500)
             await response(scope, receive, send)
\ No newline at end of file
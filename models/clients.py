@@ -2,18 +2,26 @@
 External service clients configuration and initialization.
 """
 import os
-from setting import Setting
+import httpx
+from setting import get_settings
 from typing import Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
 from sagemaker.serializers import JSONSerializer
 from sagemaker.deserializers import JSONDeserializer
 from sagemaker.predictor import Predictor
 from sagemaker.session import Session
 import boto3
+from botocore.config import Config as BotoConfig
+from utils.constant import AWS_MAX_POOL_CONNECTIONS
 
 from fastapi import HTTPException
 
-config = Setting()
+config = get_settings()
+
+# Connection pool shared by the Sea-Lion clients (keep-alive avoids a TLS handshake per call);
+# idle connections are kept for 30s rather than httpx's 5s so they survive gaps between requests
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
 
 
 class ClientError(Exception):
@@ -24,12 +32,24 @@ class ClientError(Exception):
 class AIClients:
     """Singleton class to manage AI service clients."""
 
-    _sea_lion_client: Optional[OpenAI] = None
-    _sea_lion_v4_client: Optional[OpenAI] = None
+    _llm_http_client: Optional[httpx.AsyncClient] = None
+    _sea_lion_client: Optional[AsyncOpenAI] = None
+    _sea_lion_v4_client: Optional[AsyncOpenAI] = None
     _sagemaker_predictor: Optional[Predictor] = None
 
     @classmethod
-    def get_sea_lion_client(cls) -> OpenAI:
+    def get_llm_http_client(cls) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client shared by the Sea-Lion clients."""
+        if cls._llm_http_client is None or cls._llm_http_client.is_closed:
+            cls._llm_http_client = httpx.AsyncClient(
+                limits=LLM_HTTP_LIMITS,
+                timeout=LLM_HTTP_TIMEOUT
+            )
+
+        return cls._llm_http_client
+
+    @classmethod
+    def get_sea_lion_client(cls) -> AsyncOpenAI:
         """Get or create Sea-Lion AI client."""
         if cls._sea_lion_client is None:
             api_key = os.getenv("SEA_LION_API_KEY") or config.get(
@@ -38,15 +58,16 @@ class AIClients:
                 raise ClientError(
                     "SEA_LION_API_KEY environment variable not configured")
 
-            cls._sea_lion_client = OpenAI(
+            cls._sea_lion_client = AsyncOpenAI(
                 api_key=api_key,
-                base_url="https://api.sea-lion.ai/v1"
+                base_url="https://api.sea-lion.ai/v1",
+                http_client=cls.get_llm_http_client()
             )
 
         return cls._sea_lion_client
 
     @classmethod
-    def get_sea_lion_v4_client(cls) -> OpenAI:
+    def get_sea_lion_v4_client(cls) -> AsyncOpenAI:
         """Get or create Sea-Lion v4 AI client."""
         if cls._sea_lion_v4_client is None:
             api_key = os.getenv("SEA_LION_API_KEY") or config.get(
@@ -55,9 +76,10 @@ class AIClients:
                 raise ClientError(
                     "SEA_LION_API_KEY environment variable not configured")
 
-            cls._sea_lion_v4_client = OpenAI(
+            cls._sea_lion_v4_client = AsyncOpenAI(
                 api_key=api_key,
-                base_url="https://api.sea-lion.ai/v1"
+                base_url="https://api.sea-lion.ai/v1",
+                http_client=cls.get_llm_http_client()
             )
 
         return cls._sea_lion_v4_client
@@ -84,8 +106,15 @@ class AIClients:
                 region_name=aws_region
             )
             
-            # Create SageMaker session with the boto3 session
-            sagemaker_session = Session(boto_session=boto_session)
+            # Create SageMaker session with the boto3 session; the runtime client's pool is
+            # widened because predictions run concurrently in worker threads
+            sagemaker_session = Session(
+                boto_session=boto_session,
+                sagemaker_runtime_client=boto_session.client(
+                    "sagemaker-runtime",
+                    config=BotoConfig(max_pool_connections=AWS_MAX_POOL_CONNECTIONS)
+                )
+            )
             
             cls._sagemaker_predictor = Predictor(
                 endpoint_name=endpoint_name,
@@ -99,14 +128,22 @@ class AIClients:
     @classmethod
     def reset_clients(cls):
         """Reset all clients (useful for testing)."""
+        cls._llm_http_client = None
         cls._sea_lion_client = None
         cls._sea_lion_v4_client = None
         cls._sagemaker_predictor = None
 
+    @classmethod
+    async def close_clients(cls):
+        """Close pooled connections and reset all clients (call on shutdown)."""
+        if cls._llm_http_client is not None:
+            await cls._llm_http_client.aclose()
+        cls.reset_clients()
+
 
 
 
-def get_sea_lion_client() -> OpenAI:
+def get_sea_lion_client() -> AsyncOpenAI:
     """Get Sea-Lion AI client instance."""
     try:
         return AIClients.get_sea_lion_client()
@@ -114,7 +151,7 @@ def get_sea_lion_client() -> OpenAI:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_sea_lion_v4_client() -> OpenAI:
+def get_sea_lion_v4_client() -> AsyncOpenAI:
     """Get Sea-Lion v4 AI client instance."""
     try:
         return AIClients.get_sea_lion_v4_client()
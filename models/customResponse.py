@@ -15,8 +15,14 @@ EXPORTED FUNCTIONS:
 4. resp_401 - Unauthorized response
 5. resp_403 - Forbidden response
 6. resp_404 - Not found response
-5. resp_429 - Rate limit exceeded response
-6. resp_500 - Internal server error response
+7. resp_429 - Rate limit exceeded response
+8. resp_500 - Internal server error response
+9. preserialize - Serialize a static payload once at import
+10. resp_static - Response for a preserialized payload
+11. body_etag - ETag for a preserialized payload
+12. etag_matches - Check an If-None-Match header against an ETag
+13. resp_static_etag - Preserialized payload with ETag, or 304 when unchanged
+14. utc_timestamp - Current UTC timestamp, formatted at most once per second
 
 RESPONSE MODELS:
 ---------------
@@ -35,6 +41,14 @@ return resp_200(data=result, message="Analysis completed successfully")
 # Error response
 return resp_400(message="Invalid input data", details={"field": "error"})
 
+# Static response (payload serialized once at import)
+_HEALTH_BODY = preserialize({"status": "OK"})
+return resp_static(_HEALTH_BODY)
+
+# Static response answering repeat requests with 304 Not Modified
+_HEALTH_ETAG = body_etag(_HEALTH_BODY)
+return resp_static_etag(request.headers.get("if-none-match"), _HEALTH_BODY, _HEALTH_ETAG)
+
 # Analysis response
 return AnalysisResponse(
     success=True,
@@ -43,10 +57,43 @@ return AnalysisResponse(
 )
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Tuple
 from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, Response
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
+import orjson
+import xxhash
+import time
+
+# Last formatted response timestamp as (epoch second, ISO 8601 string)
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Convert values orjson cannot serialize natively, such as Decimal from DynamoDB.
+
+    Args:
+        obj: Value orjson could not serialize
+
+    Returns:
+        int or float: Decimal converted to int when integral, float otherwise
+
+    Raises:
+        TypeError: If obj is not a supported type
+    """
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _APIJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes Decimal values read back from DynamoDB."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
 
 
 # =============================================================================
@@ -297,7 +344,23 @@ class RateLimitResponse(BaseModel):
 # HELPER FUNCTIONS FOR COMMON RESPONSES
 # =============================================================================
 
-def resp_200(data: Optional[Dict[str, Any]] = None, message: str = "Success") -> Dict[str, Any]:
+def utc_timestamp() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with second precision.
+
+    The string is formatted at most once per second and reused in between.
+
+    Returns:
+        str: Timestamp such as "2025-01-16T12:00:00Z"
+    """
+    global _last_timestamp
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _last_timestamp[1]
+
+
+def resp_200(data: Optional[Dict[str, Any]] = None, message: str = "Success") -> ORJSONResponse:
     """
     Create a standard 200 OK response.
 
@@ -306,18 +369,21 @@ def resp_200(data: Optional[Dict[str, Any]] = None, message: str = "Success") ->
         message: Success message
 
     Returns:
-        dict: Standardized success response
-    """
-    return {
-        "success": True,
-        "message": message,
-        "data": data,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 200
-    }
+        ORJSONResponse: Standardized success response
+    """
+    return _APIJSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "message": message,
+            "data": data,
+            "timestamp": utc_timestamp(),
+            "status_code": 200
+        }
+    )
 
 
-def resp_201(data: Optional[Dict[str, Any]] = None, message: str = "Created successfully") -> Dict[str, Any]:
+def resp_201(data: Optional[Dict[str, Any]] = None, message: str = "Created successfully") -> ORJSONResponse:
     """
     Create a standard 201 Created response.
 
@@ -326,18 +392,21 @@ def resp_201(data: Optional[Dict[str, Any]] = None, message: str = "Created succ
         message: Success message
 
     Returns:
-        dict: Standardized created response
-    """
-    return {
-        "success": True,
-        "message": message,
-        "data": data,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 201
-    }
+        ORJSONResponse: Standardized created response
+    """
+    return _APIJSONResponse(
+        status_code=201,
+        content={
+            "success": True,
+            "message": message,
+            "data": data,
+            "timestamp": utc_timestamp(),
+            "status_code": 201
+        }
+    )
 
 
-def resp_400(message: str = "Bad request", details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def resp_400(message: str = "Bad request", details: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
     """
     Create a standard 400 Bad Request response.
 
@@ -346,19 +415,22 @@ def resp_400(message: str = "Bad request", details: Optional[Dict[str, Any]] = N
         details: Additional error details
 
     Returns:
-        dict: Standardized bad request response
-    """
-    return {
-        "success": False,
-        "error_code": "BAD_REQUEST",
-        "message": message,
-        "details": details,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 400
-    }
+        ORJSONResponse: Standardized bad request response
+    """
+    return _APIJSONResponse(
+        status_code=400,
+        content={
+            "success": False,
+            "error_code": "BAD_REQUEST",
+            "message": message,
+            "details": details,
+            "timestamp": utc_timestamp(),
+            "status_code": 400
+        }
+    )
 
 
-def resp_401(message: str = "Unauthorized", details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def resp_401(message: str = "Unauthorized", details: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
     """
     Create a standard 401 Unauthorized response.
 
@@ -367,19 +439,22 @@ def resp_401(message: str = "Unauthorized", details: Optional[Dict[str, Any]] =
         details: Additional error details
 
     Returns:
-        dict: Standardized unauthorized response
-    """
-    return {
-        "success": False,
-        "error_code": "UNAUTHORIZED",
-        "message": message,
-        "details": details,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 401
-    }
+        ORJSONResponse: Standardized unauthorized response
+    """
+    return _APIJSONResponse(
+        status_code=401,
+        content={
+            "success": False,
+            "error_code": "UNAUTHORIZED",
+            "message": message,
+            "details": details,
+            "timestamp": utc_timestamp(),
+            "status_code": 401
+        }
+    )
 
 
-def resp_403(message: str = "Forbidden", details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def resp_403(message: str = "Forbidden", details: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
     """
     Create a standard 403 Forbidden response.
 
@@ -388,19 +463,22 @@ def resp_403(message: str = "Forbidden", details: Optional[Dict[str, Any]] = Non
         details: Additional error details
 
     Returns:
-        dict: Standardized forbidden response
-    """
-    return {
-        "success": False,
-        "error_code": "FORBIDDEN",
-        "message": message,
-        "details": details,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 403
-    }
+        ORJSONResponse: Standardized forbidden response
+    """
+    return _APIJSONResponse(
+        status_code=403,
+        content={
+            "success": False,
+            "error_code": "FORBIDDEN",
+            "message": message,
+            "details": details,
+            "timestamp": utc_timestamp(),
+            "status_code": 403
+        }
+    )
 
 
-def resp_404(message: str = "Not found", details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def resp_404(message: str = "Not found", details: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
     """
     Create a standard 404 Not Found response.
 
@@ -409,19 +487,22 @@ def resp_404(message: str = "Not found", details: Optional[Dict[str, Any]] = Non
         details: Additional error details
 
     Returns:
-        dict: Standardized not found response
-    """
-    return {
-        "success": False,
-        "error_code": "NOT_FOUND",
-        "message": message,
-        "details": details,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 404
-    }
+        ORJSONResponse: Standardized not found response
+    """
+    return _APIJSONResponse(
+        status_code=404,
+        content={
+            "success": False,
+            "error_code": "NOT_FOUND",
+            "message": message,
+            "details": details,
+            "timestamp": utc_timestamp(),
+            "status_code": 404
+        }
+    )
 
 
-def resp_429(limit: int, remaining: int, reset_time: str, client_id: str, client_type: str) -> Dict[str, Any]:
+def resp_429(limit: int, remaining: int, reset_time: str, client_id: str, client_type: str) -> ORJSONResponse:
     """
     Create a standard 429 Too Many Requests response.
 
@@ -433,25 +514,28 @@ def resp_429(limit: int, remaining: int, reset_time: str, client_id: str, client
         client_type: Client type
 
     Returns:
-        dict: Standardized rate limit response
-    """
-    return {
-        "success": False,
-        "error_code": "RATE_LIMIT_EXCEEDED",
-        "message": "Rate limit exceeded",
-        "data": {
-            "limit": limit,
-            "remaining": remaining,
-            "reset_time": reset_time,
-            "client_id": client_id,
-            "client_type": client_type
-        },
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 429
-    }
+        ORJSONResponse: Standardized rate limit response
+    """
+    return _APIJSONResponse(
+        status_code=429,
+        content={
+            "success": False,
+            "error_code": "RATE_LIMIT_EXCEEDED",
+            "message": "Rate limit exceeded",
+            "data": {
+                "limit": limit,
+                "remaining": remaining,
+                "reset_time": reset_time,
+                "client_id": client_id,
+                "client_type": client_type
+            },
+            "timestamp": utc_timestamp(),
+            "status_code": 429
+        }
+    )
 
 
-def resp_500(message: str = "Internal server error", details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def resp_500(message: str = "Internal server error", details: Optional[Dict[str, Any]] = None) -> ORJSONResponse:
     """
     Create a standard 500 Internal Server Error response.
 
@@ -460,16 +544,102 @@ def resp_500(message: str = "Internal server error", details: Optional[Dict[str,
         details: Additional error details
 
     Returns:
-        dict: Standardized server error response
+        ORJSONResponse: Standardized server error response
+    """
+    return _APIJSONResponse(
+        status_code=500,
+        content={
+            "success": False,
+            "error_code": "INTERNAL_SERVER_ERROR",
+            "message": message,
+            "details": details,
+            "timestamp": utc_timestamp(),
+            "status_code": 500
+        }
+    )
+
+
+def preserialize(content: Dict[str, Any]) -> bytes:
     """
-    return {
-        "success": False,
-        "error_code": "INTERNAL_SERVER_ERROR",
-        "message": message,
-        "details": details,
-        "timestamp": datetime.utcnow().isoformat(),
-        "status_code": 500
-    }
+    Serialize a static response payload once, typically at import time.
+
+    Args:
+        content: JSON-serializable response payload
+
+    Returns:
+        bytes: Serialized JSON body for resp_static
+    """
+    return orjson.dumps(content, default=_orjson_default)
+
+
+def resp_static(body: bytes, status_code: int = 200) -> Response:
+    """
+    Create a response for a preserialized payload without rebuilding or re-encoding it.
+
+    A new Response is built per call because middleware appends headers to the
+    response's header list in place, so Response objects cannot be shared.
+
+    Args:
+        body: Serialized JSON body from preserialize
+        status_code: HTTP status code
+
+    Returns:
+        Response: JSON response with the given body
+    """
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a preserialized payload, typically at import time.
+
+    Args:
+        body: Serialized JSON body from preserialize
+
+    Returns:
+        str: Quoted ETag value
+    """
+    return f'"{xxhash.xxh3_64_hexdigest(body)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header (a single tag, a tag list, weak tags or *) against etag.
+
+    Tags are compared weakly as If-None-Match requires, so etag may itself be weak.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client already holds the current representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match == etag:
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") in (opaque_tag, "*") for tag in if_none_match.split(","))
+
+
+def resp_static_etag(if_none_match: Optional[str], body: bytes, etag: str) -> Response:
+    """
+    Create a response for a preserialized payload, or an empty 304 if the client has it.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        body: Serialized JSON body from preserialize
+        etag: ETag of body from body_etag
+
+    Returns:
+        Response: 304 Not Modified, or the JSON body with its ETag header
+    """
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response = resp_static(body)
+    response.headers["ETag"] = etag
+    return response
 
 
 # =============================================================================
@@ -520,7 +690,7 @@ def analysis_success_response(
             "request_id": request_id,
             "reused": reused
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_timestamp()
     }
 
 
@@ -562,7 +732,7 @@ def translation_success_response(
         "metadata": {
             "request_id": request_id
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_timestamp()
     }
 
 
@@ -597,7 +767,7 @@ def auth_success_response(
             "method": method,
             "expires_at": expires_at
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_timestamp()
     }
 
 
@@ -628,9 +798,9 @@ def health_success_response(
             "version": version,
             "uptime": uptime,
             "components": components or {},
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_timestamp()
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_timestamp()
     }
 
 
@@ -654,7 +824,7 @@ def validation_error_response(field_errors: Dict[str, str]) -> Dict[str, Any]:
         "message": "Validation failed",
         "details": {"field_errors": field_errors},
         "suggestions": ["Check the input data format", "Ensure all required fields are provided"],
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_timestamp(),
         "status_code": 400
     }
 
@@ -676,7 +846,7 @@ def database_error_response(operation: str, details: Optional[str] = None) -> Di
         "message": f"Database operation failed: {operation}",
         "details": {"operation": operation, "details": details},
         "suggestions": ["Try again later", "Contact support if the problem persists"],
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_timestamp(),
         "status_code": 500
     }
 
@@ -698,7 +868,7 @@ def llm_error_response(operation: str, details: Optional[str] = None) -> Dict[st
         "message": f"Language model operation failed: {operation}",
         "details": {"operation": operation, "details": details},
         "suggestions": ["Try again later", "Check input content", "Contact support if the problem persists"],
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_timestamp(),
         "status_code": 500
     }
 
@@ -723,6 +893,6 @@ def permission_error_response(required_permission: str, client_permissions: List
             "client_permissions": client_permissions
         },
         "suggestions": ["Contact administrator to request additional permissions"],
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_timestamp(),
         "status_code": 403
     }
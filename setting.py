@@ -1,6 +1,7 @@
 import os
 import yaml
 import re
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -41,6 +42,17 @@ def Setting() -> dict:
     return config
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> dict:
+    """
+    Return the process-wide configuration, loading it on first use.
+
+    Setting() re-reads .env and the environment YAML on every call; modules and
+    per-request middleware share this single loaded copy instead.
+    """
+    return Setting()
+
+
 def _substitute_env_variables(yaml_content: str) -> str:
     """
     Substitute ${VARIABLE_NAME} patterns in YAML content with environment variable values
@@ -0,0 +1,46 @@
+"""
+Tests for models/customResponse.py
+
+Items read back from DynamoDB carry numbers as Decimal, which orjson cannot
+serialize natively. These tests check that the response helpers still encode
+such payloads.
+"""
+
+from decimal import Decimal
+
+import orjson
+
+from models.customResponse import preserialize, resp_200, resp_404
+
+
+# =============================================================================
+# 1. DECIMAL SERIALIZATION
+# =============================================================================
+
+def test_resp_200_serializes_decimal_payload():
+    data = {
+        "risk_level": "high",
+        "confidence_score": Decimal("0.85"),
+        "signals": {"count": Decimal("3")},
+        "scores": [Decimal("1"), Decimal("2.5")],
+    }
+
+    response = resp_200(data=data)
+
+    assert response.status_code == 200
+    body = orjson.loads(response.body)
+    assert body["data"]["confidence_score"] == 0.85
+    assert body["data"]["signals"]["count"] == 3
+    assert isinstance(body["data"]["signals"]["count"], int)
+    assert body["data"]["scores"] == [1, 2.5]
+
+
+def test_error_response_serializes_decimal_details():
+    response = resp_404(details={"ttl": Decimal("1700000000")})
+
+    assert response.status_code == 404
+    assert orjson.loads(response.body)["details"] == {"ttl": 1700000000}
+
+
+def test_preserialize_serializes_decimal_payload():
+    assert orjson.loads(preserialize({"value": Decimal("4.25")})) == {"value": 4.25}
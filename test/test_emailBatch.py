@@ -0,0 +1,56 @@
+"""
+Tests for the batch email analyze endpoint in apis/email.py
+
+The DynamoDB lookup and the analysis pipeline are replaced with in-memory
+fakes, so only the batch deduplication and result fan-out are exercised.
+"""
+
+import asyncio
+
+import orjson
+from fastapi import BackgroundTasks
+
+import apis.email as email_api
+from apis.email import EmailAnalysisRequest, detect_batch_v1
+
+
+# =============================================================================
+# 1. DEDUPLICATION BY CONTENT AND TARGET LANGUAGE
+# =============================================================================
+
+def test_batch_same_content_in_two_languages(monkeypatch):
+    calls = []
+
+    async def find_results_by_hashes(content_hashes):
+        return {content_hash: None for content_hash in content_hashes}
+
+    async def run_email_analysis(subject, content, from_email, reply_to_email, target_language, **kwargs):
+        calls.append(target_language)
+        return {
+            "risk_level": "high",
+            "analysis": f"analysis in {target_language}",
+            "recommended_action": f"action in {target_language}",
+            "detected_language": "en",
+        }
+
+    monkeypatch.setattr(email_api, "find_results_by_hashes", find_results_by_hashes)
+    monkeypatch.setattr(email_api, "run_email_analysis", run_email_analysis)
+
+    requests = [
+        EmailAnalysisRequest(subject="Prize", content="Claim now", from_email="a@b.com", target_language="en"),
+        EmailAnalysisRequest(subject="Prize", content="Claim now", from_email="a@b.com", target_language="zh"),
+        EmailAnalysisRequest(subject="Prize", content="Claim now", from_email="a@b.com", target_language="en"),
+    ]
+    background_tasks = BackgroundTasks()
+
+    response = asyncio.run(detect_batch_v1(background_tasks=background_tasks, requests=requests))
+
+    data = orjson.loads(response.body)["data"]
+
+    assert sorted(calls) == ["en", "zh"]
+    assert [item["reasons"] for item in data] == [
+        "analysis in en",
+        "analysis in zh",
+        "analysis in en",
+    ]
+    assert len(background_tasks.tasks) == 2
@@ -0,0 +1,207 @@
+"""
+Authentication Cache Utilities for MAI Scam Detection System
+
+This module provides a short-lived in-process cache in front of request
+authentication, so that clients presenting the same JWT token or API key
+repeatedly within a few seconds skip signature verification and key lookup.
+Concurrent misses for the same credential are collapsed behind a per-credential
+asyncio.Lock, so a burst of requests with a new token verifies it only once.
+
+TABLE OF CONTENTS:
+==================
+
+EXPORTED FUNCTIONS:
+------------------
+1. cached_authenticate
+2. invalidate_credential
+3. invalidate_client
+
+USAGE EXAMPLES:
+--------------
+# Authenticate request (cached)
+auth_result = await cached_authenticate(request)
+
+# Drop cached entry after revoking an API key
+invalidate_credential(api_key)
+
+# Drop cached entries after updating a client's permissions
+invalidate_client("chatbot_v1")
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Dict, Optional
+from cachetools import TTLCache
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from utils.authUtils import authenticate_request
+
+# Cache configuration
+AUTH_CACHE_MAXSIZE = 10000
+AUTH_CACHE_TTL_SECONDS = 30
+
+# Cached authentication results keyed by sha256(credential)
+_token_cache = TTLCache(maxsize=AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
+# Locks for credentials currently being verified, keyed like _token_cache
+_verify_locks: Dict[bytes, asyncio.Lock] = {}
+
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def _credential_key(credential: str) -> bytes:
+    """
+    Build the cache key for a raw credential.
+
+    Args:
+        credential: Raw JWT token or API key
+
+    Returns:
+        bytes: SHA-256 digest of the credential
+    """
+    return hashlib.sha256(credential.encode()).digest()
+
+
+def _extract_credential(request: Request) -> Optional[str]:
+    """
+    Extract the raw credential from the request headers.
+
+    Mirrors the lookup order of authenticate_request: JWT token in the
+    Authorization header first, then API key in the X-API-Key header.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        str: Raw credential if present, None otherwise
+    """
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        return auth_header.split(" ")[1]
+    return request.headers.get("X-API-Key")
+
+
+def _cached_result(key: bytes) -> Optional[Dict]:
+    """
+    Get a cached authentication result that has not expired yet.
+
+    Args:
+        key: Cache key from _credential_key
+
+    Returns:
+        dict: Cached authentication result, None if missing or expired
+    """
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    auth_result, expires_at = entry
+    if expires_at > time.time():
+        return auth_result
+    _token_cache.pop(key, None)
+    return None
+
+
+def _entry_ttl(auth_result: Dict) -> float:
+    """
+    Compute how long an authentication result may stay cached.
+
+    JWT results never outlive the token expiry.
+
+    Args:
+        auth_result: Result returned by authenticate_request
+
+    Returns:
+        float: Time to live in seconds
+    """
+    exp = auth_result.get("payload", {}).get("exp")
+    if exp is None:
+        return AUTH_CACHE_TTL_SECONDS
+    return min(AUTH_CACHE_TTL_SECONDS, exp - time.time())
+
+
+# =============================================================================
+# 1. CACHED REQUEST AUTHENTICATION FUNCTION
+# =============================================================================
+
+async def cached_authenticate(request: Request) -> Dict:
+    """
+    Authenticate a request, reusing a recent result for the same credential.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        dict: Authentication result with client information
+
+    Raises:
+        HTTPException: If authentication fails
+
+    Example:
+        auth_result = await cached_authenticate(request)
+    """
+    credential = _extract_credential(request)
+    if not credential:
+        # Let authenticate_request raise the standard 401
+        return await run_in_threadpool(authenticate_request, request)
+
+    key = _credential_key(credential)
+    auth_result = _cached_result(key)
+    if auth_result is not None:
+        return auth_result
+
+    # Verification awaits a worker thread, so concurrent misses for this credential
+    # wait on one lock and reuse the first request's result instead of verifying again
+    lock = _verify_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            auth_result = _cached_result(key)
+            if auth_result is not None:
+                return auth_result
+
+            # Signature verification is CPU-bound; keep it off the event loop
+            auth_result = await run_in_threadpool(authenticate_request, request)
+
+            ttl = _entry_ttl(auth_result)
+            if ttl > 0:
+                _token_cache[key] = (auth_result, time.time() + ttl)
+
+            return auth_result
+    finally:
+        # Requests already waiting keep their reference; new misses start a fresh lock
+        if _verify_locks.get(key) is lock:
+            del _verify_locks[key]
+
+
+# =============================================================================
+# 2. CACHE INVALIDATION FUNCTIONS
+# =============================================================================
+
+def invalidate_credential(credential: str) -> None:
+    """
+    Remove the cached result for a raw credential.
+
+    Args:
+        credential: Raw JWT token or API key
+    """
+    _token_cache.pop(_credential_key(credential), None)
+
+
+def invalidate_client(client_id: str) -> None:
+    """
+    Remove cached API key results belonging to a client.
+
+    JWT results are left in place since their permissions are embedded in
+    the signed token itself.
+
+    Args:
+        client_id: Client identifier
+    """
+    stale_keys = [
+        key for key, (auth_result, _) in list(_token_cache.items())
+        if auth_result.get("method") == "api_key" and auth_result.get("client_id") == client_id
+    ]
+    for key in stale_keys:
+        _token_cache.pop(key, None)
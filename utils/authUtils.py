@@ -54,7 +54,7 @@ import json
 import os
 from utils.constant import (
     JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRY_HOURS,
-    API_KEY_LENGTH, API_KEY_PREFIX, CLIENT_TYPES
+    API_KEY_LENGTH, API_KEY_PREFIX, CLIENT_TYPES, DEFAULT_PERMISSIONS
 )
 
 # In-memory storage for API keys (in production, use database)
@@ -154,7 +154,7 @@ def create_jwt_token(client_id: str, client_type: str, permissions: List[str] =
         )
     """
     if permissions is None:
-        permissions = CLIENT_TYPES.get(client_type, {}).get("permissions", [])
+        permissions = list(DEFAULT_PERMISSIONS.get(client_type, ()))
 
     payload = {
         "client_id": client_id,
@@ -250,7 +250,7 @@ def create_api_key(client_id: str, client_type: str, permissions: List[str] = No
         )
     """
     if permissions is None:
-        permissions = CLIENT_TYPES.get(client_type, {}).get("permissions", [])
+        permissions = list(DEFAULT_PERMISSIONS.get(client_type, ()))
 
     # Generate API key
     api_key = _generate_api_key()
@@ -6,21 +6,168 @@ against various validation services and databases. Designed to be modular
 and reusable across different API endpoints.
 """
 
+import asyncio
+import httpx
 import requests
+import threading
+from cachetools import TTLCache
 import json
+import orjson
 import re
 import gzip
 import os
 from typing import Dict, List, Optional, Tuple
 import logging
 
-from setting import Setting
+from setting import get_settings
 
-config = Setting()
+config = get_settings()
 
 # Global variable to store phish data (for endpoint efficiency)
 _phish_data = None
 
+# Extraction patterns, compiled once at import
+# URLs with protocol - strict ASCII-only, stopping at non-ASCII characters (Chinese, Thai, Vietnamese, etc.)
+_URL_RE = re.compile(r'http[s]?://[a-zA-Z0-9._~:/?#\[\]@!$&\'()*+,;=%-]+(?=[\s\u00A0\u4e00-\u9fff\u0e00-\u0e7f\u1ea0-\u1ef9]|$)')
+_URL_TRAILING_PUNCT_RE = re.compile(r'[,;!?.\u00A0]+$')
+_URL_TRAILING_MALAY_RE = re.compile(r'(Sekiranya|sekiranya|anda|Anda|jika|Jika|untuk|Untuk|dengan|Dengan)$')
+_URL_TRAILING_THAI_RE = re.compile(r'(khrap|kha|dai|mai|thii|nai|kap|laew)$')
+_URL_TRAILING_VIETNAMESE_RE = re.compile(r'(neu|va|hoac|thi|cua|cho|trong|voi)$')
+_URL_TRAILING_PINYIN_RE = re.compile(r'(ruguo|jiushi|weile|yinwei|suoyi|danshi|zhege|nage)$')
+_URL_NON_ASCII_END_RE = re.compile(r'[\u00A0\u4e00-\u9fff\u0e00-\u0e7f\u1ea0-\u1ef9]$')
+_URL_ASCII_RUN_RE = re.compile(r'([a-zA-Z0-9._~:/?#\[\]@!$&\'()*+,;=%-]+)')
+# Domains without protocol - only if it looks like a real domain (not random words with dots)
+_DOMAIN_RE = re.compile(r'(?:^|\s|[\[\(])(?:www\.)?([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z]{2,})+)(?=\s|$|[\]\)]|[.,!?])', re.MULTILINE)
+# Emails with boundary detection for multilingual text
+_EMAIL_RE = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}(?![A-Za-z0-9._%+-])', re.IGNORECASE)
+_EMAIL_FULL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$', re.IGNORECASE)
+# Phone number formats; word boundaries prevent capturing numbers that are part of non-English text
+_PHONE_RES = (
+    re.compile(r'(?<!\d)\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}(?!\d)'),  # International format
+    re.compile(r'(?<!\d)\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)'),  # (123) 456-7890
+    re.compile(r'(?<!\d)\d{3}[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)'),      # 123-456-7890 or 123.456.7890
+    re.compile(r'(?<!\d)\d{10,15}(?!\d)'),                          # Simple long number
+)
+_PHONE_FULL_RE = re.compile(r'^[\+\d\(\)\-\.\s]{7,20}$')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+# Cheap prefilter: every URL, domain, email or phone number the extractors can return contains one of these
+_ARTIFACT_HINT_RE = re.compile(r'://|@|\d|[A-Za-z0-9]\.[A-Za-z]{2}')
+
+# PhishTank entries keyed by normalized URL, rebuilt whenever _phish_data is loaded
+_phish_index: Dict[str, Dict] = {}
+# Serializes database loads, so concurrent checker threads on a cold start load it once
+_phish_load_lock = threading.Lock()
+
+# Validation results keyed by normalized email / phone (only successful lookups are cached)
+VALIDATION_CACHE_MAXSIZE = 20000
+VALIDATION_CACHE_TTL_SECONDS = 3600
+_email_validation_cache = TTLCache(maxsize=VALIDATION_CACHE_MAXSIZE, ttl=VALIDATION_CACHE_TTL_SECONDS)
+_phone_validation_cache = TTLCache(maxsize=VALIDATION_CACHE_MAXSIZE, ttl=VALIDATION_CACHE_TTL_SECONDS)
+# Sync checkers run in worker threads, so cache access is serialized
+_validation_cache_lock = threading.Lock()
+
+# Email / phone validation service
+VALIDATION_API_URL = "https://validation-aws.silverlining.cloud"
+VALIDATION_TIMEOUT_SECONDS = 10
+
+# Keep-alive connection pool shared by the async validation checks
+_validation_client: Optional[httpx.AsyncClient] = None
+
+# =============================================================================
+# 0. SHARED VALIDATION HTTP CLIENT
+# =============================================================================
+
+def get_validation_client() -> httpx.AsyncClient:
+    """
+    Get or create the pooled HTTP client used by the async validation checks.
+    
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _validation_client
+    if _validation_client is None or _validation_client.is_closed:
+        _validation_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(VALIDATION_TIMEOUT_SECONDS, connect=5.0)
+        )
+    return _validation_client
+
+async def close_validation_client() -> None:
+    """
+    Close the pooled validation HTTP client (call on shutdown).
+    """
+    global _validation_client
+    if _validation_client is not None:
+        await _validation_client.aclose()
+        _validation_client = None
+
+def _validation_headers(api_key: str) -> Dict:
+    """
+    Build request headers for the validation service.
+    
+    Args:
+        api_key: API key for validation service
+        
+    Returns:
+        Request headers
+    """
+    return {
+        'x-api-key': api_key,
+        'Content-Type': 'application/json'
+    }
+
+def _no_api_key_result(field: str, value: str) -> Dict:
+    """
+    Build the result returned when no validation API key is configured.
+    
+    Args:
+        field: Result key for the checked value ('email' or 'phone')
+        value: Email address or phone number that was not checked
+        
+    Returns:
+        Dictionary with validation results
+    """
+    return {
+        field: value,
+        'is_valid': None,
+        'error': 'No API key configured for validation service',
+        'confidence': 'unknown'
+    }
+
+def _cached_validation(cache: TTLCache, key: str) -> Optional[Dict]:
+    """
+    Get a cached validation result.
+    
+    Args:
+        cache: Validation result cache
+        key: Normalized email or phone number
+        
+    Returns:
+        Cached result, or None if not cached
+    """
+    with _validation_cache_lock:
+        return cache.get(key)
+
+def _cache_validation(cache: TTLCache, key: str, result: Dict) -> Dict:
+    """
+    Cache a validation result if the lookup succeeded.
+    
+    Errors (missing API key, API failures) are not cached so they are retried.
+    
+    Args:
+        cache: Validation result cache
+        key: Normalized email or phone number
+        result: Validation result
+        
+    Returns:
+        The same result
+    """
+    if result.get('confidence') == 'high':
+        with _validation_cache_lock:
+            cache[key] = result
+    return result
+
 # =============================================================================
 # 1. URL EXTRACTION AND PHISHING CHECK
 # =============================================================================
@@ -41,33 +188,32 @@ def extract_urls_from_text(text: str) -> List[str]:
     # Primary pattern for URLs with protocol - strict ASCII-only URLs
     # This pattern only captures standard ASCII characters used in URLs
     # and stops at non-ASCII characters (Chinese, Thai, Vietnamese, etc.)
-    url_pattern = r'http[s]?://[a-zA-Z0-9._~:/?#\[\]@!$&\'()*+,;=%-]+(?=[\s\u00A0\u4e00-\u9fff\u0e00-\u0e7f\u1ea0-\u1ef9]|$)'
-    urls = re.findall(url_pattern, text)
+    urls = _URL_RE.findall(text) if 'http' in text else []
     logging.info(f"URLs found with http/https pattern: {urls}")
     
     # Clean up URLs to remove trailing punctuation and non-English words
     cleaned_urls = []
     for url in urls:
         # Remove trailing punctuation
-        cleaned_url = re.sub(r'[,;!?.\u00A0]+$', '', url)
+        cleaned_url = _URL_TRAILING_PUNCT_RE.sub('', url)
         
         # Remove common words from various languages that might be attached
         # Malay/Indonesian
-        cleaned_url = re.sub(r'(Sekiranya|sekiranya|anda|Anda|jika|Jika|untuk|Untuk|dengan|Dengan)$', '', cleaned_url)
+        cleaned_url = _URL_TRAILING_MALAY_RE.sub('', cleaned_url)
         # Thai common words (transliterated)
-        cleaned_url = re.sub(r'(khrap|kha|dai|mai|thii|nai|kap|laew)$', '', cleaned_url, re.IGNORECASE)
+        cleaned_url = _URL_TRAILING_THAI_RE.sub('', cleaned_url)
         # Vietnamese common words
-        cleaned_url = re.sub(r'(neu|va|hoac|thi|cua|cho|trong|voi)$', '', cleaned_url, re.IGNORECASE)
+        cleaned_url = _URL_TRAILING_VIETNAMESE_RE.sub('', cleaned_url)
         # Chinese pinyin common words
-        cleaned_url = re.sub(r'(ruguo|jiushi|weile|yinwei|suoyi|danshi|zhege|nage)$', '', cleaned_url, re.IGNORECASE)
+        cleaned_url = _URL_TRAILING_PINYIN_RE.sub('', cleaned_url)
         
         # Remove trailing slashes and clean up
         cleaned_url = cleaned_url.rstrip('/')
         
         # Remove any URLs that end with non-ASCII characters (safety check)
-        if re.search(r'[\u00A0\u4e00-\u9fff\u0e00-\u0e7f\u1ea0-\u1ef9]$', cleaned_url):
+        if _URL_NON_ASCII_END_RE.search(cleaned_url):
             # Find the last ASCII character and truncate there
-            match = re.search(r'([a-zA-Z0-9._~:/?#\[\]@!$&\'()*+,;=%-]+)', cleaned_url)
+            match = _URL_ASCII_RUN_RE.search(cleaned_url)
             if match:
                 cleaned_url = match.group(1).rstrip('/')
         
@@ -84,8 +230,7 @@ def extract_urls_from_text(text: str) -> List[str]:
     
     # More restrictive pattern for domains without protocol 
     # Only match if it looks like a real domain (not random words with dots)
-    domain_pattern = r'(?:^|\s|[\[\(])(?:www\.)?([a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z]{2,})+)(?=\s|$|[\]\)]|[.,!?])'
-    potential_domains = re.findall(domain_pattern, text, re.MULTILINE)
+    potential_domains = _DOMAIN_RE.findall(text) if '.' in text else []
     logging.info(f"Potential domains found: {potential_domains}")
     
     # Add http:// prefix to potential domains, but be more selective
@@ -115,15 +260,13 @@ def load_phishtank_database(force_download: bool = False, app_key: Optional[str]
     Returns:
         True if database loaded successfully, False otherwise
     """
-    global _phish_data
-    
     local_file = 'phishtank_data.json'
     
     # Try to load from local file first (unless forced to download)
     if not force_download and os.path.exists(local_file):
         try:
-            with open(local_file, 'r') as f:
-                _phish_data = json.load(f)
+            with open(local_file, 'rb') as f:
+                _publish_phish_data(orjson.loads(f.read()))
             logging.info(f"Loaded {len(_phish_data)} phishing URLs from local database")
             return True
         except Exception as e:
@@ -144,13 +287,12 @@ def load_phishtank_database(force_download: bool = False, app_key: Optional[str]
         response = requests.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         
-        # Decompress and parse
-        data = gzip.decompress(response.content).decode('utf-8')
-        _phish_data = json.loads(data)
+        # Decompress and parse (orjson takes the UTF-8 bytes directly)
+        _publish_phish_data(orjson.loads(gzip.decompress(response.content)))
         
         # Save to local file
-        with open(local_file, 'w') as f:
-            json.dump(_phish_data, f, indent=2)
+        with open(local_file, 'wb') as f:
+            f.write(orjson.dumps(_phish_data, option=orjson.OPT_INDENT_2))
         
         logging.info(f"Successfully downloaded {len(_phish_data)} phishing URLs")
         return True
@@ -159,6 +301,39 @@ def load_phishtank_database(force_download: bool = False, app_key: Optional[str]
         logging.error(f"Error downloading database: {e}")
         return False
 
+def _publish_phish_data(entries: List[Dict]) -> None:
+    """
+    Index the PhishTank entries by normalized URL for O(1) lookups, then publish them.
+    
+    The index is assigned before _phish_data, so a checker thread that sees the
+    database as loaded never looks up a missing or partial index. The first entry
+    wins for duplicate URLs, matching the previous linear scan.
+    
+    Args:
+        entries: Parsed PhishTank database entries
+    """
+    global _phish_data, _phish_index
+    index = {}
+    for entry in entries:
+        index.setdefault(normalize_url(entry.get('url', '')), entry)
+    _phish_index = index
+    _phish_data = entries
+
+
+def ensure_phishtank_database() -> bool:
+    """
+    Load the PhishTank database once, even when several checker threads need it at the same time.
+    
+    Returns:
+        True if the database is loaded, False otherwise
+    """
+    if _phish_data is not None:
+        return True
+    with _phish_load_lock:
+        if _phish_data is not None:
+            return True
+        return load_phishtank_database()
+
 def normalize_url(url: str) -> str:
     """
     Normalize URL for comparison.
@@ -192,36 +367,32 @@ def check_url_phishing(url: str) -> Dict:
             'details': dict or None  # Additional info if phishing detected
         }
     """
-    global _phish_data
-    
     # Ensure database is loaded
-    if _phish_data is None:
-        if not load_phishtank_database():
-            return {
-                'url': url,
-                'is_phishing': False,
-                'confidence': 'unknown',
-                'error': 'Database not available'
-            }
+    if not ensure_phishtank_database():
+        return {
+            'url': url,
+            'is_phishing': False,
+            'confidence': 'unknown',
+            'error': 'Database not available'
+        }
     
     normalized_url = normalize_url(url)
     
-    # Search for exact match in database
-    for entry in _phish_data:
-        phish_url = normalize_url(entry.get('url', ''))
-        if phish_url == normalized_url:
-            return {
-                'url': url,
-                'is_phishing': True,
-                'confidence': 'high',
-                'details': {
-                    'phish_id': entry.get('phish_id'),
-                    'target': entry.get('target', 'Unknown'),
-                    'submission_time': entry.get('submission_time'),
-                    'verification_time': entry.get('verification_time'),
-                    'detail_url': entry.get('phish_detail_url')
-                }
+    # Look up exact match in database index
+    entry = _phish_index.get(normalized_url)
+    if entry is not None:
+        return {
+            'url': url,
+            'is_phishing': True,
+            'confidence': 'high',
+            'details': {
+                'phish_id': entry.get('phish_id'),
+                'target': entry.get('target', 'Unknown'),
+                'submission_time': entry.get('submission_time'),
+                'verification_time': entry.get('verification_time'),
+                'detail_url': entry.get('phish_detail_url')
             }
+        }
     
     return {
         'url': url,
@@ -240,19 +411,24 @@ def check_multiple_urls(urls: List[str]) -> Dict:
     Returns:
         Dictionary with results for all URLs
     """
-    results = {
-        'total_urls': len(urls),
-        'phishing_detected': 0,
-        'results': []
-    }
-    
-    for url in urls:
-        result = check_url_phishing(url)
-        results['results'].append(result)
-        if result.get('is_phishing', False):
-            results['phishing_detected'] += 1
+    return _summarize_url_results([check_url_phishing(url) for url in urls])
+
+
+def _summarize_url_results(url_results: List[Dict]) -> Dict:
+    """
+    Aggregate individual URL check results.
     
-    return results
+    Args:
+        url_results: Results from check_url_phishing, one per URL
+        
+    Returns:
+        Dictionary with results for all URLs
+    """
+    return {
+        'total_urls': len(url_results),
+        'phishing_detected': sum(1 for r in url_results if r.get('is_phishing', False)),
+        'results': url_results
+    }
 
 # =============================================================================
 # 2. EMAIL EXTRACTION AND VALIDATION
@@ -270,20 +446,53 @@ def extract_emails_from_text(text: str) -> List[str]:
         List of extracted email addresses
     """
     # Standard email pattern but with better boundary detection for multilingual text
-    email_pattern = r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}(?![A-Za-z0-9._%+-])'
-    emails = re.findall(email_pattern, text, re.IGNORECASE)
+    if '@' not in text:
+        return []
+    emails = _EMAIL_RE.findall(text)
     
     # Clean up emails that might have captured non-ASCII characters
     cleaned_emails = []
     for email in emails:
         # Remove any non-ASCII characters that might have been captured
-        cleaned_email = re.sub(r'[^\x00-\x7F]', '', email)
+        cleaned_email = _NON_ASCII_RE.sub('', email)
         # Validate email format after cleaning
-        if re.match(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$', cleaned_email, re.IGNORECASE):
+        if _EMAIL_FULL_RE.match(cleaned_email):
             cleaned_emails.append(cleaned_email)
     
     return list(set(cleaned_emails))  # Remove duplicates
 
+def _email_validation_result(email: str, response) -> Dict:
+    """
+    Build the email validation result from a validation API response.
+    
+    Args:
+        email: Email address that was validated
+        response: requests or httpx response from the validation API
+        
+    Returns:
+        Dictionary with validation results
+    """
+    if response.status_code == 200:
+        result = response.json()
+        # Check the validation result format to determine if email is valid
+        validation_result = result.get('validationResult', {})
+        status = validation_result.get('status', '').lower()
+        is_valid = status == 'valid'
+        
+        return {
+            'email': email,
+            'is_valid': is_valid,
+            'details': result,
+            'confidence': 'high'
+        }
+    else:
+        return {
+            'email': email,
+            'is_valid': None,
+            'error': f"API returned status {response.status_code}",
+            'confidence': 'unknown'
+        }
+
 def check_email_validity(email: str, api_key: Optional[str] = None) -> Dict:
     """
     Check email validity using external validation service.
@@ -301,45 +510,56 @@ def check_email_validity(email: str, api_key: Optional[str] = None) -> Dict:
             api_key = config.get('VALIDATION_API_KEY')
             
         if not api_key:
-            return {
-                'email': email,
-                'is_valid': None,
-                'error': 'No API key configured for validation service',
-                'confidence': 'unknown'
-            }
-        
-        url = "https://validation-aws.silverlining.cloud/email-address"
-        
-        payload = json.dumps({
-            "emailAddress": email
-        })
-        headers = {
-            'x-api-key': api_key,
-            'Content-Type': 'application/json'
+            return _no_api_key_result('email', email)
+        
+        cache_key = email.strip().lower()
+        cached = _cached_validation(_email_validation_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        response = requests.post(f"{VALIDATION_API_URL}/email-address",
+                                 headers=_validation_headers(api_key),
+                                 data=json.dumps({"emailAddress": email}),
+                                 timeout=VALIDATION_TIMEOUT_SECONDS)
+        return _cache_validation(_email_validation_cache, cache_key, _email_validation_result(email, response))
+            
+    except Exception as e:
+        return {
+            'email': email,
+            'is_valid': None,
+            'error': str(e),
+            'confidence': 'unknown'
         }
+
+async def acheck_email_validity(email: str, api_key: Optional[str] = None) -> Dict:
+    """
+    Async variant of check_email_validity using the shared pooled HTTP client.
+    
+    Args:
+        email: Email address to validate
+        api_key: API key for validation service (if None, uses env var)
         
-        response = requests.post(url, headers=headers, data=payload, timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            # Check the validation result format to determine if email is valid
-            validation_result = result.get('validationResult', {})
-            status = validation_result.get('status', '').lower()
-            is_valid = status == 'valid'
+    Returns:
+        Dictionary with validation results
+    """
+    try:
+        if api_key is None:
+            api_key = config.get('VALIDATION_API_KEY')
             
-            return {
-                'email': email,
-                'is_valid': is_valid,
-                'details': result,
-                'confidence': 'high'
-            }
-        else:
-            return {
-                'email': email,
-                'is_valid': None,
-                'error': f"API returned status {response.status_code}",
-                'confidence': 'unknown'
-            }
+        if not api_key:
+            return _no_api_key_result('email', email)
+        
+        cache_key = email.strip().lower()
+        cached = _cached_validation(_email_validation_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        response = await get_validation_client().post(
+            f"{VALIDATION_API_URL}/email-address",
+            headers=_validation_headers(api_key),
+            content=json.dumps({"emailAddress": email})
+        )
+        return _cache_validation(_email_validation_cache, cache_key, _email_validation_result(email, response))
             
     except Exception as e:
         return {
@@ -359,23 +579,25 @@ def check_multiple_emails(emails: List[str]) -> Dict:
     Returns:
         Dictionary with results for all emails
     """
-    results = {
-        'total_emails': len(emails),
-        'valid_emails': 0,
-        'invalid_emails': 0,
-        'results': []
-    }
+    return _summarize_email_results([check_email_validity(email) for email in emails])
+
+
+def _summarize_email_results(email_results: List[Dict]) -> Dict:
+    """
+    Aggregate individual email validation results.
     
-    for email in emails:
-        result = check_email_validity(email)
-        results['results'].append(result)
+    Args:
+        email_results: Results from check_email_validity, one per email
         
-        if result.get('is_valid') is True:
-            results['valid_emails'] += 1
-        elif result.get('is_valid') is False:
-            results['invalid_emails'] += 1
-    
-    return results
+    Returns:
+        Dictionary with results for all emails
+    """
+    return {
+        'total_emails': len(email_results),
+        'valid_emails': sum(1 for r in email_results if r.get('is_valid') is True),
+        'invalid_emails': sum(1 for r in email_results if r.get('is_valid') is False),
+        'results': email_results
+    }
 
 # =============================================================================
 # 3. PHONE NUMBER EXTRACTION AND VALIDATION
@@ -394,29 +616,52 @@ def extract_phone_numbers_from_text(text: str) -> List[str]:
     """
     # Multiple patterns to catch different phone number formats
     # Added word boundaries to prevent capturing numbers that are part of non-English text
-    patterns = [
-        r'(?<!\d)\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}(?!\d)',  # International format
-        r'(?<!\d)\(\d{3}\)[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)',  # (123) 456-7890
-        r'(?<!\d)\d{3}[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)',      # 123-456-7890 or 123.456.7890
-        r'(?<!\d)\d{10,15}(?!\d)',                          # Simple long number
-    ]
-    
     phone_numbers = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        phone_numbers.extend(matches)
+    for pattern in _PHONE_RES:
+        phone_numbers.extend(pattern.findall(text))
     
     # Clean up phone numbers that might be mixed with non-ASCII text
     cleaned_phones = []
     for phone in phone_numbers:
         # Remove any non-ASCII characters and extra spaces
-        cleaned_phone = re.sub(r'[^\x00-\x7F]', '', phone).strip()
+        cleaned_phone = _NON_ASCII_RE.sub('', phone).strip()
         # Only keep if it still looks like a valid phone number
-        if re.match(r'^[\+\d\(\)\-\.\s]{7,20}$', cleaned_phone) and len(re.sub(r'[^\d]', '', cleaned_phone)) >= 7:
+        if _PHONE_FULL_RE.match(cleaned_phone) and len(_NON_DIGIT_RE.sub('', cleaned_phone)) >= 7:
             cleaned_phones.append(cleaned_phone)
     
     return list(set(cleaned_phones))  # Remove duplicates
 
+def _phone_validation_result(phone: str, response) -> Dict:
+    """
+    Build the phone validation result from a validation API response.
+    
+    Args:
+        phone: Phone number that was validated
+        response: requests or httpx response from the validation API
+        
+    Returns:
+        Dictionary with validation results
+    """
+    if response.status_code == 200:
+        result = response.json()
+        # Check the validation result format to determine if phone is valid
+        validation_result = result.get('validationResult', {})
+        is_valid = validation_result.get('is_valid', False)
+        
+        return {
+            'phone': phone,
+            'is_valid': is_valid,
+            'details': result,
+            'confidence': 'high'
+        }
+    else:
+        return {
+            'phone': phone,
+            'is_valid': None,
+            'error': f"API returned status {response.status_code}",
+            'confidence': 'unknown'
+        }
+
 def check_phone_number_validity(phone: str, api_key: Optional[str] = None) -> Dict:
     """
     Check phone number validity using external validation service.
@@ -434,44 +679,54 @@ def check_phone_number_validity(phone: str, api_key: Optional[str] = None) -> Di
             api_key = config.get('VALIDATION_API_KEY')
             
         if not api_key:
-            return {
-                'phone': phone,
-                'is_valid': None,
-                'error': 'No API key configured for validation service',
-                'confidence': 'unknown'
-            }
+            return _no_api_key_result('phone', phone)
         
-        url = "https://validation-aws.silverlining.cloud/phone-number"
+        cached = _cached_validation(_phone_validation_cache, phone)
+        if cached is not None:
+            return cached
         
-        payload = json.dumps({
-            "phoneNumber": phone
-        })
-        headers = {
-            'x-api-key': api_key,
-            'Content-Type': 'application/json'
+        response = requests.post(f"{VALIDATION_API_URL}/phone-number",
+                                 headers=_validation_headers(api_key),
+                                 data=json.dumps({"phoneNumber": phone}),
+                                 timeout=VALIDATION_TIMEOUT_SECONDS)
+        return _cache_validation(_phone_validation_cache, phone, _phone_validation_result(phone, response))
+            
+    except Exception as e:
+        return {
+            'phone': phone,
+            'is_valid': None,
+            'error': str(e),
+            'confidence': 'unknown'
         }
+
+async def acheck_phone_number_validity(phone: str, api_key: Optional[str] = None) -> Dict:
+    """
+    Async variant of check_phone_number_validity using the shared pooled HTTP client.
+    
+    Args:
+        phone: Phone number to validate
+        api_key: API key for validation service (if None, uses env var)
         
-        response = requests.post(url, headers=headers, data=payload, timeout=10)
-        
-        if response.status_code == 200:
-            result = response.json()
-            # Check the validation result format to determine if phone is valid
-            validation_result = result.get('validationResult', {})
-            is_valid = validation_result.get('is_valid', False)
+    Returns:
+        Dictionary with validation results
+    """
+    try:
+        if api_key is None:
+            api_key = config.get('VALIDATION_API_KEY')
             
-            return {
-                'phone': phone,
-                'is_valid': is_valid,
-                'details': result,
-                'confidence': 'high'
-            }
-        else:
-            return {
-                'phone': phone,
-                'is_valid': None,
-                'error': f"API returned status {response.status_code}",
-                'confidence': 'unknown'
-            }
+        if not api_key:
+            return _no_api_key_result('phone', phone)
+        
+        cached = _cached_validation(_phone_validation_cache, phone)
+        if cached is not None:
+            return cached
+        
+        response = await get_validation_client().post(
+            f"{VALIDATION_API_URL}/phone-number",
+            headers=_validation_headers(api_key),
+            content=json.dumps({"phoneNumber": phone})
+        )
+        return _cache_validation(_phone_validation_cache, phone, _phone_validation_result(phone, response))
             
     except Exception as e:
         return {
@@ -491,23 +746,25 @@ def check_multiple_phone_numbers(phones: List[str]) -> Dict:
     Returns:
         Dictionary with results for all phone numbers
     """
-    results = {
-        'total_phones': len(phones),
-        'valid_phones': 0,
-        'invalid_phones': 0,
-        'results': []
-    }
+    return _summarize_phone_results([check_phone_number_validity(phone) for phone in phones])
+
+
+def _summarize_phone_results(phone_results: List[Dict]) -> Dict:
+    """
+    Aggregate individual phone number validation results.
     
-    for phone in phones:
-        result = check_phone_number_validity(phone)
-        results['results'].append(result)
+    Args:
+        phone_results: Results from check_phone_number_validity, one per phone number
         
-        if result.get('is_valid') is True:
-            results['valid_phones'] += 1
-        elif result.get('is_valid') is False:
-            results['invalid_phones'] += 1
-    
-    return results
+    Returns:
+        Dictionary with results for all phone numbers
+    """
+    return {
+        'total_phones': len(phone_results),
+        'valid_phones': sum(1 for r in phone_results if r.get('is_valid') is True),
+        'invalid_phones': sum(1 for r in phone_results if r.get('is_valid') is False),
+        'results': phone_results
+    }
 
 # =============================================================================
 # 4. COMBINED CONTENT ANALYSIS
@@ -523,6 +780,9 @@ def extract_all_from_content(content: str) -> Dict:
     Returns:
         Dictionary with all extracted elements
     """
+    # Plain prose with no link, address or number skips the full extractors
+    if not content or not _ARTIFACT_HINT_RE.search(content):
+        return {'urls': [], 'emails': [], 'phone_numbers': []}
     return {
         'urls': extract_urls_from_text(content),
         'emails': extract_emails_from_text(content),
@@ -542,24 +802,7 @@ def check_all_content(content: str, sender_email: str = "", reply_to_email: str
         Dictionary with extraction and validation results
     """
     logging.info("🔍 DEBUG: Starting check_all_content")
-    logging.info(f"Sender email: {sender_email}, Reply-to email: {reply_to_email}")
-    
-    # Extract all elements from content
-    extracted = extract_all_from_content(content)
-    logging.info(f"Extracted elements from content: {extracted}")
-    
-    # Add sender and reply-to emails if they exist and aren't already in the list
-    all_emails = extracted['emails'].copy()
-    if sender_email and sender_email not in all_emails:
-        all_emails.append(sender_email)
-        logging.info(f"Added sender email for validation: {sender_email}")
-    if reply_to_email and reply_to_email not in all_emails:
-        all_emails.append(reply_to_email)
-        logging.info(f"Added reply-to email for validation: {reply_to_email}")
-    
-    # Update extracted emails with sender/reply-to info
-    extracted['emails'] = all_emails
-    logging.info(f"Final emails to validate: {all_emails}")
+    extracted = _extract_for_checking(content, sender_email, reply_to_email)
     
     # Check all elements
     results = {
@@ -584,6 +827,86 @@ def check_all_content(content: str, sender_email: str = "", reply_to_email: str
     logging.info(f"Final check_all_content results: {results}")
     return results
 
+
+async def check_all_content_async(content: str, sender_email: str = "", reply_to_email: str = "") -> Dict:
+    """
+    Async variant of check_all_content that runs every check concurrently.
+    
+    Email and phone validation calls share one pooled async HTTP client and the
+    PhishTank lookup runs in a worker thread, so total time is roughly the
+    slowest single check instead of the sum of all of them, and the event loop
+    is never blocked.
+    
+    Args:
+        content: Content to analyze
+        sender_email: Sender email address to validate
+        reply_to_email: Reply-to email address to validate
+        
+    Returns:
+        Dictionary with extraction and validation results (same shape as check_all_content)
+    """
+    logging.info("🔍 DEBUG: Starting check_all_content_async")
+    extracted = _extract_for_checking(content, sender_email, reply_to_email)
+    urls, emails, phones = extracted['urls'], extracted['emails'], extracted['phone_numbers']
+    
+    checks = (
+        [asyncio.to_thread(check_url_phishing, url) for url in urls]
+        + [acheck_email_validity(email) for email in emails]
+        + [acheck_phone_number_validity(phone) for phone in phones]
+    )
+    check_results = await asyncio.gather(*checks) if checks else []
+    
+    url_results = check_results[:len(urls)]
+    email_results = check_results[len(urls):len(urls) + len(emails)]
+    phone_results = check_results[len(urls) + len(emails):]
+    
+    results = {
+        'extraction': extracted,
+        'validation': {}
+    }
+    if urls:
+        results['validation']['urls'] = _summarize_url_results(url_results)
+    if emails:
+        results['validation']['emails'] = _summarize_email_results(email_results)
+    if phones:
+        results['validation']['phone_numbers'] = _summarize_phone_results(phone_results)
+    
+    logging.info(f"Final check_all_content_async results: {results}")
+    return results
+
+
+def _extract_for_checking(content: str, sender_email: str, reply_to_email: str) -> Dict:
+    """
+    Extract URLs, emails, and phone numbers to check, including sender and reply-to emails.
+    
+    Args:
+        content: Content to analyze
+        sender_email: Sender email address to validate
+        reply_to_email: Reply-to email address to validate
+        
+    Returns:
+        Dictionary with lists of URLs, emails, and phone numbers
+    """
+    logging.info(f"Sender email: {sender_email}, Reply-to email: {reply_to_email}")
+    
+    # Extract all elements from content
+    extracted = extract_all_from_content(content)
+    logging.info(f"Extracted elements from content: {extracted}")
+    
+    # Add sender and reply-to emails if they exist and aren't already in the list
+    all_emails = extracted['emails'].copy()
+    if sender_email and sender_email not in all_emails:
+        all_emails.append(sender_email)
+        logging.info(f"Added sender email for validation: {sender_email}")
+    if reply_to_email and reply_to_email not in all_emails:
+        all_emails.append(reply_to_email)
+        logging.info(f"Added reply-to email for validation: {reply_to_email}")
+    
+    # Update extracted emails with sender/reply-to info
+    extracted['emails'] = all_emails
+    logging.info(f"Final emails to validate: {all_emails}")
+    return extracted
+
 def format_checker_results_for_llm(checker_results: Dict) -> str:
     """
     Format checker results for inclusion in LLM analysis.
@@ -32,10 +32,10 @@ if any(keyword in text.lower() for keyword in EMAIL_KEYWORDS["urgency"]):
 """
 
 import os
-from setting import Setting
+from setting import get_settings
 
 # Load configuration
-config = Setting()
+config = get_settings()
 
 # =============================================================================
 # ENDPOINT PROTECTION CONFIGURATION
@@ -58,6 +58,7 @@ PUBLIC_ENDPOINTS = [
 # Endpoints that require authentication but no specific permissions
 AUTH_REQUIRED_ENDPOINTS = [
     "/email/v1/analyze",
+    "/email/v1/analyze/batch",
     "/email/v1/translate",
     "/email/v2/analyze",
     "/socialmedia/v1/analyze",
@@ -70,6 +71,7 @@ AUTH_REQUIRED_ENDPOINTS = [
 # Endpoints with specific permission requirements
 PERMISSION_PROTECTED_ENDPOINTS = {
     "/email/v1/analyze": ["email_analysis"],
+    "/email/v1/analyze/batch": ["email_analysis"],
     "/email/v1/translate": ["email_analysis"],
     "/email/v2/analyze": ["email_analysis"],
     "/socialmedia/v1/analyze": ["social_media_analysis"],
@@ -92,6 +94,8 @@ ADMIN_ENDPOINTS = [
 
 # JWT Configuration
 JWT_SECRET_KEY = "your-super-secret-jwt-key-change-in-production"
+# HMAC-SHA256 verifies in a few microseconds, faster than asymmetric schemes
+# (RS256, EdDSA); switch only if third parties need to verify tokens themselves
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_HOURS = 24
 
@@ -122,6 +126,14 @@ CLIENT_TYPES = {
     }
 }
 
+# Default permissions per client type, flattened once for per-request lookups.
+# Reads the same "permissions" key as the original per-request lookups, so types
+# without it (currently all of them) default to no permissions.
+DEFAULT_PERMISSIONS = {
+    client_type: tuple(settings.get("permissions", ()))
+    for client_type, settings in CLIENT_TYPES.items()
+}
+
 # =============================================================================
 # LANGUAGE CONSTANTS
 # =============================================================================
@@ -233,6 +245,14 @@ MIN_PHONE_LENGTH = 7
 MAX_HYPHENS_IN_DOMAIN = 3
 RANDOM_SUBDOMAIN_PATTERN = r'[a-z0-9]{8,}'
 SUSPICIOUS_PATH_KEYWORDS = ["login", "secure", "verify", "confirm"]
+# Largest JSON body accepted by msgspec-decoded endpoints (bounds regex and hash work per request)
+MAX_REQUEST_BODY_BYTES = 256 * 1024
+# Largest body for endpoints that accept a base64 image (the Lambda synchronous payload limit)
+MAX_IMAGE_REQUEST_BODY_BYTES = 6 * 1024 * 1024
+# Keep-alive connections per boto3 client, sized for concurrent worker-thread calls (botocore default is 10)
+AWS_MAX_POOL_CONNECTIONS = 50
+# Output cap for language detection, whose reply is a one-field JSON object
+LANGUAGE_DETECTION_MAX_TOKENS = 32
 
 # =============================================================================
 # HASHING CONSTANTS
@@ -14,10 +14,11 @@ EXPORTED FUNCTIONS:
 2. get_dynamodb_resource  
 3. save_detection_result
 4. find_result_by_hash
-5. create_detection_document
-6. prepare_email_detection_document
-7. prepare_website_detection_document
-8. prepare_socialmedia_detection_document
+5. find_results_by_hashes
+6. create_detection_document
+7. prepare_email_detection_document
+8. prepare_website_detection_document
+9. prepare_socialmedia_detection_document
 
 USAGE EXAMPLES:
 --------------
@@ -29,35 +30,70 @@ result_id = await save_detection_result("website", content_hash, analysis_result
 
 # Find existing result
 existing = await find_result_by_hash(content_hash)
+
+# Find existing results for several hashes at once
+existing_by_hash = await find_results_by_hashes([hash_a, hash_b])
 """
 
+import asyncio
+import logging
+import threading
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config as BotoConfig
+from functools import lru_cache
 import json
 import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, List
 from decimal import Decimal
 import uuid
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from setting import Setting
+from setting import get_settings
+from utils.constant import AWS_MAX_POOL_CONNECTIONS
 
 # Load environment variables
 load_dotenv(override=True)
 
 # Configuration
-config = Setting()
+config = get_settings()
+logger = logging.getLogger(__name__)
 DYNAMODB_TABLE_NAME = "mai-scam-detection-results"
 DYNAMODB_REGION = "us-east-1"
 TTL_DAYS = 90  # Auto-delete records after 90 days
 
+# In-process cache of detection documents keyed by content hash, so hot
+# content skips the DynamoDB round trip (only hits are cached, never misses).
+# Entries leave out extracted_data (full page/post content), which lookups never read.
+RESULT_CACHE_MAXSIZE = 10000
+RESULT_CACHE_TTL_SECONDS = 300
+_result_cache = TTLCache(maxsize=RESULT_CACHE_MAXSIZE, ttl=RESULT_CACHE_TTL_SECONDS)
+
+# Attributes fetched by the hash lookups; extracted_data (full page/post content) is never read there
+RESULT_LOOKUP_PROJECTION = "content_type, detection_id, analysis_result, target_language, created_at"
+
+# The partition key name contains a hyphen, so client-API expressions refer to it by placeholder
+PARTITION_KEY_NAME = "mai-scam"
+
+# Convert between Python values and DynamoDB attribute values for the low-level client
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# boto3 resources are not thread-safe, so each worker thread builds its own
+_thread_local = threading.local()
+
 
 # =============================================================================
 # 1. DYNAMODB CLIENT AND RESOURCE FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_dynamodb_client():
     """
     Get DynamoDB client with credentials from environment variables.
+
+    Created once per process, so every call reuses its keep-alive connection pool.
     
     The client automatically uses AWS credentials from environment:
     - AWS_ACCESS_KEY_ID (required)
@@ -84,12 +120,16 @@ def get_dynamodb_client():
     if aws_session_token:
         aws_config['aws_session_token'] = aws_session_token
     
-    return boto3.client('dynamodb', **aws_config)
+    return boto3.client('dynamodb', config=BotoConfig(max_pool_connections=AWS_MAX_POOL_CONNECTIONS), **aws_config)
 
 
 def get_dynamodb_resource():
     """
     Get DynamoDB resource with credentials from environment variables.
+
+    boto3 resources are not thread-safe, so one is created per calling thread and
+    reused by later calls on that thread. Hot paths use get_dynamodb_client instead,
+    which is safe to share.
     
     Returns:
         boto3.resource: Configured DynamoDB resource
@@ -112,7 +152,12 @@ def get_dynamodb_resource():
     if aws_session_token:
         aws_config['aws_session_token'] = aws_session_token
     
-    return boto3.resource('dynamodb', **aws_config)
+    resource = getattr(_thread_local, 'dynamodb_resource', None)
+    if resource is None:
+        resource = boto3.session.Session().resource(
+            'dynamodb', config=BotoConfig(max_pool_connections=AWS_MAX_POOL_CONNECTIONS), **aws_config)
+        _thread_local.dynamodb_resource = resource
+    return resource
 
 
 # =============================================================================
@@ -139,6 +184,52 @@ def _convert_floats_to_decimal(obj):
         return obj
 
 
+def _to_dynamodb_item(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize a detection document into DynamoDB attribute values for the client API."""
+    return {key: _serializer.serialize(value) for key, value in document.items()}
+
+
+def _from_dynamodb_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Deserialize DynamoDB attribute values returned by the client API into a plain document."""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+def _query_latest_by_hash(client, content_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Query the most recent detection document for a content hash (blocking client call).
+
+    Args:
+        client: DynamoDB client from get_dynamodb_client
+        content_hash: The content hash to search for
+
+    Returns:
+        Projected document if found, None otherwise
+    """
+    response = client.query(
+        TableName=DYNAMODB_TABLE_NAME,
+        KeyConditionExpression="#pk = :content_hash",
+        ExpressionAttributeNames={"#pk": PARTITION_KEY_NAME},
+        ExpressionAttributeValues={":content_hash": {"S": content_hash}},
+        ProjectionExpression=RESULT_LOOKUP_PROJECTION,
+        Limit=1,
+        ScanIndexForward=False  # Get most recent first
+    )
+    items = response.get('Items')
+    return _from_dynamodb_item(items[0]) if items else None
+
+
+def _scan_table(**scan_kwargs) -> Dict[str, Any]:
+    """Scan the detection table with the calling worker thread's own resource (blocking)."""
+    return get_dynamodb_resource().Table(DYNAMODB_TABLE_NAME).scan(**scan_kwargs)
+
+
+def _cache_result(content_hash: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a detection document in the result cache without its extracted data and return the entry."""
+    entry = {key: value for key, value in document.items() if key != 'extracted_data'}
+    _result_cache[content_hash] = entry
+    return entry
+
+
 def _generate_ttl():
     """
     Generate TTL timestamp for auto-deletion.
@@ -268,7 +359,8 @@ def prepare_socialmedia_detection_document(content_hash: str, analysis_result: D
 
 async def save_detection_result(content_type: str, content_hash: str, analysis_result: Dict[str, Any],
                                extracted_data: Optional[Dict[str, Any]] = None, 
-                               target_language: str = "en") -> Optional[str]:
+                               target_language: str = "en",
+                               detection_id: Optional[str] = None) -> Optional[str]:
     """
     Save detection result to DynamoDB with proper error handling.
     
@@ -283,6 +375,7 @@ async def save_detection_result(content_type: str, content_hash: str, analysis_r
         analysis_result: LLM analysis results
         extracted_data: Extracted content data (None for email)
         target_language: Target language for analysis
+        detection_id: Pre-generated detection ID, for callers that respond before the save
         
     Returns:
         Detection ID if successful, None if failed
@@ -312,13 +405,18 @@ async def save_detection_result(content_type: str, content_hash: str, analysis_r
             document = prepare_socialmedia_detection_document(content_hash, analysis_result, extracted_data, target_language)
         else:
             raise ValueError(f"Unsupported content_type: {content_type}")
+        if detection_id:
+            document['detection_id'] = detection_id
         
-        # Get DynamoDB table
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-        
-        # Save to DynamoDB
-        response = table.put_item(Item=document)
+        # Save to DynamoDB in a worker thread so the event loop keeps serving
+        # (through the shared client; boto3 resources are not thread-safe)
+        dynamodb_client = get_dynamodb_client()
+        await asyncio.to_thread(
+            dynamodb_client.put_item,
+            TableName=DYNAMODB_TABLE_NAME,
+            Item=_to_dynamodb_item(document)
+        )
+        _cache_result(content_hash, document)
         
         print(f"Successfully saved {content_type} detection result: {document['detection_id']}")
         return document['detection_id']
@@ -344,26 +442,23 @@ async def find_result_by_hash(content_hash: str) -> Optional[Dict[str, Any]]:
         content_hash: The content hash to search for
         
     Returns:
-        Existing document if found, None otherwise
+        Existing document (without extracted_data) if found, None otherwise
         
     Example:
         existing = await find_result_by_hash("abc123def456")
         if existing:
             print(f"Found existing result: {existing['analysis_result']['risk_level']}")
     """
+    cached = _result_cache.get(content_hash)
+    if cached is not None:
+        return cached
+    
     try:
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-        
-        # Query by mai-scam (partition key)
-        response = table.query(
-            KeyConditionExpression=boto3.dynamodb.conditions.Key('mai-scam').eq(content_hash),
-            Limit=1,
-            ScanIndexForward=False  # Get most recent first
-        )
+        # Query by mai-scam (partition key) in a worker thread so the event loop keeps serving
+        item = await asyncio.to_thread(_query_latest_by_hash, get_dynamodb_client(), content_hash)
         
-        if response['Items']:
-            return response['Items'][0]
+        if item is not None:
+            return _cache_result(content_hash, item)
         else:
             return None
             
@@ -372,6 +467,52 @@ async def find_result_by_hash(content_hash: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def find_results_by_hashes(content_hashes: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Find existing detection results for several content hashes at once.
+    
+    Hashes in the in-process result cache are served from memory. Remaining
+    duplicate hashes are looked up only once and the thread-safe client is
+    shared across the lookups, which run concurrently in worker threads.
+    BatchGetItem is not usable here because it needs the full primary key,
+    while the latest result per hash is only reachable through a query.
+    
+    Args:
+        content_hashes: Content hashes to search for
+        
+    Returns:
+        Mapping of each unique content hash to its document (without extracted_data), or None if not found
+        
+    Example:
+        existing_by_hash = await find_results_by_hashes(["abc123def456", "xyz789abc123"])
+    """
+    unique_hashes = list(dict.fromkeys(content_hashes))
+    found = {content_hash: _result_cache.get(content_hash) for content_hash in unique_hashes}
+    uncached_hashes = [content_hash for content_hash, item in found.items() if item is None]
+    if not uncached_hashes:
+        return found
+    
+    try:
+        dynamodb_client = get_dynamodb_client()
+    except Exception as e:
+        logger.error("Error finding results by hashes: %s", e)
+        return found
+    
+    def _query_latest(content_hash: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _query_latest_by_hash(dynamodb_client, content_hash)
+        except Exception:
+            logger.exception("Error finding result by hash %s", content_hash)
+            return None
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_query_latest, content_hash) for content_hash in uncached_hashes)
+    )
+    for content_hash, item in zip(uncached_hashes, results):
+        found[content_hash] = _cache_result(content_hash, item) if item is not None else None
+    return found
+
+
 async def get_detection_result(detection_id: str) -> Optional[Dict[str, Any]]:
     """
     Get detection result by detection ID.
@@ -386,12 +527,10 @@ async def get_detection_result(detection_id: str) -> Optional[Dict[str, Any]]:
         result = await get_detection_result("uuid-string")
     """
     try:
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-        
         # Scan for detection_id (this is not efficient for large datasets, 
         # consider using GSI if needed frequently)
-        response = table.scan(
+        response = await asyncio.to_thread(
+            _scan_table,
             FilterExpression=boto3.dynamodb.conditions.Attr('detection_id').eq(detection_id),
             Limit=1
         )
@@ -422,12 +561,9 @@ async def get_detection_stats() -> Dict[str, Any]:
         print(f"Total detections: {stats['total_detections']}")
     """
     try:
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-        
         # This is a simple implementation - for production, consider using DynamoDB Streams
         # or scheduled Lambda functions to maintain statistics
-        response = table.scan()
+        response = await asyncio.to_thread(_scan_table)
         
         stats = {
             "total_detections": 0,
@@ -13,6 +13,8 @@ EXPORTED FUNCTIONS:
 2. extract_signals
 3. analyze_email
 4. translate_analysis
+5. analyze_email_comprehensive
+6. merge_additional_phone_checks
 
 USAGE EXAMPLES:
 --------------
@@ -45,14 +47,31 @@ translated = await translate_analysis(
 
 from utils.constant import (
     LANGUAGES, URL_PATTERN, EMAIL_PATTERN, PHONE_PATTERN,
-    SUSPICIOUS_TLDS, URL_SHORTENERS, EMAIL_KEYWORDS, MIN_PHONE_LENGTH
+    SUSPICIOUS_TLDS, URL_SHORTENERS, EMAIL_KEYWORDS, MIN_PHONE_LENGTH,
+    LANGUAGE_DETECTION_MAX_TOKENS
 )
+from utils.languageUtils import detect_language_by_script
 from utils.llmUtils import parse_sealion_json, call_sea_lion_llm, call_sea_lion_v4_llm, call_sagemaker_sealion_llm, parse_sagemaker_json
+from utils.checkerUtils import acheck_phone_number_validity
 from prompts.emailPrompts import prompts
+import asyncio
 import re
 import json
 import logging
 
+# Language list substituted into every prompt, joined once at import
+_AVAILABLE_LANGUAGES = ", ".join(LANGUAGES)
+
+# Formatting characters removed from phone numbers before validation
+_PHONE_STRIP_TABLE = str.maketrans('', '', '()- ')
+
+# Signal extraction patterns, compiled once at import
+_URL_RE = re.compile(URL_PATTERN, re.IGNORECASE)
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_URL_HOST_RE = re.compile(r"https?://([^/]+)/?", re.IGNORECASE)
+_URL_SHORTENERS = frozenset(URL_SHORTENERS)
+
 
 # =============================================================================
 # HELPER FUNCTIONS FOR SIGNAL EXTRACTION
@@ -68,8 +87,9 @@ def _extract_urls(text: str) -> list:
     Returns:
         list: List of found URLs
     """
-    url_pattern = re.compile(URL_PATTERN, re.IGNORECASE)
-    return url_pattern.findall(text or "")
+    if not text or "http" not in text.lower():
+        return []
+    return _URL_RE.findall(text)
 
 
 def _extract_emails(text: str) -> list:
@@ -82,8 +102,9 @@ def _extract_emails(text: str) -> list:
     Returns:
         list: List of found email addresses
     """
-    email_pattern = re.compile(EMAIL_PATTERN)
-    return email_pattern.findall(text or "")
+    if not text or "@" not in text:
+        return []
+    return _EMAIL_RE.findall(text)
 
 
 def _extract_phone_numbers(text: str) -> list:
@@ -99,8 +120,7 @@ def _extract_phone_numbers(text: str) -> list:
     Returns:
         list: List of found phone numbers (filtered and deduplicated)
     """
-    phone_pattern = re.compile(PHONE_PATTERN)
-    candidates = [p.strip() for p in phone_pattern.findall(text or "")]
+    candidates = [p.strip() for p in _PHONE_RE.findall(text or "")]
     # De-duplicate and filter very short strings
     unique = []
     seen = set()
@@ -141,7 +161,7 @@ def _domains_from_urls(urls: list) -> list:
     """
     domains = []
     for url in urls:
-        m = re.match(r"https?://([^/]+)/?", url, flags=re.IGNORECASE)
+        m = _URL_HOST_RE.match(url)
         if m:
             domains.append(m.group(1).lower())
     # de-duplicate
@@ -158,6 +178,7 @@ async def detect_language(content: str) -> str:
 
     This function uses the Sea Lion LLM to identify the primary language
     of the email content from a predefined list of supported languages.
+    Content whose script identifies the language is resolved locally first.
 
     Args:
         content: The email content to analyze
@@ -169,12 +190,21 @@ async def detect_language(content: str) -> str:
         language = await detect_language("Hello world")
         # Returns: "en"
     """
+    # Thai, Chinese and Vietnamese are identified from the script alone, without an LLM call
+    language = detect_language_by_script(content)
+    if language:
+        return language
+
     prompt = prompts["detectLanguage"].format(
-        available_languages=str(", ".join(LANGUAGES)),
+        available_languages=_AVAILABLE_LANGUAGES,
         content=content,
     )
 
-    completion = await call_sea_lion_llm(prompt=prompt)
+    completion = await call_sea_lion_llm(
+        prompt=prompt,
+        max_tokens=LANGUAGE_DETECTION_MAX_TOKENS,
+        temperature=0
+    )
     json_response = parse_sealion_json(completion)
 
     return json_response["base_language"]
@@ -233,7 +263,7 @@ def extract_signals(title: str, content: str, from_email: str = "", reply_to_ema
         keywords[category] = any(k in lowered for k in keyword_list)
 
     # Suspicious hosts/tlds
-    has_shortened = any(d in URL_SHORTENERS for d in url_domains)
+    has_shortened = any(d in _URL_SHORTENERS for d in url_domains)
     has_suspicious_tld = any(
         d.split(".")[-1] in SUSPICIOUS_TLDS for d in url_domains if "." in d)
 
@@ -402,7 +432,7 @@ async def analyze_email_comprehensive(
         from_email=from_email,
         reply_to_email=reply_to_email or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to LLM (V1)
@@ -479,7 +509,7 @@ async def analyze_email_comprehensive_v2(
         from_email=from_email,
         reply_to_email=reply_to_email or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to LLM (V2)
@@ -556,7 +586,7 @@ async def analyze_email_comprehensive_sagemaker(
         from_email=from_email,
         reply_to_email=reply_to_email or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to SageMaker LLM
@@ -574,3 +604,53 @@ async def analyze_email_comprehensive_sagemaker(
     json_response = parse_sagemaker_json(completion)
 
     return json_response
+
+
+# =============================================================================
+# 6. CHECKER RESULT MERGING FUNCTION
+# =============================================================================
+
+async def merge_additional_phone_checks(checker_results: dict, email_phones: list) -> None:
+    """
+    Validate phone numbers found by signal extraction that the checker missed.
+
+    New numbers are validated concurrently and merged into
+    checker_results['validation']['phone_numbers'] in place, with the totals
+    recounted.
+
+    Args:
+        checker_results: Results from check_all_content / check_all_content_async
+        email_phones: Phone numbers from extract_signals artifacts
+
+    Example:
+        await merge_additional_phone_checks(checker_results, signals['artifacts']['phone_numbers'])
+    """
+    validation = checker_results.setdefault('validation', {})
+    checked_phones = {p['phone'] for p in validation.get('phone_numbers', {}).get('results', [])}
+
+    additional_phones = []
+    for phone in email_phones:
+        clean_phone = phone.strip().translate(_PHONE_STRIP_TABLE)
+        if clean_phone not in checked_phones:
+            checked_phones.add(clean_phone)
+            additional_phones.append(clean_phone)
+    if not additional_phones:
+        return
+
+    additional_phone_results = await asyncio.gather(
+        *(acheck_phone_number_validity(phone) for phone in additional_phones)
+    )
+
+    phone_validation = validation.setdefault(
+        'phone_numbers', {'total_phones': 0, 'valid_phones': 0, 'invalid_phones': 0, 'results': []})
+    phone_validation['results'].extend(additional_phone_results)
+
+    # Recount valid/invalid phones in a single pass
+    valid_count = invalid_count = 0
+    for result in phone_validation['results']:
+        is_valid = result.get('is_valid')
+        valid_count += is_valid is True
+        invalid_count += is_valid is False
+    phone_validation['total_phones'] = len(phone_validation['results'])
+    phone_validation['valid_phones'] = valid_count
+    phone_validation['invalid_phones'] = invalid_count
@@ -0,0 +1,69 @@
+"""
+Hash Utilities for MAI Scam Detection System
+
+This module provides the field normalization shared by the email, website and
+social media content hashes, so identical content maps to the same dedup key
+no matter which endpoint computes it.
+
+TABLE OF CONTENTS:
+==================
+
+EXPORTED FUNCTIONS:
+------------------
+1. normalize_hash_text
+2. normalize_hash_url
+
+USAGE EXAMPLES:
+--------------
+# Feed normalized fields into an incremental hasher
+hasher = xxhash.xxh3_64(b"website:")
+hasher.update(normalize_hash_url(url))
+hasher.update(b"|")
+hasher.update(normalize_hash_text(title))
+"""
+
+from typing import Optional
+from urllib.parse import urlparse
+
+
+# =============================================================================
+# 1. TEXT NORMALIZATION FUNCTION
+# =============================================================================
+
+def normalize_hash_text(text: Optional[str]) -> bytes:
+    """
+    Normalize a hashed text field (trimmed, lowercased, UTF-8 encoded).
+
+    Args:
+        text: Field value, possibly empty or None
+
+    Returns:
+        bytes: Normalized field, b"" when missing
+
+    Example:
+        normalize_hash_text("  Hello ")  # Returns: b"hello"
+    """
+    return text.strip().lower().encode('utf-8') if text else b""
+
+
+# =============================================================================
+# 2. URL NORMALIZATION FUNCTION
+# =============================================================================
+
+def normalize_hash_url(url: Optional[str]) -> bytes:
+    """
+    Normalize a hashed URL to scheme://host/path without query or fragment.
+
+    Args:
+        url: URL value, possibly empty or None
+
+    Returns:
+        bytes: Normalized URL, b"" when missing
+
+    Example:
+        normalize_hash_url("https://Example.com/Login/?id=1")  # Returns: b"https://example.com/login"
+    """
+    if not url:
+        return b""
+    parsed = urlparse(url.lower())
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip('/').encode('utf-8')
@@ -0,0 +1,87 @@
+"""
+Language Utilities for MAI Scam Detection System
+
+This module provides a local, script-based language check that lets
+detect_language skip the LLM call when the writing system alone identifies
+the language: Thai script, Chinese characters, and Vietnamese diacritics.
+Latin-script content without Vietnamese marks (English vs Malay) is left to
+the LLM.
+
+TABLE OF CONTENTS:
+==================
+
+EXPORTED FUNCTIONS:
+------------------
+1. detect_language_by_script
+
+USAGE EXAMPLES:
+--------------
+# Resolve the language locally, falling back to the LLM when undecided
+language = detect_language_by_script(content)
+if language is None:
+    language = await detect_language_with_llm(content)
+"""
+
+import re
+from typing import Optional
+
+# Only the start of the content is inspected; it is enough to tell the script apart
+LANGUAGE_SAMPLE_CHARS = 2000
+
+# Share of script characters (vs Latin letters) needed to decide on Thai or Chinese
+SCRIPT_SHARE_THRESHOLD = 0.6
+
+# Vietnamese-only letters needed (absolute count and share of Latin letters) to decide on Vietnamese
+MIN_VIETNAMESE_CHARS = 3
+VIETNAMESE_SHARE_THRESHOLD = 0.05
+
+# Script patterns, compiled once at import
+_THAI_RE = re.compile(r'[\u0E00-\u0E7F]')
+_CJK_RE = re.compile(r'[\u3400-\u4DBF\u4E00-\u9FFF]')
+_KANA_RE = re.compile(r'[\u3040-\u30FF]')
+_LATIN_RE = re.compile(r'[A-Za-z\u00C0-\u024F\u1E00-\u1EFF]')
+# Letters with horn, breve or dot-below marks that Malay and English never use
+_VIETNAMESE_RE = re.compile(
+    r'[\u0103\u00E2\u0111\u00EA\u00F4\u01A1\u01B0\u0102\u00C2\u0110\u00CA\u00D4\u01A0\u01AF\u1EA0-\u1EF9]'
+)
+
+
+# =============================================================================
+# 1. LANGUAGE DETECTION FUNCTION
+# =============================================================================
+
+def detect_language_by_script(content: str) -> Optional[str]:
+    """
+    Identify the content language from its writing system, without an LLM call.
+
+    Args:
+        content: Text to inspect
+
+    Returns:
+        str: "th", "zh" or "vi" when the script decides it, None otherwise
+
+    Example:
+        detect_language_by_script("บัญชีของคุณถูกระงับ")  # Returns: "th"
+        detect_language_by_script("Your account is locked")  # Returns: None
+    """
+    if not content:
+        return None
+    sample = content[:LANGUAGE_SAMPLE_CHARS]
+    if sample.isascii():
+        return None
+
+    latin = len(_LATIN_RE.findall(sample))
+    thai = len(_THAI_RE.findall(sample))
+    if thai and thai / (thai + latin) >= SCRIPT_SHARE_THRESHOLD:
+        return "th"
+
+    # Kana means Japanese, which shares Chinese characters; leave it to the LLM
+    cjk = len(_CJK_RE.findall(sample))
+    if cjk and not _KANA_RE.search(sample) and cjk / (cjk + latin) >= SCRIPT_SHARE_THRESHOLD:
+        return "zh"
+
+    vietnamese = len(_VIETNAMESE_RE.findall(sample))
+    if vietnamese >= MIN_VIETNAMESE_CHARS and vietnamese / latin >= VIETNAMESE_SHARE_THRESHOLD:
+        return "vi"
+
+    return None
@@ -33,8 +33,9 @@ completion = await call_sea_lion_llm(
 json_response = parse_sealion_json(completion)
 """
 
+import asyncio
 import json
-import re
+import orjson
 import logging
 from models.clients import get_sea_lion_client, get_sea_lion_v4_client, get_sagemaker_predictor
 from fastapi import HTTPException
@@ -49,7 +50,9 @@ async def call_sea_lion_llm(
     model: str = "aisingapore/Llama-SEA-LION-v3.5-70B-R",
     thinking_mode: str = "off",
     cache: bool = False,
-    max_retries: int = 2
+    max_retries: int = 2,
+    max_tokens: int | None = None,
+    temperature: float | None = None
 ):
     """
     Centralized function to call Sea Lion LLM with configurable parameters and error handling.
@@ -63,6 +66,8 @@ async def call_sea_lion_llm(
         thinking_mode: Thinking mode setting - "on" or "off" (default: "off")
         cache: Whether to enable caching (default: False)
         max_retries: Maximum number of retries for failed requests (default: 2)
+        max_tokens: Cap on generated tokens, for calls with a short fixed output (default: provider limit)
+        temperature: Sampling temperature (default: provider default)
 
     Returns:
         The LLM completion response object
@@ -84,8 +89,15 @@ async def call_sea_lion_llm(
             logger.info("🦁 Calling Sea-Lion API for comprehensive analysis")
             
             client = get_sea_lion_client()
+
+            # Only send the sampling limits the caller set, leaving provider defaults otherwise
+            sampling = {}
+            if max_tokens is not None:
+                sampling["max_tokens"] = max_tokens
+            if temperature is not None:
+                sampling["temperature"] = temperature
             
-            completion = client.chat.completions.create(
+            completion = await client.chat.completions.create(
                 model=model,
                 messages=[
                     {
@@ -101,6 +113,7 @@ async def call_sea_lion_llm(
                         "no-cache": not cache
                     }
                 },
+                **sampling,
             )
             
             logger.info("✅ Sea-Lion API comprehensive analysis successful")
@@ -205,7 +218,7 @@ async def call_sea_lion_v4_llm(
             
             client = get_sea_lion_v4_client()
             
-            completion = client.chat.completions.create(
+            completion = await client.chat.completions.create(
                 model=model,
                 messages=[
                     {
@@ -343,7 +356,9 @@ async def call_sagemaker_sealion_llm(
                 "top_p": top_p,
             }
             
-            response = predictor.predict(payload)
+            # predict() is a blocking boto3 call; run it in a worker thread so
+            # concurrent analyses overlap instead of stalling the event loop
+            response = await asyncio.to_thread(predictor.predict, payload)
             
             logger.info("✅ SageMaker SeaLion v4 endpoint analysis successful")
             return response
@@ -477,7 +492,9 @@ async def call_sagemaker_sealion_multimodal_llm(
                 "top_p": top_p,
             }
             
-            response = predictor.predict(payload)
+            # predict() is a blocking boto3 call; run it in a worker thread so
+            # concurrent analyses overlap instead of stalling the event loop
+            response = await asyncio.to_thread(predictor.predict, payload)
             
             logger.info("✅ SageMaker SeaLion v4 multimodal endpoint analysis successful")
             return response
@@ -543,57 +560,65 @@ async def call_sagemaker_sealion_multimodal_llm(
 # 2. RESPONSE PARSING FUNCTION
 # =============================================================================
 
-def parse_sealion_json(resp):
+# Reused decoder for scanning LLM output for an embedded JSON object
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(content: str, source: str):
     """
-    Extract and parse JSON from Sea Lion LLM responses.
+    Parse the first JSON object in LLM output text.
 
-    This function handles multiple JSON formats that the LLM might return:
-    1. Plain JSON: {"key": "value"}
-    2. Fenced JSON blocks: ```json {"key": "value"} ```
-    3. Balanced braces: Extracts first complete {...} object
+    Plain JSON is parsed directly with orjson. Otherwise each "{" (the first one inside a
+    ```json fence, or the first balanced object in prose) is handed to the C
+    decoder, which finds where the object ends in the same pass that parses it
+    and handles braces inside string values.
 
     Args:
-        resp: The Sea Lion LLM completion response object
+        content: LLM completion text
+        source: Name of the model endpoint, for error messages
 
     Returns:
         dict: Parsed JSON object
 
     Raises:
-        ValueError: If no valid JSON object can be found in the response
+        ValueError: If no valid JSON object can be found in the text
     """
-    # 1) get the text
-    content = resp.choices[0].message.content
-
-    # 2) try plain JSON first
     try:
-        return json.loads(content)
-    except Exception:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
         pass
 
-    # 3) try fenced ```json ... ``` block
-    m = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", content, flags=re.S)
-    if m:
-        return json.loads(m.group(1))
-
-    # 4) fall back: extract first balanced {...}
     start = content.find("{")
     if start == -1:
-        raise ValueError("No JSON object found in LLM output")
+        raise ValueError(f"No JSON object found in {source} output")
 
-    depth = 0
-    end = None
-    for i, ch in enumerate(content[start:], start):
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-    if end is None:
-        raise ValueError("Unbalanced JSON braces in LLM output")
+    while start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(content, start)[0]
+        except ValueError:
+            start = content.find("{", start + 1)
+    raise ValueError(f"No valid JSON object found in {source} output")
 
-    return json.loads(content[start:end])
+
+def parse_sealion_json(resp):
+    """
+    Extract and parse JSON from Sea Lion LLM responses.
+
+    This function handles multiple JSON formats that the LLM might return:
+    1. Plain JSON: {"key": "value"}
+    2. Fenced JSON blocks: ```json {"key": "value"} ```
+    3. JSON embedded in prose: first complete {...} object
+
+    Args:
+        resp: The Sea Lion LLM completion response object
+
+    Returns:
+        dict: Parsed JSON object
+
+    Raises:
+        ValueError: If no valid JSON object can be found in the response
+    """
+    return _extract_json_object(resp.choices[0].message.content, "LLM")
 
 
 def parse_sagemaker_json(resp):
@@ -612,36 +637,4 @@ def parse_sagemaker_json(resp):
     Raises:
         ValueError: If no valid JSON object can be found in the response
     """
-    # 1) get the text from SageMaker response format
-    content = resp['choices'][0]['message']['content']
-
-    # 2) try plain JSON first
-    try:
-        return json.loads(content)
-    except Exception:
-        pass
-
-    # 3) try fenced ```json ... ``` block
-    m = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", content, flags=re.S)
-    if m:
-        return json.loads(m.group(1))
-
-    # 4) fall back: extract first balanced {...}
-    start = content.find("{")
-    if start == -1:
-        raise ValueError("No JSON object found in SageMaker LLM output")
-
-    depth = 0
-    end = None
-    for i, ch in enumerate(content[start:], start):
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                end = i + 1
-                break
-    if end is None:
-        raise ValueError("Unbalanced JSON braces in SageMaker LLM output")
-
-    return json.loads(content[start:end])
+    return _extract_json_object(resp['choices'][0]['message']['content'], "SageMaker LLM")
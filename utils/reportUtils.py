@@ -16,9 +16,9 @@ from datetime import datetime
 import uuid
 import logging
 
-from setting import Setting
+from setting import get_settings
 
-config = Setting()
+config = get_settings()
 logger = logging.getLogger(__name__)
 
 class EmailReportSender:
@@ -28,6 +28,8 @@ key = generate_s3_key(content_hash, 0)
 """
 
 import boto3
+from botocore.config import Config as BotoConfig
+from functools import lru_cache
 import aiohttp
 import asyncio
 from datetime import datetime
@@ -35,23 +37,34 @@ from typing import Optional, Tuple
 from PIL import Image
 import io
 import uuid
-from setting import Setting
+from setting import get_settings
+from utils.constant import AWS_MAX_POOL_CONNECTIONS
 
 # Configuration
-config = Setting()
+config = get_settings()
 S3_BUCKET_NAME = "mai-scam-detected-images"
 S3_REGION = "us-east-1"
 MAX_IMAGE_SIZE_MB = 10
 ALLOWED_FORMATS = ['JPEG', 'PNG', 'WEBP']
+# PIL format -> (file extension, Content-Type) for stored images
+IMAGE_FORMAT_TYPES = {
+    'JPEG': ("jpg", "image/jpeg"),
+    'PNG': ("png", "image/png"),
+    'WEBP': ("webp", "image/webp"),
+}
+DEFAULT_IMAGE_TYPE = IMAGE_FORMAT_TYPES['JPEG']
 
 
 # =============================================================================
 # 1. S3 CLIENT FUNCTION
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_s3_client():
     """
     Get S3 client with credentials from environment variables.
+
+    Created once per process, so every call reuses its keep-alive connection pool.
     
     The client automatically uses AWS credentials from environment:
     - AWS_ACCESS_KEY_ID (required)
@@ -78,7 +91,7 @@ def get_s3_client():
     if aws_session_token:
         aws_config['aws_session_token'] = aws_session_token
     
-    return boto3.client('s3', **aws_config)
+    return boto3.client('s3', config=BotoConfig(max_pool_connections=AWS_MAX_POOL_CONNECTIONS), **aws_config)
 
 
 # =============================================================================
@@ -174,13 +187,12 @@ async def upload_image_to_s3(image_data: bytes, content_hash: str, image_index:
         s3_url = await upload_image_to_s3(image_bytes, "abc123def456", 0)
     """
     try:
-        # Determine file format and extension
+        # Determine file extension and content type from the image format
         try:
             with Image.open(io.BytesIO(image_data)) as img:
-                format_lower = img.format.lower()
-                extension = "jpg" if format_lower == "jpeg" else format_lower
+                extension, content_type = IMAGE_FORMAT_TYPES.get(img.format, DEFAULT_IMAGE_TYPE)
         except Exception:
-            extension = "jpg"  # Default fallback
+            extension, content_type = DEFAULT_IMAGE_TYPE  # Default fallback
             
         # Generate S3 key
         s3_key = generate_s3_key(content_hash, image_index, extension)
@@ -188,12 +200,13 @@ async def upload_image_to_s3(image_data: bytes, content_hash: str, image_index:
         # Get S3 client
         s3_client = get_s3_client()
         
-        # Upload to S3
-        s3_client.put_object(
+        # Upload to S3 in a worker thread so the event loop keeps serving
+        await asyncio.to_thread(
+            s3_client.put_object,
             Bucket=S3_BUCKET_NAME,
             Key=s3_key,
             Body=image_data,
-            ContentType=f"image/{extension}",
+            ContentType=content_type,
             CacheControl="public, max-age=31536000",  # 1 year cache
             Metadata={
                 'content_hash': content_hash,
@@ -232,7 +245,7 @@ async def delete_image_from_s3(s3_key: str) -> bool:
     """
     try:
         s3_client = get_s3_client()
-        s3_client.delete_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+        await asyncio.to_thread(s3_client.delete_object, Bucket=S3_BUCKET_NAME, Key=s3_key)
         print(f"Successfully deleted image from S3: {s3_key}")
         return True
         
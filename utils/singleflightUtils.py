@@ -0,0 +1,89 @@
+"""
+Single-Flight Utilities for MAI Scam Detection System
+
+This module coalesces concurrent identical analyses: requests for the same
+content that miss the result cache while an analysis is already running join
+that analysis instead of paying for another LLM call. Only the request that
+started a run is told it owns the result, so the result is saved exactly once.
+
+TABLE OF CONTENTS:
+==================
+
+EXPORTED FUNCTIONS:
+------------------
+1. run_singleflight
+
+USAGE EXAMPLES:
+--------------
+# Share one analysis between concurrent requests for the same content
+analysis, is_owner = await run_singleflight(
+    f"v2:{content_hash}:{target_language}",
+    lambda: run_email_analysis(...)
+)
+if is_owner:
+    background_tasks.add_task(save_email_detection_result, ...)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+# Analyses currently running, keyed by caller-chosen key (content type, model version,
+# content hash and target language)
+_inflight_analyses: Dict[str, asyncio.Future] = {}
+
+# How long a finished analysis stays joinable, covering the background DynamoDB save
+SINGLEFLIGHT_GRACE_SECONDS = 5
+
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def _release_singleflight(key: str, task: asyncio.Future) -> None:
+    """
+    Drop a finished analysis, keeping successes joinable until their background save lands.
+
+    Args:
+        key: Single-flight key the task was registered under
+        task: Finished analysis task
+    """
+    def release():
+        if _inflight_analyses.get(key) is task:
+            del _inflight_analyses[key]
+
+    if task.cancelled() or task.exception() is not None:
+        release()
+    else:
+        asyncio.get_running_loop().call_later(SINGLEFLIGHT_GRACE_SECONDS, release)
+
+
+# =============================================================================
+# 1. SINGLE-FLIGHT FUNCTION
+# =============================================================================
+
+async def run_singleflight(key: str, analysis_factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+    """
+    Share one in-flight analysis between concurrent requests with the same key.
+
+    The analysis is shielded, so one client disconnecting does not cancel it
+    for the other requests waiting on it.
+
+    Args:
+        key: Identifies the analysis; requests with equal keys share one run
+        analysis_factory: Starts the analysis when no run is in flight
+
+    Returns:
+        tuple: (analysis result, whether this request started the run); only the
+        owner should save the result, joiners reuse it as-is
+
+    Example:
+        analysis, is_owner = await run_singleflight(f"v1:{content_hash}:{target_language}",
+                                                    lambda: run_email_analysis(...))
+    """
+    task = _inflight_analyses.get(key)
+    is_owner = task is None
+    if is_owner:
+        task = asyncio.ensure_future(analysis_factory())
+        _inflight_analyses[key] = task
+        task.add_done_callback(lambda done: _release_singleflight(key, done))
+    return await asyncio.shield(task), is_owner
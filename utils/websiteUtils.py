@@ -49,8 +49,9 @@ from utils.constant import (
     LANGUAGES, URL_PATTERN, EMAIL_PATTERN, PHONE_PATTERN,
     SUSPICIOUS_TLDS, URL_SHORTENERS, KNOWN_BRANDS, WEBSITE_KEYWORDS,
     MIN_PHONE_LENGTH, MAX_HYPHENS_IN_DOMAIN,
-    RANDOM_SUBDOMAIN_PATTERN, SUSPICIOUS_PATH_KEYWORDS
+    RANDOM_SUBDOMAIN_PATTERN, SUSPICIOUS_PATH_KEYWORDS, LANGUAGE_DETECTION_MAX_TOKENS
 )
+from utils.languageUtils import detect_language_by_script
 from utils.llmUtils import parse_sealion_json, call_sea_lion_llm, call_sea_lion_v4_llm, call_sagemaker_sealion_llm, parse_sagemaker_json
 from prompts.websitePrompts import prompts
 import re
@@ -58,6 +59,9 @@ import json
 import logging
 from urllib.parse import urlparse
 
+# Language list substituted into every prompt, joined once at import
+_AVAILABLE_LANGUAGES = ", ".join(LANGUAGES)
+
 
 # =============================================================================
 # HELPER FUNCTIONS FOR SIGNAL EXTRACTION
@@ -201,6 +205,7 @@ async def detect_language(content: str) -> str:
 
     This function uses the Sea Lion LLM to identify the primary language
     of the website content from a predefined list of supported languages.
+    Content whose script identifies the language is resolved locally first.
 
     Args:
         content: The website content to analyze
@@ -212,12 +217,21 @@ async def detect_language(content: str) -> str:
         language = await detect_language("Welcome to our secure banking portal")
         # Returns: "en"
     """
+    # Thai, Chinese and Vietnamese are identified from the script alone, without an LLM call
+    language = detect_language_by_script(content)
+    if language:
+        return language
+
     prompt = prompts["detectLanguage"].format(
-        available_languages=str(", ".join(LANGUAGES)),
+        available_languages=_AVAILABLE_LANGUAGES,
         content=content,
     )
 
-    completion = await call_sea_lion_llm(prompt=prompt)
+    completion = await call_sea_lion_llm(
+        prompt=prompt,
+        max_tokens=LANGUAGE_DETECTION_MAX_TOKENS,
+        temperature=0
+    )
     json_response = parse_sealion_json(completion)
 
     return json_response["base_language"]
@@ -486,7 +500,7 @@ async def analyze_website_comprehensive(
         title=title or "",
         content=content or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to LLM (V1)
@@ -562,7 +576,7 @@ async def analyze_website_comprehensive_v2(
         title=title or "",
         content=content or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to LLM (V2)
@@ -635,7 +649,7 @@ async def analyze_website_comprehensive_sagemaker(
         title=title or "",
         content=content or "",
         aux_signals=aux_signals,
-        available_languages=", ".join(LANGUAGES)
+        available_languages=_AVAILABLE_LANGUAGES
     )
 
     # Debug: Log the complete prompt being sent to SageMaker LLM